@@ -3,14 +3,21 @@ The __init__.py files are required to make Python treat the directories as conta
 packages; this is done to prevent directories with a common name, such as string,
 from unintentionally hiding valid modules that occur later on the module search path
 """
-from .entry import Entry
-from .asset import Asset
-from .contenttype import ContentType
-from .endpoint import Endpoint
-from .https_connection import HTTPSConnection
-from contentstack.stack import Stack
-from .utility import Utils
-from .region_refresh import refresh_regions
+import importlib
+
+# Public names and the submodules defining them. They are imported on first
+# access (PEP 562), so "import contentstack" does not load requests, urllib3
+# or urllib.request until a Stack actually sends a request.
+_LAZY_ATTRIBUTES = {
+    'Entry': 'contentstack.entry',
+    'Asset': 'contentstack.asset',
+    'ContentType': 'contentstack.contenttype',
+    'Endpoint': 'contentstack.endpoint',
+    'HTTPSConnection': 'contentstack.https_connection',
+    'Stack': 'contentstack.stack',
+    'Utils': 'contentstack.utility',
+    'refresh_regions': 'contentstack.region_refresh',
+}
 
 __all__ = (
 "Entry",
@@ -37,8 +44,22 @@ def get_contentstack_endpoint(region='us', service='', omit_https=False):
     :param omit_https: When True, strips 'https://' from the returned URL(s).
     :returns: str when service is provided, dict[str,str] otherwise.
     """
+    from contentstack.endpoint import Endpoint
     return Endpoint.get_contentstack_endpoint(region, service, omit_https)
 
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module 'contentstack' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 __title__ = 'contentstack-delivery-python'
 __author__ = 'contentstack'
 __status__ = 'debug'
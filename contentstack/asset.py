@@ -5,9 +5,19 @@ These files can be attached and used in multiple entries.
 """
 
 import logging
+import os
+import shutil
 from urllib import parse
+
+
+from contentstack.controller import RequestError
 from contentstack.error_messages import ErrorMessages
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+PART_SUFFIX = '.part'
+# holds the ETag/Last-Modified of the response a '.part' file was started from
+VALIDATOR_SUFFIX = '.part.validator'
+
 class Asset:
     r"""`Asset` refer to all the media files (images, videos, PDFs, audio files, and so on)."""
 
@@ -160,3 +170,166 @@ class Asset:
         """
         url = f'{self.base_url}?{parse.urlencode(self.asset_params)}'
         return self.http_instance.get(url)
+
+    def download(self, destination, chunk_size=DOWNLOAD_CHUNK_SIZE, asset=None, max_resumes=3,
+                 cache=None):
+        r"""Streams the asset file to disk or to a file object with bounded
+        memory, through the stack's connection pool and retry strategy.
+        Downloads to a path are written to '<path>.part' and renamed once
+        complete; a '.part' left by an interrupted download is resumed with
+        an HTTP Range request, as is a connection dropped mid-stream. The
+        Range is conditional (If-Range) on the ETag or Last-Modified the
+        '.part' was started with, kept in '<path>.part.validator', so a file
+        changed in between is downloaded again from the start.
+        :param destination: file path, or a binary file object to write to
+        :param chunk_size: bytes read and written at a time
+        :param asset: (optional) asset metadata (the 'asset' of fetch()), saves the fetch
+        :param max_resumes: times a dropped connection is resumed before giving up
+        :param cache: (optional) AssetCache; the file is served from it when
+        the asset version is cached, and stored in it otherwise
+        :return: dict with uid, path (None for file objects), size and
+        downloaded, the bytes transferred by this call
+        -----------------------------
+        [Example]:
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> result = stack.asset(uid='asset_uid').download('/tmp/banner.png')
+        ------------------------------
+        """
+        if cache is not None:
+            # the cache fetches the metadata itself, and only on a miss
+            return self._copy_from_cache(cache, destination, asset, chunk_size)
+        if asset is None:
+            asset = self.fetch().get('asset') or {}
+        url = asset.get('url')
+        if not url:
+            raise KeyError(ErrorMessages.MISSING_ASSET_URL.format(uid=self.uid))
+        file_size = asset.get('file_size')
+        expected = int(file_size) if file_size not in (None, '') else None
+        if hasattr(destination, 'write'):
+            size, downloaded = self._stream_to(url, destination, 0, expected, chunk_size, max_resumes)
+            self._check_size(expected, size)
+            return {'uid': self.uid, 'path': None, 'size': size, 'downloaded': downloaded}
+        part = f'{destination}{PART_SUFFIX}'
+        validator_file = f'{destination}{VALIDATOR_SUFFIX}'
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        validator = None
+        if offset and os.path.exists(validator_file):
+            with open(validator_file, encoding='utf-8') as file:
+                validator = file.read() or None
+
+        def remember(value):
+            if value is None:
+                _remove(validator_file)
+                return
+            with open(validator_file, 'w', encoding='utf-8') as file:
+                file.write(value)
+
+        with open(part, 'ab') as file:
+            size, downloaded = self._stream_to(url, file, offset, expected, chunk_size, max_resumes,
+                                               validator, remember)
+        if expected is not None and size > expected:
+            _remove(part)  # not resumable, the next call starts over
+            _remove(validator_file)
+        self._check_size(expected, size)
+        os.replace(part, destination)
+        _remove(validator_file)
+        return {'uid': self.uid, 'path': destination, 'size': size, 'downloaded': downloaded}
+
+    def _copy_from_cache(self, cache, destination, asset, chunk_size):
+        source, downloaded = cache._open(self, asset, chunk_size=chunk_size)
+        with source:
+            size = os.fstat(source.fileno()).st_size
+            if hasattr(destination, 'write'):
+                shutil.copyfileobj(source, destination, chunk_size)
+                path = None
+            else:
+                with open(destination, 'wb') as file:
+                    shutil.copyfileobj(source, file, chunk_size)
+                path = destination
+        return {'uid': self.uid, 'path': path, 'size': size, 'downloaded': downloaded}
+
+    def _check_size(self, expected, size):
+        if expected is not None and size != expected:
+            raise ValueError(ErrorMessages.ASSET_SIZE_MISMATCH.format(
+                expected=expected, uid=self.uid, received=size))
+
+    def _stream_to(self, url, file, offset, expected, chunk_size, max_resumes, validator=None,
+                   remember=None):
+        """Writes url to file from byte offset on, resuming dropped
+        connections. Ranges are sent with If-Range and the validator
+        (ETag or Last-Modified) of the response the bytes came from, so a
+        file changed in between is sent whole and written from zero; bytes
+        without a validator are never resumed. remember(validator) is called
+        when a new download starts. Returns (size written in total, bytes
+        transferred)"""
+        from requests.exceptions import ChunkedEncodingError, ConnectionError as RequestsConnectionError
+        start = file.tell() - offset
+        received, downloaded, resumes = offset, 0, 0
+
+        def restart():
+            file.seek(start)
+            file.truncate()
+            return 0
+
+        if received and validator is None:
+            received = restart()  # cannot tell whether the bytes are still current
+        # a resumed file is checked with the server even when it looks complete
+        checked = not received
+        while not checked or expected is None or received < expected:
+            checked = True
+            # identity encoding keeps the bytes on disk equal to file_size
+            headers = {'Accept-Encoding': 'identity'}
+            if received:
+                headers['Range'] = f'bytes={received}-'
+                headers['If-Range'] = validator
+            response = self.http_instance.stream(url, headers=headers)
+            try:
+                if response.status_code == 416 and received:
+                    break  # nothing left past the bytes already written
+                if response.status_code not in (200, 206):
+                    raise RequestError({
+                        'error': ErrorMessages.ASSET_DOWNLOAD_FAILED.format(
+                            url=url, status=response.status_code),
+                        'error_code': response.status_code,
+                        'error_message': response.reason})
+                if response.status_code == 200:
+                    # a new download, or the file changed or the Range was
+                    # ignored: write the whole body from zero
+                    if received:
+                        received = restart()
+                    validator = _validator(response)
+                    if remember is not None:
+                        remember(validator)
+                try:
+                    for chunk in response.iter_content(chunk_size):
+                        file.write(chunk)
+                        received += len(chunk)
+                        downloaded += len(chunk)
+                except (ChunkedEncodingError, RequestsConnectionError):
+                    resumes += 1
+                    if resumes > max_resumes:
+                        raise
+                    if validator is None:
+                        received = restart()
+                    self.logger.warning('Resuming asset %s download at byte %d', self.uid, received)
+                    continue
+            finally:
+                response.close()
+            break
+        return received, downloaded
+
+
+def _validator(response):
+    """The strong validator of a response usable in If-Range, None if any"""
+    etag = response.headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.headers.get('Last-Modified')
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,265 @@
+"""
+On-disk cache of asset files.
+
+Files are stored once per asset uid and version, so workers that keep
+processing the same assets open a local file instead of downloading it
+again. Writes are atomic (download to a temporary file, then os.replace)
+and each file is filled under an exclusive lock file, removed once the file
+is in place, so several processes can share one cache directory. The least
+recently used files are evicted once the cache grows past max_bytes.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: files are only locked between threads
+    fcntl = None
+
+LOCK_SUFFIX = '.lock'
+PART_SUFFIX = '.part'
+# times open() looks the file up again when it is evicted meanwhile
+OPEN_ATTEMPTS = 3
+
+
+class AssetCache:
+    """
+    Size bounded, LRU evicted cache of asset files keyed by uid and version.
+
+    Example::
+
+        >>> import contentstack
+        >>> from contentstack.asset_cache import AssetCache
+        >>> cache = AssetCache('/var/cache/contentstack-assets', max_bytes=5 * 1024 ** 3)
+        >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+        >>> with cache.open(stack.asset('asset_uid')) as file:
+        ...     data = file.read()
+    """
+
+    def __init__(self, directory, max_bytes=1024 ** 3, logger=None):
+        """
+        :param directory: cache directory, created if missing
+        :param max_bytes: total size of cached files kept on disk
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.logger = logger or logging.getLogger(__name__)
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        # bytes on disk, counted once then kept up to date by this process;
+        # evict() recounts, which picks up the files of other processes
+        self._total = None
+        self._total_guard = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _shard(self, uid):
+        return os.path.join(self.directory, hashlib.sha1(uid.encode('utf-8')).hexdigest()[:2])
+
+    def _file(self, uid, version):
+        return os.path.join(self._shard(uid), f'{uid}_{version}')
+
+    def path(self, uid, version):
+        """
+        Returns the cached file of the asset version, None when not cached.
+        A hit marks the file as recently used.
+        :param uid: asset uid
+        :param version: asset _version
+        """
+        path = self._file(uid, version)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def latest(self, uid):
+        """
+        Returns the cached file of the newest cached version of the asset,
+        None when no version is cached. A hit marks the file as recently used.
+        :param uid: asset uid
+        """
+        prefix = f'{uid}_'
+        try:
+            names = os.listdir(self._shard(uid))
+        except FileNotFoundError:
+            return None
+        versions = [name[len(prefix):] for name in names
+                    if name.startswith(prefix) and not name.endswith(LOCK_SUFFIX) and PART_SUFFIX not in name]
+        for version in sorted(versions, key=lambda v: (len(v), v), reverse=True):
+            path = self.path(uid, version)
+            if path is not None:
+                return path
+        return None
+
+    def store(self, asset, meta=None, chunk_size=1024 * 1024, refresh=False):
+        """
+        Makes sure the asset file is cached, downloading it when needed.
+        Without meta, a cached version of the asset is used as is; the
+        metadata is only fetched on a miss or with refresh=True, to check
+        that the cached version is still the current one.
+        :param asset: contentstack.asset.Asset
+        :param meta: (optional) asset metadata ('asset' of Asset.fetch())
+        :param chunk_size: bytes read and written at a time
+        :param refresh: (optional) fetch the metadata even on a hit
+        :return: (path of the cached file, bytes downloaded)
+        """
+        if meta is None and not refresh:
+            cached = self.latest(asset.uid)
+            if cached is not None:
+                return cached, 0
+        if meta is None:
+            meta = asset.fetch().get('asset') or {}
+        version = meta.get('_version')
+        cached = self.path(asset.uid, version)
+        if cached is not None:
+            return cached, 0
+        path = self._file(asset.uid, version)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._locked(path, remove=True):
+            # another worker may have filled it while we waited
+            if os.path.exists(path):
+                return path, 0
+            result = asset.download(path, chunk_size=chunk_size, asset=meta)
+        self._grow(result['size'])
+        return path, result['downloaded']
+
+    def open(self, asset, meta=None, refresh=False):
+        """
+        Opens the cached asset file for reading, downloading it on a miss.
+        A file evicted by another process before it is opened counts as a miss.
+        :param asset: contentstack.asset.Asset
+        :param meta: (optional) asset metadata
+        :param refresh: (optional) check the cached version, see store()
+        :return: binary file object
+        """
+        file, _ = self._open(asset, meta, refresh=refresh)
+        return file
+
+    def _open(self, asset, meta=None, chunk_size=1024 * 1024, refresh=False):
+        """Returns (open file, bytes downloaded)"""
+        for attempt in range(OPEN_ATTEMPTS):
+            path, downloaded = self.store(asset, meta, chunk_size=chunk_size, refresh=refresh)
+            try:
+                # once open, the file stays readable even if it is evicted
+                return open(path, 'rb'), downloaded
+            except FileNotFoundError:
+                if attempt == OPEN_ATTEMPTS - 1:
+                    raise
+                self.logger.debug('Cached asset %s was evicted before it was opened', asset.uid)
+
+    def evict(self):
+        """
+        Removes the least recently used files until the cache fits max_bytes,
+        along with the lock and partial files no download is using anymore
+        """
+        with self._locked(os.path.join(self.directory, 'evict')):
+            files, total = [], 0
+            for shard in os.scandir(self.directory):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    if entry.name.endswith(LOCK_SUFFIX):
+                        self._remove_orphan(entry.path[:-len(LOCK_SUFFIX)], None)
+                        continue
+                    if PART_SUFFIX in entry.name:
+                        # '<entry>.part' and the '<entry>.part.validator' next to it
+                        name = entry.name[:entry.name.index(PART_SUFFIX)]
+                        self._remove_orphan(os.path.join(shard.path, name), entry.path)
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+            if total > self.max_bytes:
+                for _, size, path in sorted(files):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        continue
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+            with self._total_guard:
+                self._total = total
+
+    def _grow(self, size):
+        """Counts a newly cached file, evicting when the cache is full"""
+        with self._total_guard:
+            counted = self._total is not None
+            if counted:
+                self._total += size
+            full = counted and self._total > self.max_bytes
+        if full or not counted:
+            # the first call counts the files already on disk
+            self.evict()
+
+    def _remove_orphan(self, path, part):
+        """Removes the partial file and lock file of an entry nobody is filling"""
+        lock = self._locked(path, remove=True)
+        if not lock.acquire(blocking=False):
+            return  # being downloaded
+        try:
+            if part is not None:
+                try:
+                    os.remove(part)
+                except FileNotFoundError:
+                    pass
+        finally:
+            lock.release()
+
+    def _locked(self, path, remove=False):
+        if fcntl is not None:
+            return _FileLock(f'{path}{LOCK_SUFFIX}', remove=remove)
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+
+class _FileLock:
+    """Exclusive flock on a lock file. Each holder opens its own file
+    description, so it excludes other threads as well as other processes.
+    With remove, the lock file is deleted on release; a waiter that then
+    finds it locked a deleted file locks the path again."""
+
+    def __init__(self, path, remove=False):
+        self.path = path
+        self.remove = remove
+        self.file = None
+
+    def acquire(self, blocking=True):
+        while True:
+            file = open(self.path, 'a')
+            try:
+                fcntl.flock(file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                file.close()
+                return False
+            try:
+                current = os.stat(self.path).st_ino == os.fstat(file.fileno()).st_ino
+            except FileNotFoundError:
+                current = False
+            if current:
+                self.file = file
+                return True
+            file.close()
+
+    def release(self):
+        if self.remove:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+        fcntl.flock(self.file, fcntl.LOCK_UN)
+        self.file.close()
+        self.file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
@@ -0,0 +1,283 @@
+"""
+Local index of asset metadata.
+
+Audits that repeatedly filter assets by mime type, size, tags or folder can
+load the metadata once (from AssetQuery pages or sync responses) and answer
+the same where() conditions locally. content_type, tags and parent_uid have
+hash indexes and file_size a sorted index; other fields are filtered by a
+scan of the candidates. The index can be persisted to a SQLite file.
+"""
+
+import bisect
+import json
+import re
+import sqlite3
+import threading
+
+from contentstack.basequery import QueryOperation
+
+INDEXED_FIELDS = ('content_type', 'tags', 'parent_uid')
+SIZE_FIELD = 'file_size'
+REMOVED_ITEM_TYPES = ('asset_unpublished', 'asset_deleted')
+
+
+def _field(asset, field_uid):
+    value = asset
+    for part in field_uid.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    if field_uid == SIZE_FIELD and value is not None:
+        return int(value)
+    return value
+
+
+def _matches(value, operation, expected):
+    """Evaluates one where() condition; list values match when any item does"""
+    if operation is QueryOperation.EXISTS:
+        return (value is not None) == bool(expected)
+    values = value if isinstance(value, list) else [value]
+    if operation is QueryOperation.EQUALS:
+        return expected in values
+    if operation is QueryOperation.NOT_EQUALS:
+        return expected not in values
+    if operation is QueryOperation.INCLUDES:
+        return any(item in expected for item in values)
+    if operation is QueryOperation.EXCLUDES:
+        return not any(item in expected for item in values)
+    if operation is QueryOperation.MATCHES:
+        return any(isinstance(item, str) and re.search(expected, item) for item in values)
+    comparisons = {
+        QueryOperation.IS_LESS_THAN: lambda item: item < expected,
+        QueryOperation.IS_LESS_THAN_OR_EQUAL: lambda item: item <= expected,
+        QueryOperation.IS_GREATER_THAN: lambda item: item > expected,
+        QueryOperation.IS_GREATER_THAN_OR_EQUAL: lambda item: item >= expected,
+    }
+    compare = comparisons[operation]
+    return any(item is not None and compare(item) for item in values)
+
+
+class AssetIndex:
+    """
+    In-memory asset metadata index with an optional SQLite copy.
+
+    Example::
+
+        >>> import contentstack
+        >>> from contentstack.asset_index import AssetIndex
+        >>> from contentstack.basequery import QueryOperation
+        >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+        >>> index = AssetIndex('/var/lib/audit/assets.db').load(stack.asset_query())
+        >>> large_pngs = index.where('content_type', QueryOperation.EQUALS, 'image/png') \\
+        ...     .where('file_size', QueryOperation.IS_GREATER_THAN, 5_000_000).find()
+    """
+
+    def __init__(self, path=None):
+        """
+        :param path: (optional) SQLite file the index is persisted to and
+        loaded from. In memory only when None
+        """
+        self._assets = {}
+        self._indexes = {field: {} for field in INDEXED_FIELDS}
+        self._sizes = []
+        self._size_keys = []
+        self._sizes_dirty = False
+        self._lock = threading.RLock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute('CREATE TABLE IF NOT EXISTS assets (uid TEXT PRIMARY KEY, data TEXT NOT NULL)')
+            for (data,) in self._db.execute('SELECT data FROM assets'):
+                self._add(json.loads(data))
+
+    def load(self, asset_query, page_size=100):
+        """
+        Indexes every asset returned by asset_query
+        :param asset_query: contentstack.assetquery.AssetQuery
+        :return: AssetIndex, so we can chain the call
+        """
+        batch = []
+        for asset in asset_query.iter_assets(page_size):
+            batch.append(asset)
+            if len(batch) >= page_size:
+                self.ingest({'assets': batch})
+                batch = []
+        if batch:
+            self.ingest({'assets': batch})
+        return self
+
+    def ingest(self, response):
+        """
+        Indexes the assets of an AssetQuery/Asset response ('assets' or
+        'asset') or applies the asset items of a sync response ('items')
+        :param response: decoded response dict
+        :return: AssetIndex, so we can chain the call
+        """
+        added, removed = [], []
+        if isinstance(response.get('asset'), dict):
+            added.append(response['asset'])
+        added.extend(asset for asset in response.get('assets') or [] if isinstance(asset, dict))
+        for item in response.get('items') or []:
+            item_type = item.get('type', '')
+            data = item.get('data') or {}
+            if not item_type.startswith('asset_') or 'uid' not in data:
+                continue
+            if item_type in REMOVED_ITEM_TYPES:
+                removed.append(data['uid'])
+            else:
+                added.append(data)
+        with self._lock:
+            for asset in added:
+                self._add(asset)
+            for uid in removed:
+                self._remove(uid)
+            if self._db is not None:
+                self._db.executemany('INSERT OR REPLACE INTO assets VALUES (?, ?)',
+                                     [(asset['uid'], json.dumps(asset)) for asset in added])
+                self._db.executemany('DELETE FROM assets WHERE uid = ?', [(uid,) for uid in removed])
+                self._db.commit()
+        return self
+
+    def add(self, asset):
+        """Indexes one asset, replacing a previous version"""
+        return self.ingest({'asset': asset})
+
+    def remove(self, uid):
+        """Drops an asset from the index"""
+        return self.ingest({'items': [{'type': 'asset_deleted', 'data': {'uid': uid}}]})
+
+    def get(self, uid):
+        """Returns the indexed asset or None"""
+        return self._assets.get(uid)
+
+    def where(self, field_uid, query_operation, fields=None):
+        """
+        Starts a local query, see AssetIndexQuery.where()
+        :return: AssetIndexQuery
+        """
+        return AssetIndexQuery(self).where(field_uid, query_operation, fields)
+
+    def close(self):
+        """Closes the SQLite file, if any"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __len__(self):
+        return len(self._assets)
+
+    def _add(self, asset):
+        uid = asset['uid']
+        if uid in self._assets:
+            self._remove(uid)
+        self._assets[uid] = asset
+        for field, index in self._indexes.items():
+            value = asset.get(field)
+            for key in value if isinstance(value, list) else [value]:
+                if key is not None:
+                    index.setdefault(key, set()).add(uid)
+        self._sizes_dirty = True
+
+    def _remove(self, uid):
+        asset = self._assets.pop(uid, None)
+        if asset is None:
+            return
+        for field, index in self._indexes.items():
+            value = asset.get(field)
+            for key in value if isinstance(value, list) else [value]:
+                uids = index.get(key)
+                if uids is not None:
+                    uids.discard(uid)
+                    if not uids:
+                        del index[key]
+        self._sizes_dirty = True
+
+    def _candidates(self, field_uid, operation, expected):
+        """
+        uids matching one condition through an index, None when not indexed.
+        Hash index sets are returned as is, not copied: callers only read them
+        """
+        if field_uid in self._indexes:
+            index = self._indexes[field_uid]
+            if operation is QueryOperation.EQUALS:
+                return index.get(expected, frozenset())
+            if operation is QueryOperation.INCLUDES:
+                matched = [index[value] for value in expected if value in index]
+                return matched[0] if len(matched) == 1 else set().union(*matched)
+            return None
+        if field_uid != SIZE_FIELD:
+            return None
+        if self._sizes_dirty:
+            # rebuilt lazily: bulk loads would otherwise insort one by one
+            self._sizes = sorted((int(asset[SIZE_FIELD]), uid) for uid, asset in self._assets.items()
+                                 if asset.get(SIZE_FIELD) is not None)
+            self._size_keys = [size for size, _ in self._sizes]
+            self._sizes_dirty = False
+        sizes = self._size_keys
+        expected = int(expected) if not isinstance(expected, list) else expected
+        bounds = {
+            QueryOperation.EQUALS: lambda: (bisect.bisect_left(sizes, expected),
+                                            bisect.bisect_right(sizes, expected)),
+            QueryOperation.IS_LESS_THAN: lambda: (0, bisect.bisect_left(sizes, expected)),
+            QueryOperation.IS_LESS_THAN_OR_EQUAL: lambda: (0, bisect.bisect_right(sizes, expected)),
+            QueryOperation.IS_GREATER_THAN: lambda: (bisect.bisect_right(sizes, expected), len(sizes)),
+            QueryOperation.IS_GREATER_THAN_OR_EQUAL: lambda: (bisect.bisect_left(sizes, expected),
+                                                              len(sizes)),
+        }
+        if operation not in bounds:
+            return None
+        start, end = bounds[operation]()
+        return {uid for _, uid in self._sizes[start:end]}
+
+
+class AssetIndexQuery:
+    """
+    Conditions evaluated against an AssetIndex, written like BaseQuery.where()
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.conditions = []
+
+    def where(self, field_uid, query_operation: QueryOperation, fields=None):
+        """
+        Adds a condition, with the same operations as BaseQuery.where().
+        Dotted field uids (e.g. 'dimension.width') reach nested values.
+        :param field_uid: asset field uid
+        :param query_operation: QueryOperation
+        :param fields: value to compare with, a list for INCLUDES/EXCLUDES
+        :return: AssetIndexQuery, so we can chain the call
+        """
+        if None not in (field_uid, query_operation):
+            self.conditions.append((field_uid, query_operation, fields))
+        return self
+
+    def find(self):
+        """
+        :return: list of the matching assets
+        """
+        index = self.index
+        with index._lock:
+            matched, remaining = [], []
+            for field_uid, operation, expected in self.conditions:
+                uids = index._candidates(field_uid, operation, expected)
+                if uids is None:
+                    remaining.append((field_uid, operation, expected))
+                else:
+                    matched.append(uids)
+            candidates = None
+            if matched:
+                # intersect from the smallest set so the work is bounded by it
+                matched.sort(key=len)
+                candidates = matched[0].intersection(*matched[1:]) if len(matched) > 1 else matched[0]
+            assets = index._assets
+            pool = assets.values() if candidates is None else [assets[uid] for uid in candidates]
+            return [asset for asset in pool
+                    if all(_matches(_field(asset, field_uid), operation, expected)
+                           for field_uid, operation, expected in remaining)]
+
+    def count(self):
+        """
+        :return: number of matching assets
+        """
+        return len(self.find())
@@ -5,10 +5,18 @@ You can also specify the environment of which you wish to get the assets.
 
 import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+from contentstack.asset import Asset
 from contentstack.basequery import BaseQuery
+from contentstack.pagination import iter_pages
 from contentstack.utility import Utils
 
+MANIFEST_FILE = '.contentstack-assets.json'
+
 class AssetQuery(BaseQuery):
     """
     This call fetches the list of all the assets of a particular stack.
@@ -19,9 +27,6 @@ class AssetQuery(BaseQuery):
         self.http_instance = http_instance
         self.asset_query_params = {}
         self.base_url = f"{self.http_instance.endpoint}/assets"
-        if "environment" in self.http_instance.headers:
-            env = self.http_instance.headers["environment"]
-            self.base_url = f"{self.base_url}?environment={env}"
         self.logger = logger or logging.getLogger(__name__)
 
     def environment(self, environment):
@@ -203,7 +208,138 @@ class AssetQuery(BaseQuery):
             >>> result = stack.asset_query().find()
 
         """
+        return self.http_instance.get(self._url(self.asset_query_params))
+
+    def _url(self, asset_query_params):
+        # the environment is read when the request is made, so environment()
+        # called after stack.asset_query() applies to it
+        params = {}
+        if "environment" in self.http_instance.headers:
+            params["environment"] = self.http_instance.headers["environment"]
+        params.update(asset_query_params)
         if self.parameters is not None and len(self.parameters) > 0:
-            self.asset_query_params["query"] = self.parameters
-        url = Utils.get_complete_url(self.base_url, self.asset_query_params)
-        return self.http_instance.get(url)
+            params["query"] = self.parameters
+        return Utils.get_complete_url(self.base_url, params)
+
+    def iter_assets(self, page_size=100, fields=None, parallel=1):
+        r"""Yields every asset matching the query, one at a time, fetching
+        pages of page_size as they are consumed so memory stays flat however
+        many assets the stack holds.
+
+        :param page_size: assets fetched per request, at most 100
+        :param fields: (optional) list of asset fields to return, e.g.
+        ['uid', 'filename', 'file_size']; sent as only[BASE][]
+        :param parallel: number of pages fetched at the same time. Above 1,
+        the first page asks for the total count and the following pages are
+        requested concurrently, `parallel` at a time, still yielded in order
+        :return: generator of asset dicts
+
+        -----------------------------
+        [Example]:
+
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> for asset in stack.asset_query().iter_assets(fields=['uid', 'file_size'], parallel=4):
+            ...     audit(asset)
+        ------------------------------
+        """
+        for page in self._iter_pages(page_size, fields, parallel):
+            yield from page
+
+    def _iter_pages(self, page_size=100, fields=None, parallel=1):
+        """Yields the pages of assets (lists) as they are consumed"""
+        params = dict(self.asset_query_params)
+        params.pop('limit', None)
+        if fields:
+            params['only[BASE][]'] = list(fields)
+        skip = int(params.pop('skip', 0))
+
+        def fetch(page_skip, limit, include_count):
+            page_params = dict(params, limit=limit, skip=page_skip)
+            if include_count:
+                page_params['include_count'] = 'true'
+            return self.http_instance.get(self._url(page_params))
+
+        return iter_pages(fetch, 'assets', page_size, skip, parallel)
+
+    def download_all(self, dest_dir, concurrency=8, page_size=100, chunk_size=1024 * 1024):
+        r"""Mirrors every asset matching the query to dest_dir, as
+        dest_dir/<asset uid>/<filename>. Pages are fetched as the workers
+        need them and at most `concurrency` files are downloaded at a time.
+        A manifest in dest_dir records the version and size of each file, so
+        files already present with the same version and size are skipped.
+
+        :param dest_dir: directory to download to, created if missing
+        :param concurrency: number of files downloaded at the same time
+        :param page_size: assets fetched per find() call, at most 100
+        :param chunk_size: bytes read and written at a time per file
+        :return: dict with downloaded, skipped and failed ({uid: error})
+        counts, bytes transferred, seconds and bytes_per_second
+
+        -----------------------------
+        [Example]:
+
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> report = stack.asset_query().download_all('/var/mirror/assets', concurrency=16)
+        ------------------------------
+        """
+        os.makedirs(dest_dir, exist_ok=True)
+        manifest_path = os.path.join(dest_dir, MANIFEST_FILE)
+        manifest = {}
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding='utf-8') as file:
+                manifest = json.load(file)
+        report = {'downloaded': 0, 'skipped': 0, 'failed': {}, 'bytes': 0}
+        lock = threading.Lock()
+        # bounds the queued downloads, so pages are only fetched as needed
+        slots = threading.BoundedSemaphore(concurrency * 2)
+        started = time.monotonic()
+
+        def download(asset, path):
+            try:
+                result = Asset(self.http_instance, asset['uid'], self.logger) \
+                    .download(path, chunk_size=chunk_size, asset=asset)
+                with lock:
+                    report['downloaded'] += 1
+                    report['bytes'] += result['downloaded']
+                    manifest[asset['uid']] = {'version': asset.get('_version'),
+                                              'file_size': result['size'],
+                                              'path': os.path.relpath(path, dest_dir)}
+            except Exception as error:  # one failed file must not stop the mirror
+                with lock:
+                    report['failed'][asset['uid']] = str(error)
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            for page in self._iter_pages(min(page_size, 100)):
+                for asset in page:
+                    filename = os.path.basename(asset.get('filename') or asset['uid'])
+                    path = os.path.join(dest_dir, asset['uid'], filename)
+                    if self._is_mirrored(asset, path, manifest.get(asset['uid'])):
+                        report['skipped'] += 1
+                        continue
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    slots.acquire()
+                    executor.submit(download, asset, path)
+
+        temporary = f'{manifest_path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file)
+        os.replace(temporary, manifest_path)
+        report['seconds'] = time.monotonic() - started
+        report['bytes_per_second'] = report['bytes'] / report['seconds'] if report['seconds'] else 0.0
+        self.logger.info('Mirrored assets: %d downloaded, %d skipped, %d failed, %.1f MB/s',
+                         report['downloaded'], report['skipped'], len(report['failed']),
+                         report['bytes_per_second'] / 1e6)
+        return report
+
+    @staticmethod
+    def _is_mirrored(asset, path, record):
+        if not os.path.exists(path):
+            return False
+        size = os.path.getsize(path)
+        if str(size) != str(asset.get('file_size', size)):
+            return False
+        return record is None or record.get('version') == asset.get('_version')
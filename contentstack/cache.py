@@ -0,0 +1,137 @@
+"""
+In-memory cache of delivery responses.
+
+Responses are keyed on the URL and only the request headers that change
+the content: stack api_key, environment, variant (x-cs-variant-uid),
+branch, delivery and preview tokens and the live preview release/timestamp. Other headers
+such as the user agent never split the cache. Variant responses can have their own TTLs and are evicted before
+base responses, so the base entries and hot variants stay resident.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+VARIANT_HEADER = 'x-cs-variant-uid'
+CONTENT_HEADERS = ('api_key', 'environment', 'branch', 'release_id', 'preview_timestamp')
+CREDENTIAL_HEADERS = ('access_token', 'preview_token', 'authorization')
+
+
+class ResponseCache:
+    """
+    LRU cache with TTLs for decoded delivery responses. Base (non-variant)
+    and variant responses are kept in separate LRU lists; when the cache is
+    full the least recently used variant response is evicted first, and base
+    responses only once no variant response is left.
+
+    Example::
+
+        >>> import contentstack
+        >>> from contentstack.cache import ResponseCache
+        >>> cache = ResponseCache(maxsize=2048, ttl=300, variant_ttl={'vip_variant': 30})
+        >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment', cache=cache)
+    """
+
+    def __init__(self, maxsize=1024, ttl=300, variant_ttl=None):
+        """
+        :param maxsize: maximum number of cached responses
+        :param ttl: seconds a response stays valid
+        :param variant_ttl: (optional) seconds a variant response stays
+        valid, either one number for all variants or a dict of variant uid
+        (or comma separated combination) to seconds. Defaults to ttl
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.variant_ttl = variant_ttl
+        self.hits = 0
+        self.misses = 0
+        self._base = OrderedDict()
+        self._variants = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url, headers, raw=False):
+        """
+        Builds the cache key of a request. Variant uids are sorted so the
+        same combination shares one entry; credentials are hashed.
+        :param url: request URL
+        :param headers: headers sent with the request
+        :param raw: True for undecoded (text) responses
+        :return: hashable key
+        """
+        headers = headers or {}
+        variant = headers.get(VARIANT_HEADER)
+        if variant:
+            variant = ','.join(sorted({uid.strip() for uid in variant.split(',') if uid.strip()}))
+        parts = [(name, headers[name]) for name in CONTENT_HEADERS if headers.get(name)]
+        for name in CREDENTIAL_HEADERS:
+            if headers.get(name):
+                digest = hashlib.sha256(str(headers[name]).encode('utf-8')).hexdigest()
+                parts.append((name, digest))
+        return url, variant or None, tuple(parts), raw
+
+    def get(self, key, stale=False):
+        """
+        Returns a copy of the cached response of key, None when missing or
+        expired. Expired responses stay in the LRU until evicted or replaced
+        so they can still be served while the CDN is unreachable.
+        :param key: key built by ResponseCache.key()
+        :param stale: (optional) also return an expired response
+        """
+        store = self._variants if key[1] else self._base
+        with self._lock:
+            item = store.get(key)
+            if item is None or (item[0] < time.monotonic() and not stale):
+                self.misses += 1
+                return None
+            store.move_to_end(key)
+            self.hits += 1
+            value = item[1]
+        # callers may modify the response (e.g. reference resolution)
+        return value if isinstance(value, str) else copy.deepcopy(value)
+
+    def set(self, key, value):
+        """
+        Caches a response
+        :param key: key built by ResponseCache.key()
+        :param value: decoded response dict or raw text
+        """
+        variant = key[1]
+        ttl = self._ttl(variant)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        if not isinstance(value, str):
+            value = copy.deepcopy(value)
+        store = self._variants if variant else self._base
+        with self._lock:
+            # make room first so the response being cached is never the victim
+            store.pop(key, None)
+            while len(self._base) + len(self._variants) >= self.maxsize:
+                (self._variants or self._base).popitem(last=False)
+            store[key] = (time.monotonic() + ttl, value)
+
+    def _ttl(self, variant):
+        if not variant or self.variant_ttl is None:
+            return self.ttl
+        if isinstance(self.variant_ttl, dict):
+            return self.variant_ttl.get(variant, self.ttl)
+        return self.variant_ttl
+
+    def invalidate(self, url_fragment=None):
+        """
+        Drops cached responses
+        :param url_fragment: (optional) only responses whose URL contains it,
+        e.g. '/entries/entry_uid'. Everything when None
+        """
+        with self._lock:
+            for store in (self._base, self._variants):
+                if url_fragment is None:
+                    store.clear()
+                    continue
+                for key in [key for key in store if url_fragment in key[0]]:
+                    del store[key]
+
+    def __len__(self):
+        return len(self._base) + len(self._variants)
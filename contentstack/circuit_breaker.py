@@ -0,0 +1,130 @@
+"""
+Per-host circuit breaker for delivery requests.
+
+When a CDN host is down every request would otherwise wait out the timeout
+and the retries before failing, pinning the calling threads. After
+failure_threshold consecutive failures the circuit of that host opens and
+requests fail at once, or are answered from the response cache (stale
+entries included) or a local replica. After reset_timeout a few half-open
+requests are let through; a success closes the circuit again.
+"""
+
+import logging
+import threading
+import time
+
+from contentstack.controller import RequestError
+from contentstack.error_messages import ErrorMessages
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(RequestError):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+class _HostCircuit:
+    __slots__ = ('state', 'failures', 'opened_at', 'probes')
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Tracks the health of each host requests are sent to.
+
+    Example::
+
+        >>> import contentstack
+        >>> from contentstack.circuit_breaker import CircuitBreaker
+        >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment', cache=True,
+        ...                            circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=10))
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30, half_open_requests=1,
+                 fallback=None, logger=None):
+        """
+        :param failure_threshold: consecutive failures that open a circuit
+        :param reset_timeout: seconds an open circuit waits before letting
+        half-open requests through
+        :param half_open_requests: requests let through at the same time
+        while half-open
+        :param fallback: (optional) callable(url, headers) returning a response
+        from a local replica, or None, used when the host cannot be reached
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_requests = half_open_requests
+        self.fallback = fallback
+        self.logger = logger or logging.getLogger(__name__)
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def state(self, host):
+        """
+        :return: 'closed', 'open' or 'half_open'
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and time.monotonic() - circuit.opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return circuit.state
+
+    def allow(self, host):
+        """
+        Whether a request may be sent to host now. A True answer while
+        half-open reserves one of the probe slots, released by
+        record_success() or record_failure().
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.state == CLOSED:
+                return True
+            if circuit.state == OPEN:
+                if time.monotonic() - circuit.opened_at < self.reset_timeout:
+                    return False
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.probes >= self.half_open_requests:
+                return False
+            circuit.probes += 1
+            return True
+
+    def record_success(self, host):
+        """Closes the circuit of host"""
+        with self._lock:
+            circuit = self._circuits.pop(host, None)
+        if circuit is not None and circuit.state != CLOSED:
+            self.logger.info('Circuit to %s closed', host)
+
+    def record_failure(self, host):
+        """Counts a failed request; opens the circuit at the threshold or
+        when a half-open request fails"""
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _HostCircuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                opened = circuit.state != OPEN
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probes = 0
+            else:
+                opened = False
+        if opened:
+            self.logger.warning('Circuit to %s opened after %d failures', host, circuit.failures)
+
+    def open_error(self, url):
+        """The error raised for a request short-circuited without fallback"""
+        return CircuitOpenError({
+            'error': ErrorMessages.CIRCUIT_OPEN.format(url=url),
+            'error_code': '503',
+            'error_message': ErrorMessages.CIRCUIT_OPEN.format(url=url),
+        })
@@ -14,6 +14,7 @@ from urllib import parse
 from contentstack.error_messages import ErrorMessages
 
 from contentstack.entry import Entry
+from contentstack.model_generator import generate_model
 from contentstack.query import Query
 from contentstack.variants import Variants
 
@@ -95,6 +96,31 @@ class ContentType:
         result = self.http_instance.get(url)
         return result
 
+    def model(self, name=None, global_fields=None):
+        """
+        Fetches the schema of the ContentType, including global field schemas,
+        and generates a compact __slots__ model class from it.
+        :param name: (optional) class name, derived from the content type uid by default
+        :param global_fields: (optional) dict of global field uid to schema list
+        :return: model class, see contentstack.model_generator.generate_model
+        ------------------------------
+        Example:
+
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> content_type = stack.content_type('product')
+            >>> Product = content_type.model()
+            >>> products = Product.from_list(content_type.query().find()['entries'])
+        ------------------------------
+        """
+        self.local_param['include_global_field_schema'] = 'true'
+        try:
+            response = self.fetch()
+        finally:
+            # only this request asks for the global field schemas
+            self.local_param.pop('include_global_field_schema', None)
+        return generate_model(response, name=name, global_fields=global_fields)
+
     def find(self, params=None):
         """
         This method is useful to fetch ContentType of the of the stack.
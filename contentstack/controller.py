@@ -1,5 +1,3 @@
-import requests
-from requests.utils import guess_json_utf
 from contentstack.error_messages import ErrorMessages
 
 
@@ -12,7 +10,14 @@ class RequestError(Exception):
     pass
 
 
-def get_request(session, url, headers, timeout):
+# statuses of a host that is down or overloaded, rather than of a bad request
+UNAVAILABLE_STATUSES = frozenset({408, 429})
+
+
+def get_request(session, url, headers, timeout, raw=False, raise_unavailable=False):
+    """Sends a GET and returns the decoded body, or its text when raw. With
+    raise_unavailable, 5xx, 408 and 429 responses raise RequestError"""
+    import requests  # deferred so that importing contentstack stays cheap
     try:
         response = session.get(url, verify=True, headers=headers, timeout=timeout)
         if response.encoding is None:
@@ -32,4 +37,37 @@ def get_request(session, url, headers, timeout):
         }
         raise RequestError(error)
     else:
-        return response.json()
+        status = response.status_code
+        if raise_unavailable and (status >= 500 or status in UNAVAILABLE_STATUSES):
+            raise RequestError({
+                'error': ErrorMessages.HOST_UNAVAILABLE.format(url=url, status=status),
+                'error_code': status,
+                'error_message': response.reason
+            })
+        if raw:
+            return response.text
+        try:
+            return response.json()
+        except ValueError as e:
+            # e.g. the HTML page of a 502 served by the CDN
+            raise RequestError({
+                'error': ErrorMessages.INVALID_RESPONSE_BODY.format(
+                    url=url, status=status, error=str(e)),
+                'error_code': status,
+                'error_message': {str(e)}
+            })
+
+
+def stream_request(session, url, headers, timeout):
+    """Opens a streamed GET; the caller reads and closes the response"""
+    import requests
+    try:
+        response = session.get(url, verify=True, headers=headers, timeout=timeout, stream=True)
+    except requests.exceptions.RequestException as e:
+        error = {
+            'error': ErrorMessages.CONNECTION_FAILED.format(url=url, error=str(e)),
+            'error_code': '400',
+            'error_message': {str(e)}
+        }
+        raise RequestError(error)
+    return response
@@ -1,5 +1,139 @@
+"""
+Merges live preview entries into delivery entries.
+
+deep_merge() walks both trees with an explicit stack instead of recursion,
+so deeply nested JSON RTE documents and modular blocks cannot hit the
+recursion limit. A dict or list is copied only once a value under it really
+differs; unchanged subtrees are returned as the base objects themselves, and
+everything else is shared with the inputs, which are never modified.
+"""
+
 from contentstack.error_messages import ErrorMessages
 
+_MISSING = object()
+
+
+def _item_key(item):
+    """Identity of an array item: the uid of references, assets and JSON RTE
+    nodes, or (block uid, _metadata.uid) of modular blocks. None otherwise."""
+    if not isinstance(item, dict):
+        return None
+    uid = item.get('uid')
+    if uid is not None:
+        return uid
+    if len(item) == 1:
+        (block_uid, value), = item.items()
+        if isinstance(value, dict):
+            metadata = value.get('_metadata')
+            if isinstance(metadata, dict) and metadata.get('uid') is not None:
+                return block_uid, metadata['uid']
+    return None
+
+
+def _same(current, value):
+    """Whether value leaves current unchanged, comparing scalars by value"""
+    if current is value:
+        return True
+    if isinstance(value, (dict, list)) or type(current) is not type(value):
+        return False
+    return current == value
+
+
+class _Merge:
+    """One dict or list being merged, copied on its first change"""
+    __slots__ = ('base', 'steps', 'merged', 'parent', 'key', 'is_dict')
+
+    def __init__(self, base, patch, parent, key):
+        self.base = base
+        self.parent = parent
+        self.key = key
+        self.merged = None
+        self.is_dict = isinstance(base, dict)
+        if self.is_dict:
+            self.steps = _dict_steps(base, patch)
+        else:
+            self.steps = _list_steps(base, patch)
+            if len(patch) != len(base):
+                self.merged = list(patch)
+
+    def set(self, key, value):
+        if self.merged is None:
+            current = self.base.get(key, _MISSING) if self.is_dict else self.base[key]
+            if _same(current, value):
+                return
+            self.merged = dict(self.base) if self.is_dict else list(self.base)
+        self.merged[key] = value
+
+
+def _mergeable(base, patch):
+    return isinstance(patch, dict) and isinstance(base, dict) or \
+        isinstance(patch, list) and isinstance(base, list)
+
+
+def _dict_steps(base, patch):
+    """Yields (key, base value, patch value, merge) for each patched field"""
+    for field, value in patch.items():
+        current = base.get(field, _MISSING)
+        yield field, current, value, current is not value and _mergeable(current, value)
+
+
+def _list_steps(base, patch):
+    """Yields (position, base item, patch item, merge) for each patch item"""
+    index = {}
+    for item in base:
+        if isinstance(item, dict):
+            uid = item.get('uid')
+            index[_item_key(item) if uid is None else uid] = item
+    index.pop(None, None)
+    for position, item in enumerate(patch):
+        current = None
+        if index and isinstance(item, dict):
+            uid = item.get('uid')
+            current = index.get(_item_key(item) if uid is None else uid)
+        if current is None or current is item:
+            yield position, None, item, False
+            continue
+        # an item carrying every key of its base item is taken as is; only
+        # richer base items (e.g. references resolved with include[]) need
+        # merging. Blocks compare their values.
+        if uid is None:
+            (fields,), (base_fields,) = item.values(), current.values()
+        else:
+            fields, base_fields = item, current
+        yield position, current, item, not fields.keys() >= base_fields.keys()
+
+
+def deep_merge(base, patch):
+    """
+    Returns base with patch merged into it. Dicts are merged key by key;
+    arrays follow the order and items of patch, and an item lacking keys of
+    the base item with the same uid (see _item_key) is merged into it; any
+    other value of patch replaces the base value. Neither argument is
+    modified, and base (or any part of it) is returned as is when the patch
+    changes nothing in it.
+    :param base: delivery value, e.g. an entry
+    :param patch: live preview value for the same entry
+    :return: merged value
+    """
+    if not _mergeable(base, patch):
+        return patch
+    stack = [_Merge(base, patch, None, None)]
+    while True:
+        frame = stack[-1]
+        for key, current, value, merge in frame.steps:
+            if merge:
+                # resumed from the next step once the child is merged
+                stack.append(_Merge(current, value, frame, key))
+                break
+            frame.set(key, value)
+        else:
+            stack.pop()
+            result = frame.base if frame.merged is None else frame.merged
+            if frame.parent is None:
+                return result
+            frame.parent.set(frame.key, result)
+
+
 class DeepMergeMixin:
 
     def __init__(self, entry_response, lp_response):
@@ -12,27 +146,19 @@ class DeepMergeMixin:
 
     def _merge_entries(self, entry_list, lp_list):
         """Merge each LP entry into the corresponding entry response based on UID"""
-        merged_entries = {entry["uid"]: entry.copy() for entry in entry_list}  # Convert to dict for easy lookup
+        merged_entries = {entry["uid"]: entry for entry in entry_list}  # Convert to dict for easy lookup
 
         for lp_obj in lp_list:
             uid = lp_obj.get("uid")
             if uid in merged_entries:
-                self._deep_merge(lp_obj, merged_entries[uid])
+                merged_entries[uid] = deep_merge(merged_entries[uid], lp_obj)
             else:
                 merged_entries[uid] = lp_obj  # If LP object does not exist in entry_response, add it
 
         return list(merged_entries.values())  # Convert back to a list
 
     def _deep_merge(self, source, destination):
-        if not isinstance(destination, dict) or not isinstance(source, dict):
-            return source  # Return source if it's not a dict
-        for key, value in source.items():
-            if isinstance(value, dict):
-                node = destination.setdefault(key, {})
-                self._deep_merge(value, node)
-            else:
-                destination[key] = value
-        return destination
+        return deep_merge(destination, source)
 
     def to_dict(self):
         return self.merged_response
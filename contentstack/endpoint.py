@@ -2,18 +2,18 @@
 Endpoint — Contentstack region-to-URL resolver.
 
 Resolves Contentstack service endpoint URLs for any supported region.
-Region data is loaded from contentstack/assets/regions.json (bundled) and
-cached in-memory for the lifetime of the process. When the bundled file is
-absent the class attempts a live download from the Contentstack CDN so the
-SDK continues to work even when the file was not created during installation.
+Region data is compiled at build time (see BuildPyWithRegions in setup.py)
+into contentstack/_regions.py, a module of dicts indexed by region id and
+lowercased alias, so a lookup is two dict gets. When the compiled module is
+absent (e.g. a source checkout) contentstack/assets/regions.json is indexed
+once instead. Resolution never touches the network; use refresh_regions()
+to update the bundled data.
 """
 
 import json
 import os
 import re
 
-REGIONS_URL = 'https://artifacts.contentstack.com/regions.json'
-
 
 class Endpoint:
     """
@@ -36,7 +36,7 @@ class Endpoint:
         # 'gcp-eu-cdn.contentstack.com'
     """
 
-    _regions_data = None  # in-memory cache — shared across all instances
+    _regions_data = None  # in-memory index — shared across all instances
 
     @staticmethod
     def get_contentstack_endpoint(region='us', service='', omit_https=False):
@@ -50,14 +50,14 @@ class Endpoint:
         :param omit_https: When True, strips 'https://' prefix from returned URL(s).
         :returns: str when service is provided, dict[str,str] otherwise.
         :raises ValueError: When region is empty, unknown, or service is not found.
-        :raises RuntimeError: When regions.json cannot be read or parsed.
+        :raises RuntimeError: When no region data is bundled or it cannot be parsed.
         """
         if not region:
             raise ValueError('Empty region provided. Please put valid region.')
 
         data = Endpoint._load_regions()
         normalized = region.strip().lower()
-        region_row = Endpoint._find_region(data['regions'], normalized)
+        region_row = Endpoint._find_region(data, normalized)
 
         if region_row is None:
             raise ValueError(f'Invalid region: {region}')
@@ -78,26 +78,28 @@ class Endpoint:
     @staticmethod
     def _load_regions():
         """
-        Load and cache regions.json.
+        Load and cache the region index: {'by_id': {...}, 'by_alias': {...}}.
 
         Resolution order:
           1. In-memory static cache (zero I/O after first call)
-          2. contentstack/assets/regions.json on disk (written by download script)
-          3. Live download from artifacts.contentstack.com (fallback)
+          2. contentstack/_regions.py compiled at build time (import only)
+          3. contentstack/assets/regions.json on disk, indexed once
         """
         if Endpoint._regions_data is not None:
             return Endpoint._regions_data
 
-        assets_dir = os.path.join(os.path.dirname(__file__), 'assets')
-        path = os.path.join(assets_dir, 'regions.json')
-
-        if not os.path.exists(path):
-            Endpoint._download_and_save(path)
+        try:
+            from contentstack import _regions
+            Endpoint._regions_data = {'by_id': _regions.BY_ID, 'by_alias': _regions.BY_ALIAS}
+            return Endpoint._regions_data
+        except ImportError:
+            pass
 
+        path = os.path.join(os.path.dirname(__file__), 'assets', 'regions.json')
         if not os.path.exists(path):
             raise RuntimeError(
-                'contentstack: regions.json not found and could not be downloaded. '
-                'Run "python scripts/download_regions.py" and ensure network access.'
+                'contentstack: region data is not bundled. '
+                'Run "python scripts/download_regions.py" to download regions.json.'
             )
 
         try:
@@ -115,59 +117,40 @@ class Endpoint:
                 'Run "python scripts/download_regions.py" to re-download it.'
             )
 
-        Endpoint._regions_data = decoded
+        Endpoint._regions_data = Endpoint._index_regions(decoded['regions'])
         return Endpoint._regions_data
 
     @staticmethod
-    def _download_and_save(dest):
+    def _index_regions(regions):
         """
-        Download regions.json from the Contentstack CDN and save to disk.
-        Uses the requests library (already an SDK dependency).
-        Silent on failure — the caller decides whether a missing file is fatal.
+        Index regions by id and by lowercased alias.
 
-        :param dest: Absolute path to write the file to.
-        """
-        os.makedirs(os.path.dirname(dest), exist_ok=True)
-
-        try:
-            import requests
-            response = requests.get(REGIONS_URL, timeout=30)
-            response.raise_for_status()
-            data = response.text
-        except Exception:  # noqa: BLE001
-            return
-
-        try:
-            decoded = json.loads(data)
-        except json.JSONDecodeError:
-            return
+        Ids win over aliases and the first region listing an alias keeps
+        it, matching the former two-pass scan (id match first, then aliases).
 
-        if isinstance(decoded, dict) and 'regions' in decoded:
-            try:
-                with open(dest, 'w', encoding='utf-8') as f:
-                    f.write(data)
-            except OSError:
-                pass
+        :param regions: list of region dicts from regions.json
+        :returns: {'by_id': {id: region}, 'by_alias': {alias: id}}
+        """
+        by_id = {row['id']: row for row in regions}
+        by_alias = {}
+        for row in regions:
+            for alias in row.get('alias', []):
+                by_alias.setdefault(alias.lower(), row['id'])
+        return {'by_id': by_id, 'by_alias': by_alias}
 
     @staticmethod
-    def _find_region(regions, input_str):
+    def _find_region(data, input_str):
         """
         Find a region entry by its id or any alias (case-insensitive).
 
-        Two-pass: exact id match first, then alias[] scan — mirrors PHP implementation.
-
-        :param regions: list of region dicts from regions.json
+        :param data: region index from _load_regions()
         :param input_str: already-lowercased input
         :returns: region dict or None
         """
-        for row in regions:
-            if row['id'] == input_str:
-                return row
-        for row in regions:
-            for alias in row.get('alias', []):
-                if alias.lower() == input_str:
-                    return row
-        return None
+        row = data['by_id'].get(input_str)
+        if row is None and input_str in data['by_alias']:
+            row = data['by_id'].get(data['by_alias'][input_str])
+        return row
 
     @staticmethod
     def _strip_https(url):
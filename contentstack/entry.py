@@ -10,6 +10,7 @@ from contentstack.error_messages import ErrorMessages
 
 from contentstack.deep_merge_lp import DeepMergeMixin
 from contentstack.entryqueryable import EntryQueryable
+from contentstack.lazy_entry import lazy_response
 from contentstack.variants import Variants
 
 class Entry(EntryQueryable):
@@ -205,9 +206,11 @@ class Entry(EntryQueryable):
         url = f'{self.http_instance.endpoint}/content_types/{self.content_type_id}/entries/{self.entry_uid}'
         return url
 
-    def fetch(self):
+    def fetch(self, preview=None):
         """
         Fetches the latest version of the entries from stack
+        :param preview: (optional) LivePreviewContext of this request, used
+        instead of the Stack live_preview state
         :return: Entry, so you can chain this call.
         -------------------------------
         [Example:]
@@ -223,50 +226,82 @@ class Entry(EntryQueryable):
             self.entry_param['environment'] = self.http_instance.headers['environment']
         if len(self.entry_queryable_param) > 0:
             self.entry_param.update(self.entry_queryable_param)
+        if self.reference_resolution is not None:
+            self.entry_param.pop('include[]', None)
         encoded_str = parse.urlencode(self.entry_param, doseq=True)
         url = f'{self.base_url}?{encoded_str}'
-        self._impl_live_preview()
-        response = self.http_instance.get(url)
+        if preview is not None:
+            return self._fetch_with_context(url, preview)
+        if self._lazy_enabled(self.http_instance):
+            return lazy_response(self.http_instance.get(url, raw=True), 'entry')
+        response, lp_resp = self._get_with_preview(
+            self.http_instance, url, self._live_preview_url())
+        self._store_live_preview(lp_resp)
+        if 'entry' in response:
+            self._resolve_references(self.http_instance, [response['entry']])
         if self.http_instance.live_preview is not None and not 'errors' in response:
             self.http_instance.live_preview['entry_response'] = response['entry']
             return self._merged_response()
         return response
 
-    def _impl_live_preview(self):
+    def _live_preview_url(self):
+        # sets the preview auth header and returns the preview url when the
+        # live preview targets this content type, None otherwise
         lv = self.http_instance.live_preview
         if lv is not None and lv['enable'] and 'content_type_uid' in lv and lv[
             'content_type_uid'] == self.content_type_id:
-            url = lv['url']
             if lv.get('management_token'):
                 self.http_instance.headers['authorization'] = lv['management_token']
             else:
                 self.http_instance.headers['preview_token'] = lv['preview_token']
-            lp_resp = self.http_instance.get(url)
-            if lp_resp is not None and not 'error_code' in lp_resp:
-                self.http_instance.live_preview['lp_response'] = lp_resp
-            return None
+            return lv['url']
+        return None
+
+    def _store_live_preview(self, lp_resp):
+        if lp_resp is not None and not 'error_code' in lp_resp:
+            self.http_instance.live_preview['lp_response'] = lp_resp
+
+    def _impl_live_preview(self):
+        url = self._live_preview_url()
+        if url is not None:
+            self._store_live_preview(self.http_instance.get(url))
         return None
 
+    def _fetch_with_context(self, url, preview):
+        preview_url = preview.url if preview.applies_to(self.content_type_id) else None
+        response, lp_resp = self._get_with_preview(
+            self.http_instance, url, preview_url, preview.headers())
+        if 'entry' not in response:
+            return response
+        self._resolve_references(self.http_instance, [response['entry']])
+        if lp_resp is None or 'error_code' in lp_resp:
+            return response
+        return self._merge_preview(response['entry'], lp_resp)
+
     def _merged_response(self):
         if 'entry_response' in self.http_instance.live_preview and 'lp_response' in self.http_instance.live_preview:
-            entry_response = self.http_instance.live_preview['entry_response']
-            # Ensure lp_entry exists
-            if 'entry' in self.http_instance.live_preview.get('lp_response', {}):
-                lp_entry = self.http_instance.live_preview['lp_response']['entry']
-            else:
-                lp_entry = {} 
-            if not isinstance(entry_response, list):
-                entry_response = [entry_response]
-            if not isinstance(lp_entry, list):
-                lp_entry = [lp_entry]  # Wrap in a list if it's a dict
-            if not all(isinstance(item, dict) for item in entry_response):
-                raise TypeError(ErrorMessages.INVALID_ENTRY_RESPONSE)
-            if not all(isinstance(item, dict) for item in lp_entry):
-                raise TypeError(ErrorMessages.INVALID_LP_ENTRY)
-            merged_response = DeepMergeMixin(entry_response, lp_entry).to_dict()  # Convert to dictionary
-            return merged_response  # Now correctly returns a dictionary
+            return self._merge_preview(self.http_instance.live_preview['entry_response'],
+                                       self.http_instance.live_preview['lp_response'])
         raise ValueError(ErrorMessages.MISSING_LIVE_PREVIEW_KEYS)
-    
+
+    @staticmethod
+    def _merge_preview(entry_response, lp_response):
+        # Ensure lp_entry exists
+        if 'entry' in (lp_response or {}):
+            lp_entry = lp_response['entry']
+        else:
+            lp_entry = {}
+        if not isinstance(entry_response, list):
+            entry_response = [entry_response]
+        if not isinstance(lp_entry, list):
+            lp_entry = [lp_entry]  # Wrap in a list if it's a dict
+        if not all(isinstance(item, dict) for item in entry_response):
+            raise TypeError(ErrorMessages.INVALID_ENTRY_RESPONSE)
+        if not all(isinstance(item, dict) for item in lp_entry):
+            raise TypeError(ErrorMessages.INVALID_LP_ENTRY)
+        merged_response = DeepMergeMixin(entry_response, lp_entry).to_dict()  # Convert to dictionary
+        return merged_response  # Now correctly returns a dictionary
+
     def variants(self, variant_uid: str | list[str], branch: str = None, params: dict = None):
         """
         Fetches the variants of the entry
@@ -3,7 +3,35 @@ EntryQueryable class contains common functions
 that is used as parents class for the query and entry classes
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contentstack.error_messages import ErrorMessages
+from contentstack.model_generator import EntryModel, SYSTEM_FIELDS
+from contentstack.reference_resolver import ReferenceResolver
+
+# kept by every projection: entries are identified by uid and paged on
+# updated_at by Query.iter_pages()
+PROJECTION_FIELDS = ('uid', 'updated_at')
+
+
+def _projection(template):
+    """Splits a projection template into BASE fields and {reference: fields}"""
+    if isinstance(template, type) and issubclass(template, EntryModel):
+        return [key for key, _, _ in template._plan if key not in SYSTEM_FIELDS], {}
+    if isinstance(template, dict):
+        template = [template]
+    if not isinstance(template, (list, tuple)):
+        raise KeyError(ErrorMessages.INVALID_FIELD_UID)
+    base, references = [], {}
+    for item in template:
+        if isinstance(item, str):
+            base.append(item)
+        elif isinstance(item, dict):
+            for reference_field_uid, fields in item.items():
+                base.append(reference_field_uid)
+                references[reference_field_uid] = _projection(fields)[0]
+        else:
+            raise KeyError(ErrorMessages.INVALID_FIELD_UID)
+    return base, references
 
 class EntryQueryable:
     """
@@ -12,6 +40,8 @@ class EntryQueryable:
 
     def __init__(self, logger=None):
         self.entry_queryable_param = {}
+        self.reference_resolution = None
+        self.lazy_result = False
         self.logger = logger or logging.getLogger(__name__)
 
     def locale(self, locale: str):
@@ -44,33 +74,91 @@ class EntryQueryable:
         self.entry_queryable_param['locale'] = locale
         return self
 
-    def only(self, field_uid: str):
+    def only(self, *field_uids, reference_field_uid: str = None):
         """
         Specifies an array of only keys in BASE object that would be included in the response.
-        It refers to the top-level fields of the schema
-        :param field_uid: Array of the only reference keys to be included in response
+        It refers to the top-level fields of the schema. Can be called multiple
+        times or with several field uids; the fields are accumulated.
+        :param field_uids: Array of the only reference keys to be included in response
+        :param reference_field_uid: (optional) reference field whose included
+        entries are projected instead of BASE, i.e. only[reference_field_uid][]
         Returns:
             self -- so you can chain this call.
+
+        Example:
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> query = stack.content_type('blog').query()
+            >>> query = query.only('title', 'url').include_reference('author')
+            >>> query = query.only('title', reference_field_uid='author')
+            >>> result = query.find()
         """
-        if field_uid is not None:
-            if isinstance(field_uid, str):
-                self.entry_queryable_param['only[BASE][]'] = field_uid
-            else:
-                raise KeyError(ErrorMessages.INVALID_FIELD_UID)
+        self._add_projection('only', field_uids, reference_field_uid)
         return self
 
-    def excepts(self, field_uid: str):
+    def excepts(self, *field_uids, reference_field_uid: str = None):
         """
         Specifies list of field_uid that would be excluded from the response.
-        It refers to the top-level fields of the schema
-        :param field_uid: to be excluded from the response.
+        It refers to the top-level fields of the schema. Can be called multiple
+        times or with several field uids; the fields are accumulated.
+        :param field_uids: to be excluded from the response.
+        :param reference_field_uid: (optional) reference field whose included
+        entries are projected instead of BASE, i.e. except[reference_field_uid][]
         :return: self -- so you can chain this call.
         """
-        if field_uid is not None:
-            if isinstance(field_uid, str):
-                self.entry_queryable_param['except[BASE][]'] = field_uid
-            else:
-                raise KeyError(ErrorMessages.INVALID_FIELD_UID)
+        self._add_projection('except', field_uids, reference_field_uid)
+        return self
+
+    def _add_projection(self, kind, field_uids, reference_field_uid):
+        values = []
+        for field_uid in field_uids:
+            if field_uid is None:
+                continue
+            items = field_uid if isinstance(field_uid, (list, tuple)) else [field_uid]
+            for item in items:
+                if not isinstance(item, str):
+                    raise KeyError(ErrorMessages.INVALID_FIELD_UID)
+                values.append(item)
+        if reference_field_uid is not None and not isinstance(reference_field_uid, str):
+            raise KeyError(ErrorMessages.INVALID_FIELD_UID)
+        if not values:
+            return
+        key = f'{kind}[{reference_field_uid or "BASE"}][]'
+        existing = self.entry_queryable_param.get(key)
+        if existing is not None:
+            existing = existing if isinstance(existing, list) else [existing]
+            values = existing + values
+        values = list(dict.fromkeys(values))
+        self.entry_queryable_param[key] = values[0] if len(values) == 1 else values
+
+    def project(self, template):
+        """
+        Derives the minimal only[] projection from a declared template and
+        applies it, so listing pages download just the fields they render.
+        The template is a list of field uids in which a dict maps a reference
+        field to the template of the referenced entries (those references are
+        included as well), or a model class generated by
+        contentstack.model_generator.generate_model. uid and updated_at are
+        always kept.
+        :param template: list, tuple, dict or generated model class
+        :return: self -- so you can chain this call.
+
+        Example:
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> query = stack.content_type('blog').query()
+            >>> query = query.project(['title', 'url', {'author': ['title', 'avatar']}])
+            >>> result = query.find()
+        """
+        base, references = _projection(template)
+        self.only(list(PROJECTION_FIELDS) + base)
+        for reference_field_uid, fields in references.items():
+            self.only(list(PROJECTION_FIELDS) + fields, reference_field_uid=reference_field_uid)
+        if references:
+            include = self.entry_queryable_param.get('include[]', [])
+            include = include if isinstance(include, list) else [include]
+            self.entry_queryable_param['include[]'] = include + [
+                field for field in references if field not in include]
         return self
 
     def include_reference(self, field_uid):
@@ -101,6 +189,79 @@ class EntryQueryable:
             self.entry_queryable_param["include[]"] = field_uid
         return self
 
+    def resolve_references(self, *field_uids, depth: int = 1):
+        """
+        Resolves reference fields on the client instead of include[].
+        References are requested as uids only, the unique uids of the whole
+        response are fetched once with batched $in queries and every reference
+        is linked to the same shared entry, level by level up to depth.
+        Any include_reference() set on this object is dropped.
+
+        Arguments:
+        field_uids {str} -- top-level reference fields to resolve, all when empty
+        depth {int} -- number of reference levels to resolve
+
+        Returns:
+            self -- So you can chain this call.
+
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> query = stack.content_type('blog').query()
+            >>> result = query.resolve_references('author', 'categories', depth=2).find()
+        """
+        for field_uid in field_uids:
+            if not isinstance(field_uid, str):
+                raise KeyError(ErrorMessages.INVALID_FIELD_UID)
+        self.reference_resolution = {'field_uids': list(field_uids), 'depth': depth}
+        return self
+
+    def _resolve_references(self, http_instance, entries):
+        if self.reference_resolution is None or not isinstance(entries, list):
+            return
+        resolver = ReferenceResolver(http_instance,
+                                     depth=self.reference_resolution['depth'],
+                                     locale=self.entry_queryable_param.get('locale'),
+                                     logger=self.logger)
+        resolver.resolve(entries, self.reference_resolution['field_uids'] or None)
+
+    def lazy(self):
+        """
+        Returns entries as LazyEntry objects that keep the raw JSON of each
+        entry and decode a field only when it is first read, by key or as an
+        attribute. Listing pages reading a few fields of heavy entries skip
+        decoding rich text, JSON RTE and embedded items altogether.
+        Live preview merging and resolve_references() need plain dicts, so
+        they turn lazy results off.
+
+        :return: self: so you can chain this call.
+
+        [Example for Query]
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> query = stack.content_type('content_type_uid').query()
+            >>> result = query.lazy().find()
+            >>> titles = [entry.title for entry in result['entries']]
+        """
+        self.lazy_result = True
+        return self
+
+    def _lazy_enabled(self, http_instance):
+        return self.lazy_result and self.reference_resolution is None \
+            and http_instance.live_preview is None
+
+    @staticmethod
+    def _get_with_preview(http_instance, url, preview_url=None, headers=None):
+        """Runs the delivery GET and, when preview_url is set, the live preview
+        GET concurrently. headers are added to both requests only.
+        Returns (response, live preview response or None)"""
+        kwargs = {'headers': headers} if headers else {}
+        if preview_url is None:
+            return http_instance.get(url, **kwargs), None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            preview = executor.submit(http_instance.get, preview_url, **kwargs)
+            response = http_instance.get(url, **kwargs)
+            return response, preview.result()
+
     def include_content_type(self):
         """
         This method also includes the ContentType in the entry
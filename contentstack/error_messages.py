@@ -6,6 +6,8 @@ All error messages should be defined here and imported where needed.
 class ErrorMessages:
     # BaseQuery errors
     INVALID_KEY = "Invalid key. Provide a valid key and try again."
+    MISSING_PAGINATION_KEY = "Missing pagination key. The returned entries have no '{key}' value. Use a field every entry has and try again."
+    UNORDERED_PAGINATION = "Unordered entries. The entries were not returned in ascending order of '{key}' then uid, so the pagination cursor would skip entries. Use key='uid' and try again."
     INVALID_VALUE = "Invalid value. Provide a valid value and try again."
     INVALID_KEY_OR_VALUE = "Invalid key or value. Provide valid values and try again."
 
@@ -13,6 +15,9 @@ class ErrorMessages:
     INVALID_CONTENT_TYPE_UID = "Content type UID is invalid. Provide a valid UID and try again."
     CONTENT_TYPE_UID_REQUIRED = "Content type UID is required. Provide a UID and try again."
 
+    # ModelGenerator errors
+    INVALID_SCHEMA = "Invalid schema. Provide a content type or global field response that includes its schema and try again."
+
     # EntryQueryable errors
     INVALID_FIELD_UID = "Invalid field UID. Provide a valid UID and try again."
 
@@ -31,10 +36,17 @@ class ErrorMessages:
     # Asset errors
     INVALID_UID = "Invalid UID. Provide a valid UID and try again."
     INVALID_PARAMS = "Invalid parameters. Provide valid parameters and try again."
+    MISSING_ASSET_URL = "Missing asset URL. Asset {uid} has no url to download."
+    ASSET_DOWNLOAD_FAILED = "Asset download failed. {url} returned status {status}."
+    ASSET_SIZE_MISMATCH = "Asset size mismatch. Expected {expected} bytes for asset {uid} but received {received}."
 
     # Controller errors
     CONNECTION_FAILED = "Connection failed. Unable to connect to {url}. Error: {error}. Check your connection and try again."
     OPERATION_FAILED = "Operation failed. An unexpected error occurred while making request to {url}. Error: {error}. Check your inputs and try again."
+    HOST_UNAVAILABLE = "Request failed. {url} returned status {status}. The host is unavailable or overloaded; try again later."
+    INVALID_RESPONSE_BODY = "Invalid response. {url} returned status {status} with a body that is not valid JSON. Error: {error}."
+    INVALID_LISTING = "Invalid response. {url} returned no '{key}' list. Error: {error}."
+    CIRCUIT_OPEN = "Request not sent. The circuit to the host of {url} is open after repeated failures. Try again later."
 
     # Query errors
     DEPRECATED_SEARCH = """The search() method is deprecated since version 1.7.0. Use regex() instead.
@@ -45,6 +57,8 @@ Example: query.regex("title", "^Blog.*") to search for titles starting with "Blo
 
     # Variants errors
     ENTRY_UID_REQUIRED = "Missing entry UID. Provide a valid UID and try again."
+    VARIANT_UID_REQUIRED = "Missing variant UID. Provide a variant UID or a list of variant UIDs and try again."
+    VARIANT_ENTRY_NOT_FOUND = "Entry {entry_uid} was not returned for variant {variant_uid}. Check that the entry is published and try again."
 
     # Stack errors
     INVALID_STACK_UID = "Invalid UID. Provide a valid UID and try again."
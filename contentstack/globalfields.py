@@ -8,6 +8,8 @@ Global field.
 import logging
 from urllib import parse
 
+from contentstack.model_generator import generate_model
+
 class GlobalField:
     """
     Global field defines the structure or schema of a page or a
@@ -48,6 +50,23 @@ class GlobalField:
         result = self.http_instance.get(url)
         return result
 
+    def model(self, name=None):
+        """
+        Fetches the schema of the GlobalField and generates a compact
+        __slots__ model class from it.
+        :param name: (optional) class name, derived from the global field uid by default
+        :return: model class, see contentstack.model_generator.generate_model
+        ------------------------------
+        Example:
+
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> Seo = stack.global_field('seo').model()
+            >>> seo = Seo.from_dict(entry['seo'])
+        ------------------------------
+        """
+        return generate_model(self.fetch(), name=name)
+
     def find(self, params=None):
         """
         This method is useful to fetch GlobalField of the of the stack.
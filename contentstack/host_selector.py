@@ -0,0 +1,171 @@
+"""
+Latency-based selection between delivery hosts, with failover.
+
+A Stack normally sends every request to the one host chosen for its region
+when it is created. With alternate hosts, a HostSelector probes every
+candidate in a background thread, routes requests to the fastest healthy
+one and, when a request to it fails to connect, marks it unhealthy so the
+request is retried on the next candidate. Probes bring failed hosts back.
+A probe is a small stack-scoped request (one content type) sent with the
+stack credentials, so only a host that actually serves the stack, with a
+2xx answer, counts as healthy.
+"""
+
+import logging
+import threading
+import time
+
+DEFAULT_PROBE_INTERVAL = 60
+DEFAULT_PROBE_TIMEOUT = 2
+DEFAULT_PROBE_PATH = '/content_types?limit=1'
+# request headers sent with probes; the others do not change the answer
+PROBE_HEADERS = ('api_key', 'access_token', 'branch')
+# weight of the newest probe in the moving latency average
+SMOOTHING = 0.5
+
+
+class HostSelector:
+    """
+    Ranks endpoints by probed latency and health.
+
+    Example::
+
+        >>> import contentstack
+        >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment',
+        ...                            alternate_hosts=['cdn.contentstack.com'])
+        >>> stack.http_instance.host_selector.endpoints()
+        ['https://cdn.contentstack.io/v3', 'https://cdn.contentstack.com/v3']
+    """
+
+    def __init__(self, hosts, version='v3', probe_interval=DEFAULT_PROBE_INTERVAL,
+                 probe_timeout=DEFAULT_PROBE_TIMEOUT, logger=None, headers=None,
+                 probe_path=DEFAULT_PROBE_PATH):
+        """
+        :param hosts: hosts in order of preference, the first one being the
+        host of the stack region. A host may carry a scheme and port, e.g.
+        'http://127.0.0.1:8080'; 'https://' is assumed otherwise
+        :param version: API version appended to each host
+        :param probe_interval: seconds between two background probes
+        :param probe_timeout: seconds before a probe counts as a failure
+        :param headers: (optional) stack request headers; the api_key,
+        access_token and branch among them are sent with probes
+        :param probe_path: path requested from each endpoint by a probe
+        """
+        if not hosts:
+            raise ValueError('At least one host is required.')
+        self.logger = logger or logging.getLogger(__name__)
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.probe_path = probe_path
+        self.headers = headers if headers is not None else {}
+        self._endpoints = []
+        for host in hosts:
+            base = host if '://' in host else f'https://{host}'
+            endpoint = f'{base.rstrip("/")}/{version}'
+            if endpoint not in self._endpoints:
+                self._endpoints.append(endpoint)
+        self._latency = {}
+        self._healthy = {endpoint: True for endpoint in self._endpoints}
+        self._ranked = list(self._endpoints)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        """The endpoint requests are currently sent to"""
+        return self._ranked[0]
+
+    def endpoints(self):
+        """
+        :return: every endpoint, healthy ones first, fastest first
+        """
+        return list(self._ranked)
+
+    def report_failure(self, endpoint):
+        """
+        Marks endpoint unhealthy until a probe reaches it again
+        :return: the endpoint to use next
+        """
+        with self._lock:
+            if self._healthy.get(endpoint):
+                self._healthy[endpoint] = False
+                self.logger.warning('Delivery endpoint %s failed, failing over', endpoint)
+                self._rank()
+            return self._ranked[0]
+
+    def probe(self):
+        """
+        Measures the latency of every endpoint once. Only a 2xx answer
+        counts as healthy; error statuses, connection errors and timeouts
+        do not.
+        :return: HostSelector, so we can chain the call
+        """
+        results = {}
+        threads = [threading.Thread(target=lambda e=endpoint: results.update({e: self._measure(e)}))
+                   for endpoint in self._endpoints]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with self._lock:
+            for endpoint, latency in results.items():
+                self._healthy[endpoint] = latency is not None
+                if latency is not None:
+                    previous = self._latency.get(endpoint)
+                    self._latency[endpoint] = latency if previous is None else \
+                        SMOOTHING * latency + (1 - SMOOTHING) * previous
+            self._rank()
+        return self
+
+    def start(self):
+        """
+        Probes in a daemon thread every probe_interval seconds, starting now
+        :return: HostSelector, so we can chain the call
+        """
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name='contentstack-host-probe', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, wait=True):
+        """
+        Stops the background probes
+        :param wait: (optional) wait for a probe in progress to finish
+        """
+        self._stopped.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and wait:
+            thread.join()
+
+    def close(self):
+        """Stops the background probes; requests keep the last ranking"""
+        self.stop()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.probe()
+            except Exception:  # noqa: BLE001 — a probe must never kill the thread
+                self.logger.exception('Delivery endpoint probe failed')
+            self._stopped.wait(self.probe_interval)
+
+    def _measure(self, endpoint):
+        import urllib.request
+        headers = {name: str(self.headers[name]) for name in PROBE_HEADERS if self.headers.get(name)}
+        request = urllib.request.Request(f'{endpoint}{self.probe_path}', headers=headers)
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.probe_timeout) as response:
+                status = response.status
+        except (OSError, ValueError):  # HTTPError (an error status) included
+            return None
+        if not 200 <= status < 300:
+            return None
+        return time.perf_counter() - started
+
+    def _rank(self):
+        order = {endpoint: index for index, endpoint in enumerate(self._endpoints)}
+        self._ranked = sorted(self._endpoints, key=lambda endpoint: (
+            not self._healthy[endpoint], self._latency.get(endpoint, float('inf')), order[endpoint]))
@@ -2,12 +2,13 @@
 This module implements the Requests API.
 """
 
+import json
 import logging
 import platform
-import requests
-from requests.adapters import HTTPAdapter
+import threading
+from urllib.parse import urlsplit
 import contentstack
-from contentstack.controller import get_request
+from contentstack.controller import RequestError, get_request, stream_request
 
 def __get_os_platform():
     os_platform = platform.system()
@@ -29,19 +30,210 @@ def user_agents():
     return {'User-Agent': str(header), "X-User-Agent": package}
 
 
+# used when the stack is created without a retry_strategy
+DEFAULT_RETRY = {'total': 5, 'backoff_factor': 0, 'status_forcelist': [408, 429]}
+
+
+def _is_error(response):
+    """Whether a decoded or raw (text) response is an error body"""
+    if isinstance(response, str):
+        # raw bodies of lazy() are decoded only when they may be an error
+        if '"error_code"' not in response:
+            return False
+        try:
+            response = json.loads(response)
+        except ValueError:
+            return False
+    return not isinstance(response, dict) or 'error_code' in response
+
+
 class HTTPSConnection:  # R0903: Too few public methods
-    def __init__(self, endpoint, headers, timeout, retry_strategy, live_preview):
+    def __init__(self, endpoint, headers, timeout, retry_strategy, live_preview,
+                 reference_graph=None, cache=None, host_selector=None, circuit_breaker=None):
         if None not in (endpoint, headers):
-            self.session = requests.Session()
+            self._session = None
+            self._session_lock = threading.Lock()
             self.payload = None
+            self.host_selector = host_selector
             self.endpoint = endpoint
             self.headers = headers
             self.timeout = timeout
             self.retry_strategy = retry_strategy
             self.live_preview = live_preview
+            self.reference_graph = reference_graph
+            self.cache = cache
+            self.circuit_breaker = circuit_breaker
+
+    @property
+    def endpoint(self):
+        """
+        Base URL of the delivery API; with a host_selector, the endpoint of
+        the fastest healthy host at the time the request URL is built
+        """
+        if self.host_selector is not None:
+            return self.host_selector.endpoint
+        return self._endpoint
+
+    @endpoint.setter
+    def endpoint(self, endpoint):
+        self._endpoint = endpoint
+
+    @property
+    def session(self):
+        """
+        The pooled requests.Session, created on first use so that neither
+        importing contentstack nor creating a Stack loads requests/urllib3
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    session = requests.Session()
+                    self._mount(session)
+                    self._session = session
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        # e.g. a session configured with proxies or client certificates; the
+        # retry strategy is mounted on it. None creates a new one on next use
+        with self._session_lock:
+            if session is not None:
+                self._mount(session)
+            self._session = session
+
+    @property
+    def retry_strategy(self):
+        """
+        The urllib3 Retry of the pooled connections, Retry(**DEFAULT_RETRY)
+        unless one was given. Setting it remounts the session adapter.
+        """
+        if self._retry_strategy is None:
+            from urllib3.util import Retry
+            self._retry_strategy = Retry(**DEFAULT_RETRY)
+        return self._retry_strategy
 
-    def get(self, url):
+    @retry_strategy.setter
+    def retry_strategy(self, retry_strategy):
+        self._retry_strategy = retry_strategy
+        with self._session_lock:
+            if self._session is not None:
+                self._mount(self._session)
+
+    def _mount(self, session):
+        # mounted when the session is created or the strategy changes, not
+        # on every get(): remounting would race when the delivery and live
+        # preview requests run on separate threads
+        from requests.adapters import HTTPAdapter
+        session.mount('https://', HTTPAdapter(max_retries=self.retry_strategy))
+
+    def close(self):
+        """Stops the host selector probes and closes the pooled connections"""
+        if self.host_selector is not None:
+            self.host_selector.close()
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def get(self, url, raw=False, headers=None):
         self.headers.update(user_agents())
-        adapter = HTTPAdapter(max_retries=self.retry_strategy)
-        self.session.mount('https://', adapter)
-        return get_request(self.session, url, headers=self.headers, timeout=self.timeout)
+        # per-request headers are layered on a copy so concurrent requests
+        # never see each other's values
+        request_headers = {**self.headers, **headers} if headers else self.headers
+        cache_key = None
+        if self.cache is not None and self._cacheable(url):
+            cache_key = self.cache.key(url, request_headers, raw)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        try:
+            if self.host_selector is None:
+                response = self._request(url, request_headers, raw)
+            else:
+                response = self._get_with_failover(url, request_headers, raw)
+        except RequestError:
+            fallback = self._fallback(url, request_headers, cache_key)
+            if fallback is None:
+                raise
+            # stale or replica data: neither re-cached nor indexed again
+            return fallback
+        if self.reference_graph is not None and not raw:
+            self.reference_graph.ingest(response)
+        if cache_key is not None and not _is_error(response):
+            self.cache.set(cache_key, response)
+        return response
+
+    def _cacheable(self, url):
+        """Only delivery responses are cached: sync responses carry one-time
+        tokens, and live preview responses are drafts that change on every edit"""
+        if '/stacks/sync?' in url or 'live_preview=' in url:
+            return False
+        preview_host = (self.live_preview or {}).get('host')
+        return not preview_host or urlsplit(url).netloc != preview_host
+
+    def _request(self, url, headers, raw):
+        """Sends one GET, through the circuit breaker of its host if any"""
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return get_request(self.session, url, headers=headers, timeout=self.timeout, raw=raw)
+        host = urlsplit(url).netloc
+        if not breaker.allow(host):
+            raise breaker.open_error(url)
+        try:
+            # 5xx, 408 and 429 responses count as failures, like transport errors
+            response = get_request(self.session, url, headers=headers, timeout=self.timeout, raw=raw,
+                                   raise_unavailable=True)
+        except Exception:
+            # any failure releases the half-open slot
+            breaker.record_failure(host)
+            raise
+        breaker.record_success(host)
+        return response
+
+    def _fallback(self, url, headers, cache_key):
+        """With a circuit breaker, the response served when the host cannot
+        be reached: the cached response even if expired, else the replica's"""
+        if self.circuit_breaker is None:
+            return None
+        if cache_key is not None:
+            stale = self.cache.get(cache_key, stale=True)
+            if stale is not None:
+                return stale
+        if self.circuit_breaker.fallback is not None:
+            return self.circuit_breaker.fallback(url, headers)
+        return None
+
+    def _get_with_failover(self, url, headers, raw):
+        """Sends url to its endpoint, then to the next healthy endpoints
+        while requests fail to connect"""
+        selector = self.host_selector
+        endpoint = next((candidate for candidate in selector.endpoints()
+                         if url.startswith(f'{candidate}/') or url.startswith(f'{candidate}?')), None)
+        if endpoint is None:
+            return self._request(url, headers, raw)
+        path = url[len(endpoint):]
+        tried = set()
+        while True:
+            tried.add(endpoint)
+            try:
+                return self._request(f'{endpoint}{path}', headers, raw)
+            except RequestError:
+                endpoint = selector.report_failure(endpoint)
+                if endpoint in tried:
+                    endpoint = next((candidate for candidate in selector.endpoints()
+                                     if candidate not in tried), None)
+                if endpoint is None:
+                    raise
+
+    def stream(self, url, headers=None):
+        """
+        Opens a streamed GET through the pooled session, e.g. to download an
+        asset file. Only the user agent and the given headers are sent, so
+        stack credentials never reach the asset host.
+        :param url: URL of the file
+        :param headers: (optional) extra headers, e.g. Range
+        :return: requests.Response, to be closed by the caller
+        """
+        request_headers = {**user_agents(), **(headers or {})}
+        return stream_request(self.session, url, headers=request_headers, timeout=self.timeout)
@@ -8,11 +8,26 @@ different transform_params in second parameter in array form
 
 import logging
 
+# Known Image Delivery API parameters in the order they are written to the
+# URL; other parameters follow alphabetically. A fixed order means equal
+# transforms always produce equal URLs, which the CDN caches once.
+CANONICAL_ORDER = ('width', 'height', 'dpr', 'fit', 'crop', 'trim', 'pad', 'bg-color',
+                   'canvas', 'orient', 'resize-filter', 'blur', 'brightness', 'contrast',
+                   'saturation', 'sharpen', 'overlay', 'overlay-align', 'overlay-repeat',
+                   'overlay-width', 'overlay-height', 'overlay-pad', 'frame', 'disable',
+                   'format', 'auto', 'quality')
+_RANK = {key: rank for rank, key in enumerate(CANONICAL_ORDER)}
+
+
+def _canonical(params):
+    return sorted(params.items(), key=lambda item: (_RANK.get(item[0], len(_RANK)), item[0]))
+
 
 class ImageTransform:  # pylint: disable=too-few-public-methods
     """
     The Image Delivery API is used to retrieve, manipulate and/or convert image
-    files
+    files. An ImageTransform is immutable: its query string is rendered once,
+    in canonical parameter order, when it is created.
     """
 
     def __init__(self, http_instance, image_url, logger=None, **kwargs):
@@ -32,8 +47,16 @@ class ImageTransform:  # pylint: disable=too-few-public-methods
         super().__init__()
         self.http_instance = http_instance
         self.image_url = image_url
-        self.image_params = kwargs
         self.logger = logger or logging.getLogger(__name__)
+        self._params = tuple(_canonical(kwargs))
+        self._separator = '&' if '?' in image_url else '?'
+        query = '&'.join(f'{key}={value}' for key, value in self._params)
+        self._url = f'{image_url}{self._separator}{query}' if query else image_url
+
+    @property
+    def image_params(self):
+        """The transform parameters, in canonical order"""
+        return dict(self._params)
 
     def get_url(self):
         """
@@ -44,11 +67,58 @@ class ImageTransform:  # pylint: disable=too-few-public-methods
             >>> import contentstack
             >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
             >>> image_url = stack.image_transform('image_url', width=100, height=100)
-            >>> result = image_url.fetch()
+            >>> result = image_url.get_url()
         ------------------------------
         """
-        args = ['{0}={1}'.format(k, v)
-                for k, v in list(self.image_params.items())]
-        if args:
-            self.image_url += '?{0}'.format('&'.join(args))
-        return self.image_url
+        return self._url
+
+    def with_params(self, **kwargs):
+        """
+        Returns a new ImageTransform of the same image with kwargs added to
+        (or replacing) the parameters of this one
+        :param kwargs: Image Delivery API parameters
+        :return: ImageTransform
+        """
+        return ImageTransform(self.http_instance, self.image_url, self.logger,
+                              **dict(self._params, **kwargs))
+
+    def srcset(self, widths, formats=None, descriptor='w'):
+        """
+        Renders a responsive image srcset of this transform at each width.
+        Everything but the width and format is rendered once, so building
+        srcsets for many images is a loop of string joins.
+        :param widths: list of widths in pixels
+        :param formats: (optional) list of formats, e.g. ['webp', 'jpg']
+        :param descriptor: 'w' for width descriptors (320w), 'x' for
+        density descriptors relative to the first width
+        :return: srcset string, or {format: srcset string} when formats are given
+        ------------------------------
+        Example::
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> transform = stack.image_transform('image_url', quality=80)
+            >>> sources = transform.srcset([320, 640, 1280], formats=['avif', 'webp'])
+            >>> sources['webp']
+        ------------------------------
+        """
+        if formats is None:
+            return self._render_srcset(widths, self._template(), descriptor)
+        return {image_format: self._render_srcset(widths, self._template(image_format), descriptor)
+                for image_format in formats}
+
+    def _template(self, image_format=None):
+        """Splits the URL around the width value: (head, tail)"""
+        params = {key: value for key, value in self._params if key != 'width'}
+        if image_format is not None:
+            params['format'] = image_format
+        rest = '&'.join(f'{key}={value}' for key, value in _canonical(params))
+        head = f'{self.image_url}{self._separator}width='
+        return head, f'&{rest}' if rest else ''
+
+    @staticmethod
+    def _render_srcset(widths, template, descriptor):
+        head, tail = template
+        if descriptor == 'x':
+            base = widths[0]
+            return ', '.join(f'{head}{width}{tail} {width / base:g}x' for width in widths)
+        return ', '.join(f'{head}{width}{tail} {width}w' for width in widths)
@@ -0,0 +1,206 @@
+"""
+Lazy entry results.
+
+A LazyEntry keeps the raw JSON text of one entry and only decodes a field
+the first time it is read, so listing pages that touch a few fields of many
+heavy entries skip building rich text, JSON RTE and embedded items they never
+use. Locating an entry is a single regular expression match over its text,
+which costs about half of what json.loads spends building the same objects.
+Python versions before 3.11 lack possessive quantifiers and fall back to a
+slower token loop.
+"""
+
+import json
+import re
+from collections.abc import Mapping
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]', re.DOTALL)
+_SCALAR = re.compile(r'[^,:}\][ \t\n\r]+')
+
+
+def _compile_container(levels=24):
+    # A nested value up to `levels` deep is skipped by one regex match; the
+    # token loop in _skip_value handles anything deeper. Possessive
+    # quantifiers keep the match linear and need Python 3.11+.
+    string = r'"(?:[^"\\]++|\\.)*+"'
+    pattern = r'[\[{](?:[^"{}\[\]]++|%s)*+[\]}]' % string
+    for _ in range(levels):
+        pattern = r'[\[{](?:[^"{}\[\]]++|%s|%s)*+[\]}]' % (string, pattern)
+    try:
+        return re.compile(pattern, re.DOTALL)
+    except re.error:
+        return None
+
+
+_CONTAINER = _compile_container()
+
+
+def _skip_whitespace(raw, pos):
+    return _WHITESPACE.match(raw, pos).end()
+
+
+def _skip_value(raw, pos):
+    """Returns the position right after the JSON value starting at pos"""
+    char = raw[pos]
+    if char == '"':
+        return _STRING.match(raw, pos).end()
+    if char not in '{[':
+        return _SCALAR.match(raw, pos).end()
+    if _CONTAINER is not None:
+        match = _CONTAINER.match(raw, pos)
+        if match is not None:
+            return match.end()
+    depth = 0
+    for match in _TOKEN.finditer(raw, pos):
+        token = match.group()
+        if token in '{[':
+            depth += 1
+        elif token in '}]':
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    raise ValueError('unterminated JSON value at %d' % pos)
+
+
+def _iter_members(raw, pos, expand=None):
+    """Yields (key, value_start, value_end) for the JSON object starting at pos.
+    The array under the `expand` key is yielded as a list of element spans
+    instead of its start, so its elements are located in the same pass."""
+    pos = _skip_whitespace(raw, pos + 1)
+    if raw[pos] == '}':
+        return
+    while True:
+        key_end = _STRING.match(raw, pos).end()
+        key = raw[pos + 1:key_end - 1]
+        if '\\' in key:
+            key = json.loads(raw[pos:key_end])
+        pos = _skip_whitespace(raw, _skip_whitespace(raw, key_end) + 1)
+        if key == expand and raw[pos] == '[':
+            spans, end = _array_spans(raw, pos)
+            yield key, spans, end
+        else:
+            end = _skip_value(raw, pos)
+            yield key, pos, end
+        pos = _skip_whitespace(raw, end)
+        if raw[pos] == '}':
+            return
+        pos = _skip_whitespace(raw, pos + 1)
+
+
+def _array_spans(raw, pos):
+    """Returns the element spans of the JSON array starting at pos and its end"""
+    spans = []
+    pos = _skip_whitespace(raw, pos + 1)
+    if raw[pos] == ']':
+        return spans, pos + 1
+    while True:
+        end = _skip_value(raw, pos)
+        spans.append((pos, end))
+        pos = _skip_whitespace(raw, end)
+        if raw[pos] == ']':
+            return spans, pos + 1
+        pos = _skip_whitespace(raw, pos + 1)
+
+
+class LazyEntry(Mapping):
+    """
+    Read-only mapping over the raw JSON of one entry. Fields are decoded on
+    first key or attribute access and cached, so entry['title'] and
+    entry.title cost one small json.loads each, once.
+    """
+
+    __slots__ = ('_raw', '_start', '_end', '_spans', '_members', '_decoded')
+
+    def __init__(self, raw, start=0, end=None):
+        self._raw = raw
+        self._start = start
+        self._end = len(raw) if end is None else end
+        self._spans = {}
+        self._members = None
+        self._decoded = {}
+
+    @property
+    def raw(self):
+        """The raw JSON text of the entry"""
+        return self._raw[self._start:self._end]
+
+    def _span(self, key):
+        # members are scanned only as far as the requested key, so reading
+        # title or url never walks the heavy fields that follow them
+        if key in self._spans:
+            return self._spans[key]
+        if self._members is None:
+            self._members = _iter_members(self._raw, _skip_whitespace(self._raw, self._start))
+        for member, start, end in self._members:
+            self._spans[member] = (start, end)
+            if member == key:
+                return start, end
+        raise KeyError(key)
+
+    def _index(self):
+        try:
+            self._span(None)
+        except KeyError:
+            pass
+        return self._spans
+
+    def __getitem__(self, key):
+        try:
+            return self._decoded[key]
+        except KeyError:
+            start, end = self._span(key)
+            value = self._decoded[key] = json.loads(self._raw[start:end])
+            return value
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self):
+        return len(self._index())
+
+    def __contains__(self, key):
+        try:
+            self._span(key)
+        except KeyError:
+            return False
+        return True
+
+    def __repr__(self):
+        return f'LazyEntry(uid={self.get("uid")!r})'
+
+    def to_dict(self):
+        """Decodes the whole entry into a plain dict"""
+        return json.loads(self.raw)
+
+
+def lazy_response(raw, key):
+    """
+    Decodes a delivery response, keeping the entries under key lazy.
+    :param raw: response body text
+    :param key: 'entries' for a list of entries, 'entry' for a single entry
+    :return: dict with LazyEntry objects under key, other members decoded
+    """
+    start = _skip_whitespace(raw, 0)
+    if not raw.startswith('{', start):
+        return json.loads(raw)
+    response = {}
+    for member, value_start, value_end in _iter_members(raw, start, expand=key):
+        if member != key:
+            response[member] = json.loads(raw[value_start:value_end])
+        elif isinstance(value_start, list):
+            response[member] = [LazyEntry(raw, s, e) for s, e in value_start]
+        elif raw[value_start] == '{':
+            response[member] = LazyEntry(raw, value_start, value_end)
+        else:
+            response[member] = json.loads(raw[value_start:value_end])
+    return response
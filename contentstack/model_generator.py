@@ -0,0 +1,234 @@
+"""
+Compact entry models generated from content type and global field schemas.
+
+generate_model() turns the schema returned by ContentType.fetch() or
+GlobalField.fetch() into a class with __slots__ (and nested classes for
+groups, modular blocks and global fields), so large in-memory catalogs hold
+one small object per entry instead of a dict repeating every key.
+"""
+
+import keyword
+
+from contentstack.error_messages import ErrorMessages
+
+SYSTEM_FIELDS = ('uid', 'locale', 'created_at', 'updated_at', 'created_by', 'updated_by',
+                 '_version', '_in_progress', 'ACL', 'tags', 'publish_details')
+
+
+def _slot_name(field_uid):
+    name = field_uid if field_uid.isidentifier() else ''.join(
+        char if char.isalnum() else '_' for char in field_uid)
+    if keyword.iskeyword(name) or not name.isidentifier():
+        name = f'{name}_'
+    return name
+
+
+def _class_name(uid):
+    return ''.join(part.capitalize() for part in _slot_name(uid).split('_') if part) or 'Model'
+
+
+class EntryModel:
+    """
+    Base class of generated models. Subclasses define __slots__ and a
+    conversion plan of (json key, slot, converter) built from the schema;
+    keys not described by the schema are kept in _extra. Nested classes of
+    groups, blocks and global fields are listed in _models by field uid.
+    """
+
+    __slots__ = ('_extra',)
+    _plan = ()
+    _keys = frozenset()
+    _models = {}
+    schema_uid = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Converts a CDA JSON entry (or group/block value) into a model instance
+        :param data: dict
+        :return: instance of the model
+        """
+        instance = cls.__new__(cls)
+        for key, slot, convert in cls._plan:
+            value = data.get(key)
+            if convert is not None and value is not None:
+                value = convert(value)
+            setattr(instance, slot, value)
+        if not cls._keys.issuperset(data):
+            instance._extra = {k: v for k, v in data.items() if k not in cls._keys}
+        else:
+            instance._extra = None
+        return instance
+
+    @classmethod
+    def from_list(cls, items):
+        """Converts a list of CDA JSON entries, e.g. response['entries']"""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
+    def to_dict(self):
+        """Converts the instance back into CDA JSON"""
+        result = {}
+        for key, slot, _ in self._plan:
+            value = getattr(self, slot)
+            if value is None:
+                continue
+            if isinstance(value, list):
+                value = [item.to_dict() if isinstance(item, (EntryModel, BlockModel)) else item
+                         for item in value]
+            elif isinstance(value, EntryModel):
+                value = value.to_dict()
+            result[key] = value
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def __repr__(self):
+        uid = getattr(self, 'uid', None)
+        return f'{type(self).__name__}(uid={uid!r})' if uid else f'{type(self).__name__}()'
+
+
+# attributes of every model, which a field slot must not shadow
+_RESERVED_NAMES = frozenset(dir(EntryModel))
+
+
+class BlockModel:
+    """
+    One item of a modular blocks field, i.e. {block_uid: {...}}. The block
+    type is available as block_uid and its fields as value.
+    """
+
+    __slots__ = ('block_uid', 'value')
+
+    def __init__(self, block_uid, value):
+        self.block_uid = block_uid
+        self.value = value
+
+    def to_dict(self):
+        value = self.value.to_dict() if isinstance(self.value, EntryModel) else self.value
+        return {self.block_uid: value}
+
+    def __repr__(self):
+        return f'BlockModel({self.block_uid!r}, {self.value!r})'
+
+
+def _many(convert):
+    def convert_many(value):
+        if isinstance(value, list):
+            return [convert(item) for item in value]
+        return convert(value)
+    return convert_many
+
+
+def _blocks_converter(block_models):
+    def convert(value):
+        blocks = []
+        for item in value:
+            for block_uid, block_value in item.items():
+                model = block_models.get(block_uid)
+                if model is not None and isinstance(block_value, dict):
+                    block_value = model.from_dict(block_value)
+                blocks.append(BlockModel(block_uid, block_value))
+        return blocks
+    return convert
+
+
+def _unique_slot(field_uid, taken):
+    """The slot of field_uid, suffixed with '_' while it collides with the
+    slot of another field (e.g. 'a-b' and 'a_b') or an EntryModel attribute
+    (e.g. 'schema_uid', 'to_dict')"""
+    slot = _slot_name(field_uid)
+    while slot in taken or slot in _RESERVED_NAMES:
+        slot = f'{slot}_'
+    taken.add(slot)
+    return slot
+
+
+def _build_class(name, uid, fields, global_fields, system_fields=()):
+    plan, models, taken = [], {}, set()
+    for key in system_fields:
+        plan.append((key, _unique_slot(key, taken), None))
+    keys = set(system_fields)
+    for field in fields:
+        field_uid = field.get('uid')
+        if not field_uid or field_uid in keys:
+            continue
+        keys.add(field_uid)
+        convert = _field_converter(name, field, global_fields, models)
+        if convert is not None and field.get('multiple') and field.get('data_type') != 'blocks':
+            convert = _many(convert)
+        plan.append((field_uid, _unique_slot(field_uid, taken), convert))
+    return type(name, (EntryModel,), {
+        '__slots__': tuple(slot for _, slot, _ in plan),
+        '_plan': tuple(plan),
+        '_keys': frozenset(key for key, _, _ in plan),
+        '_models': models,
+        'schema_uid': uid,
+    })
+
+
+def _field_converter(parent_name, field, global_fields, models):
+    data_type = field.get('data_type')
+    field_uid = field['uid']
+    nested_name = parent_name + _class_name(field_uid)
+    if data_type == 'group':
+        model = _build_class(nested_name, field_uid, field.get('schema', []), global_fields)
+        models[field_uid] = model
+        return model.from_dict
+    if data_type == 'global_field':
+        schema = field.get('schema')
+        if schema is None:
+            schema = (global_fields or {}).get(field.get('reference_to'))
+        if schema is None:
+            return None
+        model = _build_class(nested_name, field.get('reference_to', field_uid), schema, global_fields)
+        models[field_uid] = model
+        return model.from_dict
+    if data_type == 'blocks':
+        block_models = {}
+        for block in field.get('blocks', []):
+            schema = block.get('schema')
+            if schema is None:
+                schema = (global_fields or {}).get(block.get('reference_to'))
+            if schema is not None:
+                block_models[block['uid']] = _build_class(
+                    nested_name + _class_name(block['uid']), block['uid'], schema, global_fields)
+        models[field_uid] = block_models
+        return _blocks_converter(block_models)
+    return None
+
+
+def _unwrap(schema):
+    if isinstance(schema, dict):
+        for key in ('content_type', 'global_field'):
+            if isinstance(schema.get(key), dict):
+                return schema[key], key
+    return schema, None
+
+
+def generate_model(schema, name=None, global_fields=None):
+    """
+    Generates a __slots__ model class from a content type or global field schema
+    :param schema: response of ContentType.fetch() or GlobalField.fetch(),
+    or the content_type / global_field dict itself
+    :param name: (optional) class name, derived from the schema uid by default
+    :param global_fields: (optional) dict of global field uid to schema list,
+    used for global fields fetched without include_global_field_schema
+    :return: model class with from_dict(), from_list() and to_dict()
+    ------------------------------
+    Example:
+
+        >>> import contentstack
+        >>> from contentstack.model_generator import generate_model
+        >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+        >>> Product = generate_model(stack.content_type('product').fetch())
+        >>> products = Product.from_list(stack.content_type('product').query().find()['entries'])
+        >>> products[0].title
+    ------------------------------
+    """
+    schema, kind = _unwrap(schema)
+    if not isinstance(schema, dict) or not isinstance(schema.get('schema'), list):
+        raise ValueError(ErrorMessages.INVALID_SCHEMA)
+    uid = schema.get('uid', 'model')
+    system_fields = SYSTEM_FIELDS if kind != 'global_field' else ()
+    return _build_class(name or _class_name(uid), uid, schema['schema'], global_fields, system_fields)
@@ -0,0 +1,79 @@
+"""
+skip/limit pagination shared by the queries that page through a listing
+(AssetQuery, Taxonomy). Pages are yielded in order, either one request at a
+time or, once the first page has returned the total count, a window of
+concurrent requests at a time.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from contentstack.controller import RequestError
+from contentstack.error_messages import ErrorMessages
+
+MAX_PAGE_SIZE = 100
+
+
+def page_items(response, url, key):
+    """
+    Returns the items of one page of a listing, raising RequestError when
+    the response is an error or has no key, so that an error is never
+    taken for an empty page
+    :param response: decoded response of url
+    :param url: requested URL, for the error message
+    :param key: key of the listed items in the response, e.g. 'terms'
+    :return: list
+    """
+    if not isinstance(response, dict) or 'error_code' in response or \
+            not isinstance(response.get(key), list):
+        error = response if isinstance(response, dict) else {}
+        raise RequestError({
+            'error': ErrorMessages.INVALID_LISTING.format(
+                url=url, key=key, error=error.get('error_message', response)),
+            'error_code': error.get('error_code'),
+            'error_message': error.get('error_message')
+        })
+    return response[key]
+
+
+def iter_pages(fetch, key, page_size=MAX_PAGE_SIZE, skip=0, parallel=1, on_count=None):
+    """
+    Yields the non-empty pages (lists) of a skip/limit listing, in order
+    :param fetch: callable(skip, limit, include_count) returning the decoded
+    response of one page
+    :param key: key of the listed items in the response, e.g. 'assets'
+    :param page_size: items per request, at most 100
+    :param skip: items skipped before the first page
+    :param parallel: pages fetched at the same time. Above 1, the first page
+    asks for the total count and the following pages are requested
+    `parallel` at a time, so memory stays bounded to one window
+    :param on_count: (optional) callable receiving the total count returned
+    with the first page, which then always asks for it
+    :return: generator of lists
+    """
+    page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+    response = fetch(skip, page_size, parallel > 1 or on_count is not None) or {}
+    if on_count is not None and 'count' in response:
+        on_count(int(response['count']))
+    items = response.get(key) or []
+    if items:
+        yield items
+    if len(items) < page_size:
+        return
+    skip += page_size
+    if parallel > 1 and 'count' in response:
+        skips = range(skip, int(response['count']), page_size)
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            for start in range(0, len(skips), parallel):
+                window = skips[start:start + parallel]
+                for response in executor.map(lambda page_skip: fetch(page_skip, page_size, False), window):
+                    items = (response or {}).get(key) or []
+                    if items:
+                        yield items
+        return
+    while True:
+        items = (fetch(skip, page_size, False) or {}).get(key) or []
+        if items:
+            yield items
+        if len(items) < page_size:
+            return
+        skip += page_size
@@ -0,0 +1,92 @@
+"""
+Per-request live preview state.
+
+Stack.live_preview_query() stores the preview hash, entry and URL in the
+live_preview dict shared by every request of the Stack, so two editors
+previewing at once overwrite each other. A LivePreviewContext holds the same
+values for one request and is passed to Entry.fetch() / Query.find(), leaving
+the Stack, its headers and its connection pool untouched.
+"""
+
+# preview host used when neither the request nor the Stack names one; also
+# the fallback of Stack.live_preview_query()
+DEFAULT_PREVIEW_HOST = 'cdn.contentstack.io'
+PREVIEW_HEADER_KEYS = ('release_id', 'preview_timestamp')
+
+
+class LivePreviewContext:
+    """
+    Live preview parameters of a single request. Build one per incoming
+    preview request with Stack.preview_context(), or directly:
+
+        >>> import contentstack
+        >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment',
+        ...                            live_preview={'enable': True, 'preview_token': 'token'})
+        >>> context = stack.preview_context({'live_preview': 'hash',
+        ...                                  'content_type_uid': 'product', 'entry_uid': 'uid'})
+        >>> result = stack.content_type('product').entry('uid').fetch(preview=context)
+    """
+
+    __slots__ = ('content_type_uid', 'entry_uid', 'live_preview', 'host',
+                 'preview_token', 'management_token', 'release_id', 'preview_timestamp')
+
+    def __init__(self, content_type_uid, entry_uid=None, live_preview='init',
+                 host=DEFAULT_PREVIEW_HOST, preview_token=None, management_token=None,
+                 release_id=None, preview_timestamp=None):
+        self.content_type_uid = content_type_uid
+        self.entry_uid = entry_uid
+        self.live_preview = live_preview
+        self.host = host
+        self.preview_token = preview_token
+        self.management_token = management_token
+        self.release_id = release_id
+        self.preview_timestamp = preview_timestamp
+
+    @classmethod
+    def from_query(cls, live_preview, query):
+        """
+        Builds a context from the Stack live_preview config and the
+        live_preview_query of one request, without modifying either
+        :param live_preview: Stack live_preview dict (host and tokens)
+        :param query: dict with live_preview (hash), content_type_uid,
+        entry_uid and optionally release_id and preview_timestamp
+        :return: LivePreviewContext
+        """
+        live_preview = live_preview or {}
+        return cls(content_type_uid=query.get('content_type_uid'),
+                   entry_uid=query.get('entry_uid'),
+                   live_preview=query.get('live_preview', 'init'),
+                   host=query.get('host') or live_preview.get('host') or DEFAULT_PREVIEW_HOST,
+                   preview_token=query.get('preview_token', live_preview.get('preview_token')),
+                   management_token=query.get('management_token', live_preview.get('management_token')),
+                   release_id=query.get('release_id'),
+                   preview_timestamp=query.get('preview_timestamp'))
+
+    @property
+    def url(self):
+        """The preview host URL of the previewed entry, None without entry_uid"""
+        if not self.entry_uid:
+            return None
+        return f'https://{self.host}/v3/content_types/{self.content_type_uid}' \
+               f'/entries/{self.entry_uid}?live_preview={self.live_preview}'
+
+    def headers(self):
+        """Headers added to the delivery and preview requests of this context"""
+        headers = {}
+        if self.management_token:
+            headers['authorization'] = self.management_token
+        elif self.preview_token:
+            headers['preview_token'] = self.preview_token
+        for key in PREVIEW_HEADER_KEYS:
+            value = getattr(self, key)
+            if value is not None:
+                headers[key] = value
+        return headers
+
+    def applies_to(self, content_type_uid):
+        """True when the previewed entry belongs to content_type_uid"""
+        return self.content_type_uid == content_type_uid and self.url is not None
+
+    def __repr__(self):
+        return f'LivePreviewContext(content_type_uid={self.content_type_uid!r}, ' \
+               f'entry_uid={self.entry_uid!r})'
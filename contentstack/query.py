@@ -9,9 +9,10 @@ import warnings
 from contentstack.error_messages import ErrorMessages
 from urllib import parse
 
-from contentstack.basequery import BaseQuery
-from contentstack.deep_merge_lp import DeepMergeMixin
+from contentstack.basequery import BaseQuery, QueryOperation
+from contentstack.deep_merge_lp import deep_merge
 from contentstack.entryqueryable import EntryQueryable
+from contentstack.lazy_entry import lazy_response
 
 
 class QueryType(enum.Enum):
@@ -277,9 +278,12 @@ class Query(BaseQuery, EntryQueryable):
         self.query_params['include_metadata'] = 'true'
         return self
 
-    def find(self):
+    def find(self, preview=None):
         """It fetches the query result.
         List of :class:`Entry <contentstack.entry.Entry>` objects.
+        Arguments:
+            preview {LivePreviewContext} -- (optional) live preview context of
+            this request, used instead of the Stack live_preview state
         Raises:
             ValueError: If content_type_id is None
             ValueError: If content_type_id is empty or not str type
@@ -294,10 +298,12 @@ class Query(BaseQuery, EntryQueryable):
             >>> result = query.find()
         -------------------------------------
         """
-        return self.__execute_network_call()
+        return self.__execute_network_call(preview)
 
-    def find_one(self):
+    def find_one(self, preview=None):
         """It returns only one result.
+        Arguments:
+            preview {LivePreviewContext} -- (optional) live preview context of this request
         Returns:
             list[Entry] -- List of <contentstack.entry.Entry>
         -------------------------------------
@@ -310,11 +316,97 @@ class Query(BaseQuery, EntryQueryable):
         -------------------------------------
         """
         self.query_params["limit"] = 1
-        return self.__execute_network_call()
+        return self.__execute_network_call(preview)
+
+    def iter_pages(self, key: str = 'updated_at', page_size: int = 100):
+        """Walks every matching entry page by page using keyset (cursor)
+        pagination instead of skip.
 
-    def __execute_network_call(self):
+        Entries are ordered ascending by ``key`` then ``uid``, and each
+        following page is requested with the condition
+        ``key > last key OR (key == last key AND uid > last uid)``. Every
+        page therefore costs the same to serve however deep the walk goes,
+        and entries published during the walk do not shift pages. ``key``
+        and ``uid`` are added to any only() projection. The skip, ordering,
+        limit and projection of the query are restored once the walk ends.
+
+        The cursor relies on the CDA applying ``asc=key&asc=uid`` as a
+        two-key sort. Each page is checked against that order: were entries
+        sharing a ``key`` value returned in any other order, the walk would
+        skip some of them, so ValueError is raised instead.
+
+        Arguments:
+            key {str} -- stable field to order by (default: updated_at)
+            page_size {int} -- number of entries per request (max 100)
+        Yields:
+            list[dict] -- the entries of each page
+        Raises:
+            KeyError -- when the returned entries have no value for key
+            ValueError -- when the entries are not ordered by key then uid
+        -------------------------------------
+        [Example]:
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> query = stack.content_type('content_type_uid').query()
+            >>> for page in query.iter_pages(page_size=100):
+            >>>     for entry in page:
+            >>>         print(entry['uid'])
+        -------------------------------------
+        """
+        if not isinstance(key, str) or not key:
+            raise KeyError(ErrorMessages.INVALID_KEY)
+        saved_query_params = dict(self.query_params)
+        saved_entry_params = dict(self.entry_queryable_param)
+        base_parameters = dict(self.parameters)
+        base_query = self.query_params.get('query')
+        if not base_parameters and base_query:
+            base_parameters = json.loads(base_query) if isinstance(base_query, str) \
+                else dict(base_query)
+        for param in ('skip', 'asc', 'desc'):
+            self.query_params.pop(param, None)
+        # uid breaks ties between entries sharing the same key value
+        self.query_params['asc'] = key if key == 'uid' else [key, 'uid']
+        self.query_params['limit'] = str(page_size)
+        if 'only[BASE][]' in self.entry_queryable_param:
+            self._add_projection('only', (key, 'uid'), None)
+        cursor = None
+        try:
+            while True:
+                self.parameters = dict(base_parameters)
+                if cursor is not None:
+                    last_value, last_uid = cursor
+                    greater_than = QueryOperation.IS_GREATER_THAN.value
+                    bound = {'uid': {greater_than: last_uid}} if key == 'uid' else \
+                        {'$or': [{key: {greater_than: last_value}},
+                                 {key: last_value, 'uid': {greater_than: last_uid}}]}
+                    self.parameters = {'$and': [base_parameters, bound]} \
+                        if base_parameters else bound
+                response = self.__execute_network_call()
+                entries = response.get('entries', []) if isinstance(response, dict) else []
+                if not entries:
+                    return
+                last = entries[-1]
+                if len(entries) >= page_size and (last.get(key) is None or last.get('uid') is None):
+                    # without a cursor the same page would be requested forever
+                    raise KeyError(ErrorMessages.MISSING_PAGINATION_KEY.format(key=key))
+                if not _ascending(entries, key, cursor):
+                    raise ValueError(ErrorMessages.UNORDERED_PAGINATION.format(key=key))
+                yield entries
+                if len(entries) < page_size:
+                    return
+                cursor = last[key], last['uid']
+        finally:
+            self.parameters = dict(base_parameters) if base_query is None else {}
+            self.query_params.clear()
+            self.query_params.update(saved_query_params)
+            self.entry_queryable_param.clear()
+            self.entry_queryable_param.update(saved_entry_params)
+
+    def __execute_network_call(self, preview=None):
         if len(self.entry_queryable_param) > 0:
             self.query_params.update(self.entry_queryable_param)
+        if self.reference_resolution is not None:
+            self.query_params.pop('include[]', None)
         if len(self.parameters) > 0:
             self.query_params["query"] = json.dumps(self.parameters)
         if 'environment' in self.http_instance.headers:
@@ -322,8 +414,16 @@ class Query(BaseQuery, EntryQueryable):
 
         encoded_string = parse.urlencode(self.query_params, doseq=True)
         url = f'{self.base_url}?{encoded_string}'
-        self._impl_live_preview()
-        response = self.http_instance.get(url)
+        if preview is None and self._lazy_enabled(self.http_instance):
+            return lazy_response(self.http_instance.get(url, raw=True), 'entries')
+        if preview is not None:
+            preview_url = preview.url if preview.applies_to(self.content_type_uid) else None
+            response, lp_resp = self._get_with_preview(
+                self.http_instance, url, preview_url, preview.headers())
+        else:
+            response, lp_resp = self._get_with_preview(
+                self.http_instance, url, self._live_preview_url())
+            self._store_live_preview(lp_resp)
         # Ensure response is converted to dictionary
         if isinstance(response, str):
             try:
@@ -331,40 +431,80 @@ class Query(BaseQuery, EntryQueryable):
             except json.JSONDecodeError as e:
                 print(ErrorMessages.INVALID_JSON.format(error=str(e)))
                 return {"error": "Invalid JSON response"}  # Return an error dictionary
-
+        if isinstance(response, dict):
+            self._resolve_references(self.http_instance, response.get('entries'))
+
+        if preview is not None:
+            if lp_resp and 'error_code' not in lp_resp and 'entry' in lp_resp \
+                    and 'entries' in response:
+                return self._merge_preview(response, lp_resp['entry'])
+            return response
         if self.http_instance.live_preview is not None and 'errors' not in response:
             if 'entries' in response:
-                self.http_instance.live_preview['entry_response'] = response['entries'][0]  # Get first entry
+                self.http_instance.live_preview['entry_response'] = response['entries']
             else:
                 print(ErrorMessages.MISSING_ENTRIES_KEY)
                 return {"error": "'entries' key missing in response"}
-            return self._merged_response()
+            return self._merged_response(response)
         return response
 
-    def _impl_live_preview(self):
+    def _live_preview_url(self):
+        # sets the preview auth header and returns the preview url when the
+        # live preview targets this content type, None otherwise
         lv = self.http_instance.live_preview
         if lv is not None and lv.get('enable') and lv.get('content_type_uid') == self.content_type_uid:
-            url = lv['url']
             if lv.get('management_token'):
                 self.http_instance.headers['authorization'] = lv['management_token']
             else:
                 self.http_instance.headers['preview_token'] = lv['preview_token']
-            lp_resp = self.http_instance.get(url)
-
-            if lp_resp and 'error_code' not in lp_resp:
-                if 'entry' in lp_resp:
-                    self.http_instance.live_preview['lp_response'] = {'entry': lp_resp['entry']} # Extract entry
-                else:
-                    print(ErrorMessages.MISSING_ENTRY_KEY)
-            return None
+            return lv['url']
         return None
 
-    def _merged_response(self):
+    def _store_live_preview(self, lp_resp):
+        if lp_resp and 'error_code' not in lp_resp:
+            if 'entry' in lp_resp:
+                self.http_instance.live_preview['lp_response'] = {'entry': lp_resp['entry']} # Extract entry
+            else:
+                print(ErrorMessages.MISSING_ENTRY_KEY)
+
+    def _impl_live_preview(self):
+        url = self._live_preview_url()
+        if url is not None:
+            self._store_live_preview(self.http_instance.get(url))
+        return None
+
+    def _merged_response(self, response):
         live_preview = self.http_instance.live_preview
         if 'entry_response' in live_preview and 'lp_response' in live_preview:
-            entry_response = live_preview['entry_response']
-            lp_response = live_preview['lp_response']
-            merged_response = DeepMergeMixin(entry_response, lp_response)
-            return merged_response  # Return the merged dictionary
-
-        raise ValueError(ErrorMessages.MISSING_LIVE_PREVIEW_KEYS)
\ No newline at end of file
+            return self._merge_preview(response, live_preview['lp_response'].get('entry', {}))
+
+        raise ValueError(ErrorMessages.MISSING_LIVE_PREVIEW_KEYS)
+
+    @staticmethod
+    def _merge_preview(response, lp_entries):
+        """Merges the preview entries into the entries of the page by uid.
+        Returns a copy of response, other entries are kept as they are."""
+        if not isinstance(lp_entries, list):
+            lp_entries = [lp_entries]
+        entries = list(response['entries'])
+        positions = {entry.get('uid'): position for position, entry in enumerate(entries)
+                     if isinstance(entry, dict)}
+        for lp_entry in lp_entries:
+            position = positions.get(lp_entry.get('uid')) if isinstance(lp_entry, dict) else None
+            if position is not None:
+                entries[position] = deep_merge(entries[position], lp_entry)
+        return dict(response, entries=entries)
+
+
+def _ascending(entries, key, cursor):
+    """Whether entries follow cursor in ascending (key, uid) order, the order
+    iter_pages() asks for. Entries missing either value are not compared."""
+    previous = cursor
+    for entry in entries:
+        current = entry.get(key), entry.get('uid')
+        if None in current:
+            continue
+        if previous is not None and current <= previous:
+            return False
+        previous = current
+    return True
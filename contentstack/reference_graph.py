@@ -0,0 +1,145 @@
+"""
+Reverse-reference index built from delivery and sync responses.
+
+Maps every referenced uid (entry or asset) to the entries that refer to it, so
+cache invalidation and incremental static regeneration only need to touch the
+entries affected by a change.
+"""
+
+import logging
+import threading
+
+from contentstack.reference_resolver import is_reference
+
+REMOVED_ITEM_TYPES = ('entry_unpublished', 'entry_deleted')
+
+
+def _is_embedded_entry(value):
+    # inlined references (include[]) and assets carry _version, JSON RTE nodes do not
+    return isinstance(value, dict) and 'uid' in value and \
+        ('_content_type_uid' in value or '_version' in value)
+
+
+class ReferenceGraph:
+    """
+    Keeps, for each entry uid, the uids it references and, for each
+    referenced uid, the entries referring to it. Re-adding an entry replaces
+    its outgoing edges, so the index follows content changes incrementally.
+
+    Example::
+
+        >>> graph = stack.reference_graph
+        >>> graph.ingest(stack.content_type('blog').query().find())
+        >>> graph.referrers('author_uid')
+        {'blog_uid_1', 'blog_uid_2'}
+    """
+
+    def __init__(self, logger=None):
+        self._references = {}
+        self._referrers = {}
+        self._lock = threading.Lock()
+        self.logger = logger or logging.getLogger(__name__)
+
+    def ingest(self, response):
+        """
+        Adds the entries of a delivery response ('entry' or 'entries') or
+        applies the items of a sync response ('items') to the graph.
+        :param response: decoded response dict
+        :return: ReferenceGraph, so we can chain the call
+        """
+        if not isinstance(response, dict):
+            return self
+        if isinstance(response.get('entry'), dict):
+            self.add_entry(response['entry'])
+        for entry in response.get('entries') or []:
+            if isinstance(entry, dict):
+                self.add_entry(entry)
+        for item in response.get('items') or []:
+            item_type = item.get('type', '')
+            data = item.get('data') or {}
+            if not item_type.startswith('entry_') or 'uid' not in data:
+                continue
+            if item_type in REMOVED_ITEM_TYPES:
+                self.remove_entry(data['uid'])
+            else:
+                self.add_entry(data)
+        return self
+
+    def add_entry(self, entry):
+        """
+        Indexes the references of entry, replacing the ones known before.
+        Entries inlined through include[] are indexed as well.
+        :param entry: entry dict
+        """
+        pending = [entry]
+        while pending:
+            current = pending.pop()
+            referenced = set()
+            stack = list(current.values())
+            while stack:
+                value = stack.pop()
+                if is_reference(value) or _is_embedded_entry(value):
+                    referenced.add(value['uid'])
+                    if not is_reference(value):
+                        pending.append(value)
+                elif isinstance(value, dict):
+                    stack.extend(value.values())
+                elif isinstance(value, list):
+                    stack.extend(value)
+            self._set_references(current['uid'], referenced)
+
+    def remove_entry(self, uid):
+        """
+        Forgets the references of an unpublished or deleted entry. Entries
+        still referring to uid keep their edges.
+        :param uid: entry uid
+        """
+        self._set_references(uid, set())
+
+    def referrers(self, uid, transitive=False):
+        """
+        Returns the uids of the entries referring to uid
+        :param uid: entry or asset uid
+        :param transitive: when True, also follows referrers of referrers
+        :return: set of entry uids
+        """
+        with self._lock:
+            found = set(self._referrers.get(uid, ()))
+            if not transitive:
+                return found
+            pending = list(found)
+            while pending:
+                for referrer in self._referrers.get(pending.pop(), ()):
+                    if referrer not in found and referrer != uid:
+                        found.add(referrer)
+                        pending.append(referrer)
+            return found
+
+    def references(self, uid):
+        """
+        Returns the uids referenced by the entry uid
+        :param uid: entry uid
+        :return: set of uids
+        """
+        with self._lock:
+            return set(self._references.get(uid, ()))
+
+    def clear(self):
+        """Drops every indexed edge"""
+        with self._lock:
+            self._references.clear()
+            self._referrers.clear()
+
+    def _set_references(self, uid, referenced):
+        with self._lock:
+            previous = self._references.pop(uid, set())
+            for target in previous - referenced:
+                referrers = self._referrers.get(target)
+                if referrers is not None:
+                    referrers.discard(uid)
+                    if not referrers:
+                        del self._referrers[target]
+            for target in referenced - previous:
+                self._referrers.setdefault(target, set()).add(uid)
+            if referenced:
+                self._references[uid] = referenced
@@ -0,0 +1,103 @@
+"""
+Client-side reference resolution.
+
+Instead of asking the CDN to inline referenced entries with include[] (which
+repeats the same author/category object in every entry of a page), references
+are requested as uid stubs, the unique uids of a whole page are fetched once
+with batched $in queries and every stub is replaced by the shared entry.
+"""
+
+import logging
+
+from contentstack.basequery import QueryOperation
+
+REFERENCE_KEYS = frozenset(('uid', '_content_type_uid'))
+
+
+def is_reference(value):
+    """Returns True when value is an unresolved reference stub, i.e. a dict
+    carrying nothing but uid and _content_type_uid."""
+    return isinstance(value, dict) and len(value) == 2 and value.keys() == REFERENCE_KEYS
+
+
+class ReferenceResolver:
+    """
+    Resolves reference stubs of a list of entries, level by level, up to the
+    configured depth. Each referenced entry is fetched once and the same dict
+    is linked into every place that refers to it, so memory holds one copy
+    per referenced entry. Shared objects may form cycles, so resolved
+    entries should not be serialised back to JSON as is.
+    """
+
+    def __init__(self, http_instance, depth=1, batch_size=100, locale=None, logger=None):
+        self.http_instance = http_instance
+        self.depth = depth
+        self.batch_size = batch_size
+        self.locale = locale
+        self.resolved = {}
+        self.logger = logger or logging.getLogger(__name__)
+
+    def resolve(self, entries, field_uids=None):
+        """
+        Replaces the reference stubs found in entries with the referenced entries
+        :param entries: list of entry dicts, updated in place
+        :param field_uids: (optional) top-level reference fields to resolve,
+        all reference fields are resolved when None
+        :return: entries
+        """
+        level = entries
+        for _ in range(self.depth):
+            pending, slots = {}, []
+            shared = {id(value) for value in self.resolved.values()}
+            for entry in level:
+                self._collect(entry, field_uids, shared, pending, slots)
+            level = self._fetch(pending)
+            for container, key, uid in slots:
+                if uid in self.resolved:
+                    container[key] = self.resolved[uid]
+            field_uids = None
+            if not level:
+                break
+        return entries
+
+    def _collect(self, entry, field_uids, shared, pending, slots):
+        if field_uids:
+            stack = [(entry, key) for key in field_uids if key in entry]
+        else:
+            stack = [(entry, key) for key in entry]
+        while stack:
+            container, key = stack.pop()
+            value = container[key]
+            if is_reference(value):
+                uid = value['uid']
+                slots.append((container, key, uid))
+                if uid not in self.resolved:
+                    pending.setdefault(value['_content_type_uid'], {})[uid] = None
+            elif id(value) in shared:
+                continue
+            elif isinstance(value, dict):
+                stack.extend((value, child) for child in value)
+            elif isinstance(value, list):
+                stack.extend((value, index) for index in range(len(value)))
+
+    def _fetch(self, pending):
+        # local import: Query derives from EntryQueryable, which imports this module
+        from contentstack.query import Query
+        fetched = []
+        for content_type_uid, uids in pending.items():
+            uids = list(uids)
+            for start in range(0, len(uids), self.batch_size):
+                batch = uids[start:start + self.batch_size]
+                query = Query(self.http_instance, content_type_uid) \
+                    .where('uid', QueryOperation.INCLUDES, batch) \
+                    .limit(len(batch))
+                if self.locale is not None:
+                    query.locale(self.locale)
+                response = query.find()
+                if not isinstance(response, dict) or 'entries' not in response:
+                    self.logger.warning('could not resolve references of %s', content_type_uid)
+                    continue
+                for entry in response['entries']:
+                    self.resolved[entry['uid']] = entry
+                    fetched.append(entry)
+        return fetched
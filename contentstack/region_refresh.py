@@ -1,6 +1,7 @@
 """
 Utility to pull the latest regions.json from the Contentstack CDN and
-overwrite the bundled copy at contentstack/assets/regions.json.
+overwrite the bundled copy at contentstack/assets/regions.json, and to
+compile it into contentstack/_regions.py, the indexed table Endpoint imports.
 
 Exposed as a package-level function so tooling and CI pipelines can call it
 programmatically instead of invoking the script directly:
@@ -12,10 +13,10 @@ programmatically instead of invoking the script directly:
 import json
 import os
 import sys
-import urllib.request
 
 _REGIONS_URL = "https://artifacts.contentstack.com/regions.json"
 _ASSET_PATH = os.path.join(os.path.dirname(__file__), "assets", "regions.json")
+_MODULE_PATH = os.path.join(os.path.dirname(__file__), "_regions.py")
 
 
 def refresh_regions(
@@ -36,6 +37,8 @@ def refresh_regions(
     @returns The parsed regions dict on success
     @raises RuntimeError on download failure, invalid JSON, or unexpected schema
     """
+    import urllib.request  # only needed when refreshing
+
     dest = os.path.normpath(dest)
 
     if not silent:
@@ -64,9 +67,53 @@ def refresh_regions(
     if not silent:
         print(f"OK: Wrote {region_count} regions to {dest}")
 
+    if dest == os.path.normpath(_ASSET_PATH):
+        compile_regions(dest, silent=silent)
+
     return decoded
 
 
+def compile_regions(src: str = _ASSET_PATH, dest: str = _MODULE_PATH, *, silent: bool = False) -> str:
+    """
+    Compile regions.json into a Python module of dicts indexed by region id
+    and lowercased alias, so Endpoint resolves regions with an import and
+    two dict lookups instead of reading and scanning JSON at startup.
+
+    @param src    - regions.json to compile (defaults to the bundled copy)
+    @param dest   - Module path to write (defaults to contentstack/_regions.py)
+    @param silent - Suppress progress output when True
+    @returns The path of the written module
+    @raises RuntimeError when src cannot be read or has no 'regions' key
+    """
+    import pprint
+    from contentstack.endpoint import Endpoint
+
+    try:
+        with open(src, "r", encoding="utf-8") as fh:
+            decoded = json.load(fh)
+    except (OSError, json.JSONDecodeError) as exc:
+        raise RuntimeError(f"Could not read regions.json: {exc}") from exc
+
+    if not isinstance(decoded, dict) or "regions" not in decoded:
+        raise RuntimeError("regions.json does not contain a 'regions' key.")
+
+    index = Endpoint._index_regions(decoded["regions"])
+    source = (
+        '"""Region table compiled from regions.json by '
+        'contentstack.region_refresh.compile_regions. Do not edit."""\n\n'
+        f"BY_ID = {pprint.pformat(index['by_id'], width=100)}\n\n"
+        f"BY_ALIAS = {pprint.pformat(index['by_alias'], width=100)}\n"
+    )
+    temporary = f"{dest}.tmp"
+    with open(temporary, "w", encoding="utf-8") as fh:
+        fh.write(source)
+    os.replace(temporary, dest)
+
+    if not silent:
+        print(f"OK: Compiled {len(index['by_id'])} regions to {dest}")
+    return dest
+
+
 def _cli_main() -> int:
     """Entry point kept for backward compatibility with the scripts/ invocation."""
     try:
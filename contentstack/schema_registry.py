@@ -0,0 +1,226 @@
+"""
+Cache of the content type and global field schemas of a stack.
+
+Projection, model generation and validation need schemas on almost every
+request, while schemas rarely change. The registry loads all of them once,
+inlines global field schemas into the fields and blocks referring to them,
+and reloads when the TTL expires, when invalidated, or when a sync response
+reports a content type change.
+"""
+
+import copy
+import logging
+import threading
+import time
+from urllib import parse
+
+from contentstack.controller import RequestError
+from contentstack.error_messages import ErrorMessages
+from contentstack.pagination import page_items
+
+DEFAULT_TTL = 600
+PAGE_SIZE = 100
+
+
+class SchemaRegistry:
+    """
+    Content type and global field schemas of a stack, with global fields
+    resolved inline.
+
+    Example::
+
+        >>> import contentstack
+        >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+        >>> schema = stack.schemas.content_type('product')['schema']
+        >>> changed = stack.schemas.refresh()
+    """
+
+    def __init__(self, http_instance, ttl=DEFAULT_TTL, logger=None):
+        """
+        :param http_instance: HTTPSConnection of the stack
+        :param ttl: (optional) seconds before the schemas are reloaded, None to
+        keep them until refresh() or invalidate()
+        """
+        self.http_instance = http_instance
+        self.ttl = ttl
+        self.logger = logger or logging.getLogger(__name__)
+        self._content_types = {}
+        self._global_fields = {}
+        self._global_fields_source = {}
+        self._resolved = {}
+        self._loaded_at = None
+        self._lock = threading.RLock()
+
+    def content_type(self, content_type_uid):
+        """
+        :return: content type dict whose schema has global fields inlined
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if content_type_uid not in self._resolved:
+                raise KeyError(ErrorMessages.INVALID_CONTENT_TYPE_UID)
+            return self._resolved[content_type_uid]
+
+    def global_field(self, global_field_uid):
+        """
+        :return: global field dict whose schema has nested global fields inlined
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if global_field_uid not in self._global_fields:
+                raise KeyError(ErrorMessages.INVALID_UID)
+            return self._global_fields[global_field_uid]
+
+    def content_types(self):
+        """
+        :return: dict of content type uid to resolved content type
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return dict(self._resolved)
+
+    def global_field_schemas(self):
+        """
+        :return: dict of global field uid to schema list, as accepted by
+        contentstack.model_generator.generate_model(global_fields=...)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return {uid: field.get('schema', []) for uid, field in self._global_fields.items()}
+
+    def refresh(self):
+        """
+        Reloads every schema. Content types whose _version is unchanged and
+        whose global fields did not change keep their resolved copy.
+        :return: set of the uids (content types and global fields) that
+        were added, changed or removed
+        """
+        global_fields = self._fetch_all('global_fields')
+        content_types = self._fetch_all('content_types')
+        with self._lock:
+            changed = _changes(self._global_fields_source, global_fields)
+            # a global field nesting a changed one changes too
+            stale = set(changed)
+            while True:
+                nested = {uid for uid, field in global_fields.items() if uid not in stale
+                          and stale & _global_field_uids(field.get('schema', []))}
+                if not nested:
+                    break
+                stale |= nested
+            changed |= stale
+            changed |= _changes(self._content_types, content_types)
+            self._global_fields = {uid: self._resolve(field, global_fields, (uid,))
+                                   for uid, field in global_fields.items()}
+            self._global_fields_source = global_fields
+            resolved = {}
+            for uid, content_type in content_types.items():
+                previous = self._resolved.get(uid)
+                if previous is not None and uid not in changed and \
+                        not stale & _global_field_uids(content_type.get('schema', [])):
+                    resolved[uid] = previous
+                else:
+                    resolved[uid] = self._resolve(content_type, global_fields, ())
+            self._content_types = content_types
+            self._resolved = resolved
+            self._loaded_at = time.monotonic()
+        if changed:
+            self.logger.debug('schemas changed: %s', sorted(changed))
+        return changed
+
+    def invalidate(self):
+        """Makes the next lookup reload the schemas"""
+        with self._lock:
+            self._loaded_at = None
+
+    def observe_sync(self, response):
+        """
+        Invalidates the registry when a sync response carries content type
+        items (e.g. content_type_deleted) or entries of an unknown content type
+        :param response: decoded sync response
+        :return: True when the registry was invalidated
+        """
+        for item in (response or {}).get('items') or []:
+            item_type = item.get('type', '')
+            content_type_uid = item.get('content_type_uid')
+            if item_type.startswith('content_type_') or \
+                    (self._loaded_at is not None and content_type_uid is not None
+                     and content_type_uid not in self._content_types):
+                self.invalidate()
+                return True
+        return False
+
+    def _ensure_loaded(self):
+        if self._loaded_at is None or \
+                (self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl):
+            try:
+                self.refresh()
+            except RequestError as error:
+                if not self._resolved and not self._global_fields:
+                    raise
+                # the previous snapshot is served until a reload succeeds
+                self.logger.warning('schemas not reloaded: %s', error)
+
+    def _fetch_all(self, resource):
+        # an error response raises, so refresh() keeps the previous snapshot
+        items = {}
+        skip = 0
+        params = {}
+        environment = self.http_instance.headers.get('environment')
+        if environment:
+            params['environment'] = environment
+        while True:
+            query = parse.urlencode({**params, 'skip': skip, 'limit': PAGE_SIZE})
+            url = f'{self.http_instance.endpoint}/{resource}?{query}'
+            page = page_items(self.http_instance.get(url), url, resource)
+            items.update((item['uid'], item) for item in page)
+            if len(page) < PAGE_SIZE:
+                return items
+            skip += PAGE_SIZE
+
+    def _resolve(self, schema_owner, global_fields, resolving):
+        resolved = copy.deepcopy(schema_owner)
+        self._inline(resolved.get('schema', []), global_fields, resolving)
+        return resolved
+
+    def _inline(self, fields, global_fields, resolving):
+        for field in fields:
+            data_type = field.get('data_type')
+            if data_type == 'global_field':
+                self._inline_reference(field, global_fields, resolving)
+            elif data_type == 'group':
+                self._inline(field.get('schema', []), global_fields, resolving)
+            elif data_type == 'blocks':
+                for block in field.get('blocks', []):
+                    if 'schema' in block:
+                        self._inline(block['schema'], global_fields, resolving)
+                    else:
+                        self._inline_reference(block, global_fields, resolving)
+
+    def _inline_reference(self, field, global_fields, resolving):
+        reference = field.get('reference_to')
+        if 'schema' in field:
+            self._inline(field['schema'], global_fields, resolving)
+        elif reference in global_fields and reference not in resolving:
+            field['schema'] = copy.deepcopy(global_fields[reference].get('schema', []))
+            self._inline(field['schema'], global_fields, resolving + (reference,))
+
+
+def _changes(previous, current):
+    changed = set(previous.keys() ^ current.keys())
+    changed.update(uid for uid in previous.keys() & current.keys()
+                   if previous[uid].get('_version') != current[uid].get('_version')
+                   or previous[uid].get('updated_at') != current[uid].get('updated_at'))
+    return changed
+
+
+def _global_field_uids(fields):
+    uids = set()
+    for field in fields:
+        if field.get('reference_to') and field.get('data_type') == 'global_field':
+            uids.add(field['reference_to'])
+        uids |= _global_field_uids(field.get('schema', []))
+        for block in field.get('blocks', []):
+            if block.get('reference_to'):
+                uids.add(block['reference_to'])
+            uids |= _global_field_uids(block.get('schema', []))
+    return uids
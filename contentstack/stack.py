@@ -1,16 +1,23 @@
 import enum
 import logging
+import weakref
 from urllib import parse
-from urllib3.util import Retry
 from contentstack.error_messages import ErrorMessages
 
 from contentstack.asset import Asset
+from contentstack.cache import ResponseCache
+from contentstack.circuit_breaker import CircuitBreaker
 from contentstack.assetquery import AssetQuery
 from contentstack.contenttype import ContentType
 from contentstack.endpoint import Endpoint
 from contentstack.taxonomy import Taxonomy
+from contentstack.taxonomy_tree import TaxonomyTree
 from contentstack.globalfields import GlobalField
+from contentstack.host_selector import HostSelector
 from contentstack.https_connection import HTTPSConnection
+from contentstack.preview_context import DEFAULT_PREVIEW_HOST, LivePreviewContext
+from contentstack.reference_graph import ReferenceGraph
+from contentstack.schema_registry import SchemaRegistry
 from contentstack.image_transform import ImageTransform
 
 DEFAULT_HOST = 'cdn.contentstack.io'
@@ -42,12 +49,15 @@ class Stack:
                  version='v3',
                  region=ContentstackRegion.US,
                  timeout=30,
-                 retry_strategy=Retry(
-                     total=5, backoff_factor=0, status_forcelist=[408, 429]),
+                 retry_strategy=None,
                  live_preview=None,
                  branch=None,
                  early_access = None,
                  logger=None,
+                 track_references=False,
+                 cache=None,
+                 alternate_hosts=None,
+                 circuit_breaker=None,
                  ):
         """
         # Class that wraps the credentials of the authenticated user. Think of
@@ -73,7 +83,21 @@ class Stack:
             'edit_tags_type': object | str,
             }
         ```
-        :param retry_strategy: (optional) custom retry_strategy can be set.
+        :param track_references: (optional) when True, every delivery and sync
+        response is indexed in stack.reference_graph so stack.referrers(uid)
+        tells which entries embed a changed entry or asset
+        :param cache: (optional) True or a ResponseCache to cache delivery
+        responses in memory, keyed on URL, variant, branch and preview headers
+        :param alternate_hosts: (optional) hosts or regions that serve the same
+        stack, e.g. alternate CDN hostnames. The host of the stack region and
+        the alternates are probed in the background; requests go to the
+        fastest healthy one and fail over to the next on connection errors.
+        close() the stack, or use it as a context manager, to stop the probes
+        :param circuit_breaker: (optional) True or a CircuitBreaker: after
+        repeated failures requests to a host fail at once, or are answered
+        from the cache (expired entries included) until the host recovers
+        :param retry_strategy: (optional) custom retry_strategy can be set, by
+        default Retry(total=5, backoff_factor=0, status_forcelist=[408, 429]).
         Method to create retry_strategy: create object of Retry() and provide the
         required parameters like below
         **Example:**
@@ -98,19 +122,28 @@ class Stack:
         self.region = region
         self.timeout = timeout
         self.branch = branch
-        self.retry_strategy = retry_strategy
         self.live_preview = live_preview
         self.early_access = early_access
+        self.reference_graph = ReferenceGraph()
+        self.cache = ResponseCache() if cache is True else cache or None
+        self.taxonomy_trees = {}
         self._validate_stack()
         self._setup_headers()
         self._setup_live_preview()
+        host_selector = self._host_selector(alternate_hosts) if alternate_hosts else None
         self.http_instance = HTTPSConnection(
             endpoint=self.endpoint,
             headers=self.headers,
             timeout=self.timeout,
-            retry_strategy=self.retry_strategy,
-            live_preview=self.live_preview
+            retry_strategy=retry_strategy,
+            live_preview=self.live_preview,
+            reference_graph=self.reference_graph if track_references else None,
+            cache=self.cache,
+            host_selector=host_selector,
+            circuit_breaker=CircuitBreaker(logger=self.logger) if circuit_breaker is True
+            else circuit_breaker or None
         )
+        self.schemas = SchemaRegistry(self.http_instance, logger=self.logger)
 
     def _validate_stack(self):
         if self.api_key is None or self.api_key == '':
@@ -124,13 +157,50 @@ class Stack:
             try:
                 self.host = Endpoint.get_contentstack_endpoint(
                     self.region.value, 'contentDelivery', omit_https=True)
-            except (ValueError, RuntimeError):
+            except ValueError:
                 # Unknown/custom region — fall back to legacy pattern so
                 # code written before this feature was added continues to work.
+                # Missing region data raises RuntimeError rather than guessing
+                # a host that may not serve the region.
                 if self.region.value != 'us':
                     self.host = f'{self.region.value}-{DEFAULT_HOST}'
         self.endpoint = f'https://{self.host}/{self.version}'
 
+    def _host_selector(self, alternate_hosts):
+        hosts = [self.host]
+        for alternate in alternate_hosts:
+            value = alternate.value if isinstance(alternate, ContentstackRegion) else alternate
+            try:
+                hosts.append(Endpoint.get_contentstack_endpoint(
+                    value, 'contentDelivery', omit_https=True))
+            except (ValueError, RuntimeError):
+                hosts.append(value)  # not a region: a host name
+        selector = HostSelector(hosts, version=self.version, logger=self.logger, headers=self.headers).start()
+        # a stack dropped without close() still stops its probe thread
+        weakref.finalize(self, selector.stop, False)
+        return selector
+
+    def close(self):
+        """
+        Releases what the stack holds open: the background host probes of
+        alternate_hosts and the pooled HTTP connections. The stack can still
+        send requests afterwards, on new connections.
+
+        Example::
+
+            >>> import contentstack
+            >>> with contentstack.Stack('api_key', 'delivery_token', 'environment',
+            ...                         alternate_hosts=['eu']) as stack:
+            ...     result = stack.content_type('blog').query().find()
+        """
+        self.http_instance.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def _setup_headers(self):
         self.headers = {
             'api_key': self.api_key,
@@ -144,6 +214,20 @@ class Stack:
         if self.branch is not None:
             self.headers['branch'] = self.branch
    
+    @property
+    def retry_strategy(self):
+        """
+        The urllib3 Retry of the stack's connection pool; the default
+        Retry(**DEFAULT_RETRY) is created on first access, so that creating
+        a Stack does not load urllib3. Setting it applies to the next requests.
+        :return: urllib3 Retry
+        """
+        return self.http_instance.retry_strategy
+
+    @retry_strategy.setter
+    def retry_strategy(self, retry_strategy):
+        self.http_instance.retry_strategy = retry_strategy
+
     @property
     def get_api_key(self):
         """
@@ -208,7 +292,33 @@ class Stack:
         of your web or mobile property.
         :return: taxonomy
         """
-        return Taxonomy(self.http_instance)
+        return Taxonomy(self.http_instance, self.taxonomy_trees)
+
+    def taxonomy_tree(self, taxonomy_uid, refresh=False):
+        """
+        Loads the terms of a taxonomy once and keeps them on the stack, so
+        below/above conditions of stack.taxonomy() on that taxonomy expand
+        locally to $in term lists.
+        param taxonomy_uid: uid of the taxonomy
+        :param refresh: (optional) re-fetch the terms of a loaded taxonomy
+        :return: TaxonomyTree
+        -----------------------------
+        Example:
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> tree = stack.taxonomy_tree('color')
+            >>> tree.descendants('blue')
+        -----------------------------
+        """
+        if taxonomy_uid is None or not isinstance(taxonomy_uid, str):
+            raise KeyError(ErrorMessages.INVALID_UID)
+        tree = self.taxonomy_trees.get(taxonomy_uid)
+        if tree is None:
+            tree = TaxonomyTree(self.http_instance, taxonomy_uid, logger=self.logger).load()
+            self.taxonomy_trees[taxonomy_uid] = tree
+        elif refresh:
+            tree.load()
+        return tree
     
     def global_field(self, global_field_uid=None):
         """
@@ -253,6 +363,27 @@ class Stack:
         """
         return AssetQuery(self.http_instance)
 
+    def referrers(self, uid, transitive=False):
+        """
+        Returns the uids of the entries referring to the given entry or asset,
+        as indexed in reference_graph from the responses seen so far
+        (see track_references) or fed manually from a sync replica.
+        param uid: uid of the changed entry or asset
+        :param transitive: (optional) also include referrers of referrers
+        :return: set of entry uids
+        -----------------------------
+        Example:
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment',
+                        track_references=True)
+            >>> stack.content_type('blog').query().find()
+            >>> stale = stack.referrers('author_uid', transitive=True)
+        -----------------------------
+        """
+        if uid is None or not isinstance(uid, str):
+            raise KeyError(ErrorMessages.INVALID_UID)
+        return self.reference_graph.referrers(uid, transitive=transitive)
+
     def sync_init(self, content_type_uid=None, start_from=None, locale=None, publish_type=None):
         """
         Set init to ‘true’ if you want to sync all the published entries and assets.
@@ -341,7 +472,10 @@ class Stack:
         base_url = f'{self.http_instance.endpoint}/stacks/sync'
         self.sync_param['environment'] = self.http_instance.headers['environment']
         query = parse.urlencode(self.sync_param)
-        return self.http_instance.get(f'{base_url}?{query}')
+        response = self.http_instance.get(f'{base_url}?{query}')
+        if isinstance(response, dict):
+            self.schemas.observe_sync(response)
+        return response
 
     def image_transform(self, image_url, **kwargs):
         """
@@ -365,7 +499,7 @@ class Stack:
                 try:
                     mgmt_host = Endpoint.get_contentstack_endpoint(
                         self.region.value, 'contentManagement', omit_https=True)
-                except (ValueError, RuntimeError):
+                except ValueError:
                     region_prefix = "" if self.region.value == "us" else f"{self.region.value}-"
                     mgmt_host = f"{region_prefix}api.contentstack.io"
                 self.live_preview["host"] = mgmt_host
@@ -412,8 +546,34 @@ class Stack:
                 self._cal_url()
         return self
 
+    def preview_context(self, live_preview_query: dict):
+        """
+        Builds the live preview context of one request. Unlike
+        live_preview_query(), the Stack live_preview dict and headers are
+        left untouched, so one Stack can serve concurrent preview sessions.
+        :param live_preview_query: dict with live_preview (hash),
+        content_type_uid, entry_uid and optionally release_id and preview_timestamp
+        :return: LivePreviewContext, passed to Entry.fetch() or Query.find();
+        None when live preview is not enabled on the Stack, so requests get
+        the published content as with live_preview_query()
+        -----------------------------
+        Example::
+
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment',
+            ...                            live_preview={'enable': True, 'preview_token': 'token'})
+            >>> context = stack.preview_context(request_query_params)
+            >>> entry = stack.content_type('product').entry('uid').fetch(preview=context)
+        -----------------------------
+        """
+        if not isinstance(live_preview_query, dict):
+            raise KeyError(ErrorMessages.INVALID_KEY_OR_VALUE)
+        if not self.live_preview or not self.live_preview.get("enable"):
+            return None
+        return LivePreviewContext.from_query(self.live_preview, live_preview_query)
+
     def _cal_url(self):
-        host = self.live_preview.get("host", DEFAULT_HOST)
+        host = self.live_preview.get("host", DEFAULT_PREVIEW_HOST)
         content_type = self.live_preview.get("content_type_uid", "default_content_type")
         url = f"https://{host}/v3/content_types/{content_type}/entries"
         entry_uid = self.live_preview.get("entry_uid")
@@ -2,15 +2,19 @@ import json
 from urllib import parse
 from urllib.parse import quote
 
+from contentstack.pagination import iter_pages
 
 
 class Taxonomy:
-    def __init__(self, http_instance):
+    def __init__(self, http_instance, trees=None):
         self.http_instance = http_instance
         self._filters: dict = {}
+        self._trees = trees if trees is not None else {}
+        self._query_url = None
 
     def _add(self, field: str, condition: dict) -> "TaxonomyQuery":
         self._filters[field] = condition
+        self._query_url = None
         return self
 
     def in_(self, field: str, terms: list) -> "TaxonomyQuery":
@@ -25,21 +29,37 @@ class Taxonomy:
     def exists(self, field: str) -> "TaxonomyQuery":
         return self._add(field, {"$exists": True})
 
+    def _hierarchy(self, field: str, operator: str, term_uid: str, levels: int) -> "TaxonomyQuery":
+        # expanded locally to $in when the taxonomy tree was loaded on the stack
+        tree = self._trees.get(field.split('.', 1)[-1])
+        if tree is not None and term_uid in tree:
+            return self._add(field, {"$in": tree.expand(operator, term_uid, levels)})
+        return self._add(field, {operator: term_uid, "levels": levels})
+
     def equal_and_below(self, field: str, term_uid: str, levels: int = 10) -> "TaxonomyQuery":
-        cond = {"$eq_below": term_uid, "levels": levels}
-        return self._add(field, cond)
+        return self._hierarchy(field, "$eq_below", term_uid, levels)
 
     def below(self, field: str, term_uid: str, levels: int = 10) -> "TaxonomyQuery":
-        cond = {"$below": term_uid, "levels": levels}
-        return self._add(field, cond)
+        return self._hierarchy(field, "$below", term_uid, levels)
 
     def equal_and_above(self, field: str, term_uid: str, levels: int = 10) -> "TaxonomyQuery":
-        cond = {"$eq_above": term_uid, "levels": levels}
-        return self._add(field, cond)
+        return self._hierarchy(field, "$eq_above", term_uid, levels)
 
     def above(self, field: str, term_uid: str, levels: int = 10) -> "TaxonomyQuery":
-        cond = {"$above": term_uid, "levels": levels}
-        return self._add(field, cond)
+        return self._hierarchy(field, "$above", term_uid, levels)
+
+    def _url(self, params=None):
+        # the filters are serialized and encoded once, then reused by every page
+        if self._query_url is None:
+            environment = self.http_instance.headers['environment']
+            query_string = json.dumps(self._filters or {})
+            query_encoded = quote(query_string, safe='{}":,[]')  # preserves JSON characters
+            endpoint = self.http_instance.endpoint
+            self._query_url = f'{endpoint}/taxonomies/entries?environment={environment}&query={query_encoded}'
+        if not params:
+            return self._query_url
+        other_params = '&'.join(f'{k}={v}' for k, v in params.items())
+        return f'{self._query_url}&{other_params}'
 
     def find(self, params=None):
         """
@@ -47,18 +67,52 @@ class Taxonomy:
         """
         self.local_param = {}
         self.local_param['environment'] = self.http_instance.headers['environment']
+        return self.http_instance.get(self._url(params))
 
-        # Ensure query param is always present
-        query_string = json.dumps(self._filters or {})
-        query_encoded = quote(query_string, safe='{}":,[]')  # preserves JSON characters
-
-        # Build the base URL
-        endpoint = self.http_instance.endpoint
-        url = f'{endpoint}/taxonomies/entries?environment={self.local_param["environment"]}&query={query_encoded}'
-
-        # Append any additional params manually
-        if params:
-            other_params = '&'.join(f'{k}={v}' for k, v in params.items())
-            url += f'&{other_params}'
-        return self.http_instance.get(url)
+    def iter_entries(self, page_size=100, params=None):
+        """
+        Lazily yields every entry matching the taxonomy filters, fetching
+        the next page of skip/limit only when the previous one is consumed.
+        :param page_size: (optional) entries per request, at most 100
+        :param params: (optional) other query parameters, e.g. {'locale': 'fr-fr'}
+        :return: generator of entries
+        ------------------------------
+        Example::
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> for entry in stack.taxonomy().in_('taxonomies.color', ['blue']).iter_entries():
+            ...     print(entry['uid'])
+        ------------------------------
+        """
+        for page in self._iter_pages(page_size, params):
+            yield from page
 
+    def find_all(self, concurrency=8, page_size=100, params=None):
+        """
+        Fetches every entry matching the taxonomy filters. The first page
+        returns the total count; the remaining pages are fetched concurrently.
+        :param concurrency: (optional) number of pages fetched in parallel
+        :param page_size: (optional) entries per request, at most 100
+        :param params: (optional) other query parameters
+        :return: {'entries': [...], 'count': n}
+        """
+        entries, counts = [], []
+        for page in self._iter_pages(page_size, params, parallel=max(1, concurrency), on_count=counts.append):
+            entries.extend(page)
+        # the count of the server, which may differ from the entries fetched
+        # when entries are published or removed while paging
+        return {'entries': entries, 'count': counts[0] if counts else len(entries)}
+
+    def _iter_pages(self, page_size=100, params=None, parallel=1, on_count=None):
+        """Yields the pages of entries (lists), in order"""
+        params = dict(params or {})
+        params.pop('limit', None)
+        skip = int(params.pop('skip', 0))
+
+        def fetch(page_skip, limit, include_count):
+            page_params = dict(params, skip=page_skip, limit=limit)
+            if include_count:
+                page_params['include_count'] = 'true'
+            return self.http_instance.get(self._url(page_params))
+
+        return iter_pages(fetch, 'entries', page_size, skip, parallel, on_count)
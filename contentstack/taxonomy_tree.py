@@ -0,0 +1,192 @@
+"""
+Local copy of a taxonomy's term hierarchy.
+
+Hierarchy conditions ($below, $eq_below, $above, $eq_above) are otherwise
+resolved by the server on every request. With the terms loaded once, the
+ancestor and descendant sets are precomputed and a condition expands to a
+plain $in list, which is cached and reused by every later filter.
+"""
+
+import bisect
+import logging
+import threading
+from urllib import parse
+
+from contentstack.pagination import page_items
+
+DEFAULT_LEVELS = 10
+
+
+class TaxonomyTree:
+    """
+    Terms of one taxonomy with precomputed ancestors and descendants.
+
+    Example::
+
+        >>> import contentstack
+        >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+        >>> tree = stack.taxonomy_tree('color')
+        >>> tree.is_below('navy', 'blue')
+        True
+        >>> stack.taxonomy().below('taxonomies.color', 'blue').find()
+    """
+
+    def __init__(self, http_instance, taxonomy_uid, terms=None, logger=None):
+        self.http_instance = http_instance
+        self.taxonomy_uid = taxonomy_uid
+        self.logger = logger or logging.getLogger(__name__)
+        self._terms = {}
+        self._ancestors = {}
+        self._descendants = {}
+        self._expansions = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if terms:
+            self.update(terms)
+
+    def load(self, page_size=100):
+        """
+        Fetches every term of the taxonomy. Calling it again refreshes the
+        tree: only terms that were added, moved or deleted are applied, and
+        the expansion cache is kept when the hierarchy did not change. An
+        error response raises RequestError and leaves the tree unchanged.
+        :return: TaxonomyTree, so we can chain the call
+        """
+        terms = []
+        skip = 0
+        params = {}
+        environment = self.http_instance.headers.get('environment')
+        if environment:
+            params['environment'] = environment
+        while True:
+            query = parse.urlencode({**params, 'skip': skip, 'limit': page_size})
+            url = f'{self.http_instance.endpoint}/taxonomies/{self.taxonomy_uid}/terms?{query}'
+            page = page_items(self.http_instance.get(url), url, 'terms')
+            terms.extend(page)
+            if len(page) < page_size:
+                break
+            skip += page_size
+        with self._lock:
+            fetched = {term['uid'] for term in terms}
+            removed = [uid for uid in self._terms if uid not in fetched]
+        self.remove(*removed)
+        return self.update(terms)
+
+    def update(self, terms):
+        """
+        Adds or replaces terms (dicts with 'uid' and 'parent_uid')
+        :return: TaxonomyTree, so we can chain the call
+        """
+        with self._lock:
+            for term in terms:
+                previous = self._terms.get(term['uid'])
+                if previous is None or previous.get('parent_uid') != term.get('parent_uid'):
+                    self._dirty = True
+                self._terms[term['uid']] = term
+        return self
+
+    def remove(self, *term_uids):
+        """
+        Drops terms and, as the server does, the terms below them
+        :return: TaxonomyTree, so we can chain the call
+        """
+        if not term_uids:
+            return self
+        doomed = set()
+        for uid in term_uids:
+            if uid in self:
+                doomed.add(uid)
+                doomed.update(self.descendants(uid, levels=None))
+        with self._lock:
+            for uid in doomed:
+                self._terms.pop(uid, None)
+            self._dirty = True
+        return self
+
+    def ancestors(self, term_uid, levels=DEFAULT_LEVELS):
+        """
+        :return: uids of the terms above term_uid, nearest first
+        """
+        ancestors = self._index()[0].get(term_uid, ())
+        return list(ancestors if levels is None else ancestors[:levels])
+
+    def descendants(self, term_uid, levels=DEFAULT_LEVELS):
+        """
+        :return: uids of the terms below term_uid, nearest levels first
+        """
+        distances, uids = self._index()[1].get(term_uid, ((), ()))
+        if levels is None:
+            return list(uids)
+        return list(uids[:bisect.bisect_right(distances, levels)])
+
+    def is_below(self, term_uid, ancestor_uid, levels=None):
+        """
+        :return: True when ancestor_uid is above term_uid (within levels)
+        """
+        ancestors = self._index()[0].get(term_uid, ())
+        if levels is not None:
+            ancestors = ancestors[:levels]
+        return ancestor_uid in ancestors
+
+    def expand(self, operator, term_uid, levels=DEFAULT_LEVELS):
+        """
+        Resolves a hierarchy condition to the list of matching term uids
+        :param operator: '$below', '$eq_below', '$above' or '$eq_above'
+        :return: list of term uids, for an $in condition
+        """
+        self._index()  # a pending rebuild drops stale expansions
+        key = (operator, term_uid, levels)
+        expansion = self._expansions.get(key)
+        if expansion is None:
+            if operator in ('$below', '$eq_below'):
+                expansion = self.descendants(term_uid, levels)
+            elif operator in ('$above', '$eq_above'):
+                expansion = self.ancestors(term_uid, levels)
+            else:
+                raise ValueError(operator)
+            if operator.startswith('$eq_'):
+                expansion.insert(0, term_uid)
+            self._expansions[key] = expansion
+        return list(expansion)
+
+    def __contains__(self, term_uid):
+        return term_uid in self._terms
+
+    def __len__(self):
+        return len(self._terms)
+
+    def _index(self):
+        with self._lock:
+            if self._dirty:
+                self._rebuild()
+            return self._ancestors, self._descendants
+
+    def _rebuild(self):
+        terms = self._terms
+        ancestors = {}
+        for uid in terms:
+            chain, seen = [], {uid}
+            parent = terms[uid].get('parent_uid')
+            while parent in terms and parent not in seen:
+                chain.append(parent)
+                if parent in ancestors:
+                    # reuse the chain already computed for this ancestor
+                    chain.extend(ancestors[parent])
+                    break
+                seen.add(parent)
+                parent = terms[parent].get('parent_uid')
+            ancestors[uid] = tuple(chain)
+        descendants = {}
+        for uid, above in ancestors.items():
+            for distance, ancestor in enumerate(above, 1):
+                descendants.setdefault(ancestor, []).append((distance, uid))
+        self._ancestors = ancestors
+        self._descendants = {}
+        for uid, below in descendants.items():
+            below.sort()
+            # parallel tuples: distances for bisecting levels, term uids to return
+            self._descendants[uid] = (tuple(distance for distance, _ in below),
+                                      tuple(term for _, term in below))
+        self._expansions = {}
+        self._dirty = False
+        self.logger.debug('taxonomy %s indexed: %d terms', self.taxonomy_uid, len(self._terms))
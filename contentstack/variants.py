@@ -1,4 +1,6 @@
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from urllib import parse
 from contentstack.error_messages import ErrorMessages
 
@@ -105,4 +107,87 @@ class Variants(EntryQueryable):
             self._apply_variant_headers(headers)
             result = self.http_instance.get(url)
             self._cleanup_variant_headers()
-            return result
\ No newline at end of file
+            return result
+
+    def fetch_many(self, entry_uids, variant_uids=None, params=None, batch_size=100, concurrency=8):
+        """
+        Fetches the variants of many entries of the content type at once.
+        Entries are requested in batches with a uid $in query per variant,
+        and the batches run concurrently. Variant and branch headers are
+        sent with each request only, the shared headers are not modified.
+        :param entry_uids: list of entry uids
+        :param variant_uids: (optional) list of variants to fetch, each a
+        variant uid or a list of variant uids combined in one request.
+        Defaults to the variant_uid of this Variants
+        :param params: (optional) dict of query parameters, e.g. locale
+        :param batch_size: number of entry uids per request, at most 100
+        :param concurrency: number of requests run at the same time
+        :return: dict of entry uid to {variant uid: entry}. An entry that
+        could not be fetched maps to a dict with error_code and error_message
+        ------------------------------
+        Example:
+
+            >>> import contentstack
+            >>> stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+            >>> variants = stack.content_type('product').variants(['variant_1', 'variant_2'])
+            >>> result = variants.fetch_many(['entry_1', 'entry_2'], variant_uids=['variant_1', 'variant_2'])
+            >>> result['entry_1']['variant_2']
+        ------------------------------
+        """
+        if not entry_uids or not all(isinstance(uid, str) for uid in entry_uids):
+            raise ValueError(ErrorMessages.ENTRY_UID_REQUIRED)
+        if variant_uids is None:
+            variant_uids = [self.variant_uid]
+        # checked up front: a missing variant would otherwise fail in a worker
+        variant_keys = [_variant_key(variant) for variant in variant_uids or [None]]
+        entry_uids = list(dict.fromkeys(entry_uids))
+        batch_size = max(1, min(batch_size, 100))
+        batches = [entry_uids[i:i + batch_size] for i in range(0, len(entry_uids), batch_size)]
+        batch_requests = [(variant_key, batch) for variant_key in variant_keys for batch in batches]
+        result = {uid: {} for uid in entry_uids}
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            responses = executor.map(lambda request: self._fetch_batch(*request, params), batch_requests)
+            for (variant_key, batch), response in zip(batch_requests, responses):
+                entries = {}
+                if 'error_code' not in response:
+                    entries = {entry['uid']: entry for entry in response.get('entries', [])}
+                for uid in batch:
+                    if uid in entries:
+                        result[uid][variant_key] = entries[uid]
+                    elif 'error_code' in response:
+                        result[uid][variant_key] = response
+                    else:
+                        result[uid][variant_key] = {
+                            'error_code': 141,
+                            'error_message': ErrorMessages.VARIANT_ENTRY_NOT_FOUND.format(
+                                entry_uid=uid, variant_uid=variant_key)}
+        return result
+
+    def _fetch_batch(self, variant, batch, params=None):
+        """Fetches one batch of entries for variant, a comma separated variant key"""
+        query = dict(self.entry_param)
+        if params is not None:
+            query.update(params)
+        query['query'] = json.dumps({'uid': {'$in': batch}})
+        query['limit'] = len(batch)
+        url = f'{self.http_instance.endpoint}/content_types/{self.content_type_id}/entries' \
+              f'?{parse.urlencode(query, doseq=True)}'
+        headers = {'x-cs-variant-uid': variant}
+        if self.branch is not None:
+            headers['branch'] = self.branch
+        try:
+            return self.http_instance.get(url, headers=headers)
+        except Exception as error:  # one failed batch must not fail the others
+            details = error.args[0] if error.args and isinstance(error.args[0], dict) else {}
+            return {'error_code': details.get('error_code', 400),
+                    'error_message': details.get('error', str(error))}
+
+
+def _variant_key(variant):
+    """The x-cs-variant-uid value of a variant uid or list of variant uids"""
+    if isinstance(variant, str) and variant.strip():
+        return variant
+    if isinstance(variant, (list, tuple)) and variant and \
+            all(isinstance(uid, str) and uid.strip() for uid in variant):
+        return ','.join(variant)
+    raise ValueError(ErrorMessages.VARIANT_UID_REQUIRED)
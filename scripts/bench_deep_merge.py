@@ -0,0 +1,95 @@
+"""
+Benchmarks the live preview deep merge on large JSON RTE entries.
+
+Compares contentstack.deep_merge_lp.deep_merge with the previous recursive
+merge (a copy of the entry per merge, recursion per nested dict, arrays
+replaced wholesale).
+
+Run manually:
+    python scripts/bench_deep_merge.py [entries] [paragraphs]
+"""
+
+import copy
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from contentstack.deep_merge_lp import deep_merge  # noqa: E402
+
+
+def recursive_merge(source, destination):
+    """The merge used before deep_merge(), kept here as the baseline"""
+    if not isinstance(destination, dict) or not isinstance(source, dict):
+        return source
+    for key, value in source.items():
+        if isinstance(value, dict):
+            node = destination.setdefault(key, {})
+            recursive_merge(value, node)
+        else:
+            destination[key] = value
+    return destination
+
+
+def rte_document(uid, paragraphs):
+    children = [{'type': 'p', 'uid': f'{uid}_p{i}', 'attrs': {},
+                 'children': [{'text': f'Paragraph {i} of {uid}. ' * 8, 'bold': i % 2 == 0}]}
+                for i in range(paragraphs)]
+    return {'type': 'doc', 'uid': f'{uid}_doc', 'attrs': {}, 'children': children}
+
+
+def entry(uid, paragraphs, title):
+    return {
+        'uid': uid, 'title': title, 'locale': 'en-us', '_version': 3,
+        'seo': {'title': title, 'description': 'description', 'keywords': ['a', 'b']},
+        'body': rte_document(uid, paragraphs),
+        'sections': [{'hero': {'headline': f'{title} {i}', '_metadata': {'uid': f'{uid}_b{i}'}}}
+                     for i in range(20)],
+        'author': [{'uid': 'author_1', '_content_type_uid': 'author'}],
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    paragraphs = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    published = [entry(f'blt{i}', paragraphs, 'Published') for i in range(count)]
+    # preview entries are decoded from their own response, so share nothing
+    preview = copy.deepcopy(published)
+    for item in preview:
+        item['title'] = item['seo']['title'] = 'Draft'
+        item['body']['children'][0]['children'][0]['text'] = 'Edited'
+
+    def run_deep_merge():
+        for base, patch in zip(published, preview):
+            deep_merge(base, patch)
+
+    def run_recursive():
+        # the old merge shallow-copied each entry, then mutated nested dicts
+        for base, patch in zip(published, preview):
+            recursive_merge(patch, base.copy())
+
+    def run_recursive_copy():
+        # what the old merge costs when the delivery response must stay intact
+        for base, patch in zip(published, preview):
+            recursive_merge(patch, copy.deepcopy(base))
+
+    for name, func in (('deep_merge', run_deep_merge), ('recursive (in place)', run_recursive),
+                       ('recursive + deepcopy', run_recursive_copy)):
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f'{name:>22}: {seconds * 1000:8.2f} ms for {count} entries x {paragraphs} paragraphs')
+
+    depth = sys.getrecursionlimit() * 2
+    documents = []
+    for text in ('published', 'draft'):
+        document = node = {}
+        for _ in range(depth):
+            node['children'] = [{'uid': 'node', 'text': text}]
+            node = node['children'][0]
+        documents.append(document)
+    deep_merge(*documents)
+    print(f'{"deep_merge":>22}: merged a {depth} level document without recursion')
+
+
+if __name__ == '__main__':
+    main()
@@ -17,7 +17,8 @@ package = "contentstack"
 
 
 class BuildPyWithRegions(build_py):
-    """Fetch latest regions.json from Contentstack CDN before packaging."""
+    """Fetch latest regions.json from Contentstack CDN and compile it into
+    contentstack/_regions.py before packaging."""
 
     def run(self):
         sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,6 +27,12 @@ class BuildPyWithRegions(build_py):
             refresh_regions()
         except Exception as exc:
             print(f"WARNING: Could not refresh regions.json: {exc}", file=sys.stderr)
+            # offline builds compile the regions.json already in the tree
+            try:
+                from contentstack.region_refresh import compile_regions
+                compile_regions()
+            except Exception as exc:
+                print(f"WARNING: Could not compile regions: {exc}", file=sys.stderr)
         super().run()
 
 def get_version(package):
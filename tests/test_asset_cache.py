@@ -0,0 +1,119 @@
+"""
+Unit tests for the on-disk asset cache in contentstack.asset_cache
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from contentstack.asset import Asset
+from contentstack.asset_cache import AssetCache
+
+DATA = b'x' * 4096
+
+
+def _meta(uid, version=1):
+    return {'uid': uid, '_version': version, 'file_size': str(len(DATA)),
+            'url': f'https://images.contentstack.io/v3/assets/{uid}.bin'}
+
+
+@pytest.fixture
+def mock_http_instance():
+    def stream(url, headers=None):
+        time.sleep(0.05)
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {'ETag': '"v1"'}
+        response.iter_content.return_value = [DATA]
+        return response
+
+    mock = MagicMock()
+    mock.endpoint = 'https://cdn.contentstack.io/v3'
+    mock.headers = {'environment': 'test_env'}
+    mock.get = MagicMock(side_effect=lambda url: {'asset': _meta(url.split('/assets/')[1].split('?')[0])})
+    mock.stream = MagicMock(side_effect=stream)
+    return mock
+
+
+class TestAssetCache:
+    def test_repeat_downloads_are_served_locally(self, mock_http_instance, tmp_path):
+        cache = AssetCache(str(tmp_path / 'cache'))
+        first = Asset(mock_http_instance, 'blt1').download(str(tmp_path / 'a.bin'), cache=cache)
+        second = Asset(mock_http_instance, 'blt1').download(str(tmp_path / 'b.bin'), cache=cache)
+        assert (first['downloaded'], second['downloaded']) == (len(DATA), 0)
+        assert (tmp_path / 'b.bin').read_bytes() == DATA
+        assert mock_http_instance.stream.call_count == 1
+        assert mock_http_instance.get.call_count == 1  # hits skip the metadata fetch
+        with cache.open(Asset(mock_http_instance, 'blt1'), _meta('blt1')) as file:
+            assert file.read() == DATA
+        cache.store(Asset(mock_http_instance, 'blt1'), refresh=True)
+        assert mock_http_instance.get.call_count == 2
+
+    def test_new_versions_are_cached_separately(self, mock_http_instance, tmp_path):
+        cache = AssetCache(str(tmp_path))
+        cache.store(Asset(mock_http_instance, 'blt1'), _meta('blt1', 1))
+        cache.store(Asset(mock_http_instance, 'blt1'), _meta('blt1', 2))
+        assert cache.path('blt1', 1) != cache.path('blt1', 2)
+        assert mock_http_instance.stream.call_count == 2
+
+    def test_concurrent_workers_download_once(self, mock_http_instance, tmp_path):
+        cache = AssetCache(str(tmp_path))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda _: cache.store(Asset(mock_http_instance, 'blt1'), _meta('blt1')), range(4)))
+        assert len({path for path, _ in results}) == 1
+        assert sum(downloaded for _, downloaded in results) == len(DATA)
+        assert mock_http_instance.stream.call_count == 1
+
+    def test_least_recently_used_files_are_evicted(self, mock_http_instance, tmp_path):
+        cache = AssetCache(str(tmp_path), max_bytes=2 * len(DATA))
+        for uid in ('blt1', 'blt2'):
+            cache.store(Asset(mock_http_instance, uid), _meta(uid))
+        old = time.time() - 60
+        os.utime(cache.path('blt2', 1), (old, old))
+        cache.path('blt1', 1)
+        cache.store(Asset(mock_http_instance, 'blt3'), _meta('blt3'))
+        assert cache.path('blt2', 1) is None
+        assert cache.path('blt1', 1) is not None and cache.path('blt3', 1) is not None
+
+    def test_files_evicted_before_they_are_opened_are_fetched_again(self, mock_http_instance, tmp_path):
+        cache = AssetCache(str(tmp_path))
+        cache.store(Asset(mock_http_instance, 'blt1'), _meta('blt1'))
+        store = cache.store
+
+        def evicted_meanwhile(*args, **kwargs):
+            path, downloaded = store(*args, **kwargs)
+            if not downloaded:
+                os.remove(path)
+            return path, downloaded
+
+        with patch.object(cache, 'store', side_effect=evicted_meanwhile):
+            with cache.open(Asset(mock_http_instance, 'blt1')) as file:
+                assert file.read() == DATA
+        assert mock_http_instance.stream.call_count == 2
+
+    def test_lock_and_orphaned_part_files_are_removed(self, mock_http_instance, tmp_path):
+        cache = AssetCache(str(tmp_path))
+        path, _ = cache.store(Asset(mock_http_instance, 'blt1'), _meta('blt1'))
+        assert not os.path.exists(f'{path}.lock')
+        orphan = cache._file('blt2', 1)
+        os.makedirs(os.path.dirname(orphan), exist_ok=True)
+        for suffix in ('.part', '.part.validator', '.lock'):
+            with open(f'{orphan}{suffix}', 'wb') as file:
+                file.write(DATA)
+        cache.evict()
+        assert not any(os.path.exists(f'{orphan}{suffix}') for suffix in ('.part', '.part.validator', '.lock'))
+        assert cache.path('blt1', 1) == path
+
+    def test_misses_do_not_rescan_the_directory(self, mock_http_instance, tmp_path):
+        cache = AssetCache(str(tmp_path), max_bytes=2 * len(DATA))
+        with patch.object(cache, 'evict', wraps=cache.evict) as evict:
+            for uid in ('blt1', 'blt2'):
+                cache.store(Asset(mock_http_instance, uid), _meta(uid))
+            assert evict.call_count == 1  # counts the files once
+            cache.store(Asset(mock_http_instance, 'blt3'), _meta('blt3'))
+            assert evict.call_count == 2
+        assert cache._total == 2 * len(DATA)
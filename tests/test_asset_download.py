@@ -0,0 +1,161 @@
+"""
+Unit tests for Asset.download() streaming and resuming and for
+AssetQuery.download_all() mirroring
+"""
+
+import io
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from requests.exceptions import ChunkedEncodingError
+
+import contentstack
+from contentstack.asset import Asset
+from contentstack.assetquery import AssetQuery
+
+DATA = bytes(range(256)) * 40
+META = {'uid': 'blt_asset', 'url': 'https://images.contentstack.io/v3/assets/file.bin',
+        'file_size': str(len(DATA))}
+ETAG = '"v2"'
+
+
+def _response(status, body=b'', fail_after=None):
+    response = MagicMock()
+    response.status_code = status
+    response.reason = 'reason'
+    response.headers = {'ETag': ETAG}
+
+    def iter_content(chunk_size):
+        for start in range(0, len(body), chunk_size):
+            if fail_after is not None and start >= fail_after:
+                raise ChunkedEncodingError('connection dropped')
+            yield body[start:start + chunk_size]
+
+    response.iter_content.side_effect = iter_content
+    return response
+
+
+def _served(responses):
+    """Serves DATA with the queued statuses; a Range whose If-Range is not
+    the current ETag gets the whole file, as from a CDN"""
+    def stream(url, headers=None):
+        first = int(headers['Range'][6:-1]) if 'Range' in headers else 0
+        status, fail_after = responses.pop(0)
+        if status == 206 and headers.get('If-Range') != ETAG:
+            status = 200
+        return _response(status, DATA if status == 200 else DATA[first:], fail_after)
+    return stream
+
+
+@pytest.fixture
+def mock_http_instance():
+    mock = MagicMock()
+    mock.endpoint = 'https://cdn.contentstack.io/v3'
+    mock.headers = {'environment': 'test_env'}
+    mock.get = MagicMock(return_value={'asset': META})
+    return mock
+
+
+class TestAssetDownload:
+    def test_download_to_path(self, mock_http_instance, tmp_path):
+        mock_http_instance.stream = MagicMock(side_effect=_served([(200, None)]))
+        target = tmp_path / 'file.bin'
+        result = Asset(mock_http_instance, 'blt_asset').download(str(target), chunk_size=1000)
+        assert target.read_bytes() == DATA
+        assert result == {'uid': 'blt_asset', 'path': str(target), 'size': len(DATA),
+                          'downloaded': len(DATA)}
+        assert not (tmp_path / 'file.bin.part').exists()
+
+    def test_dropped_connection_resumes_with_range(self, mock_http_instance, tmp_path):
+        mock_http_instance.stream = MagicMock(side_effect=_served([(200, 3000), (206, None)]))
+        target = tmp_path / 'file.bin'
+        Asset(mock_http_instance, 'blt_asset').download(str(target), chunk_size=1000, asset=META)
+        assert target.read_bytes() == DATA
+        assert mock_http_instance.stream.call_args_list[1].kwargs['headers']['Range'] == 'bytes=3000-'
+        mock_http_instance.get.assert_not_called()
+
+    def test_partial_file_is_resumed_and_range_ignored_restarts(self, mock_http_instance, tmp_path):
+        target = tmp_path / 'file.bin'
+        (tmp_path / 'file.bin.part').write_bytes(DATA[:5000])
+        (tmp_path / 'file.bin.part.validator').write_text(ETAG)
+        mock_http_instance.stream = MagicMock(side_effect=_served([(206, None)]))
+        result = Asset(mock_http_instance, 'blt_asset').download(str(target), asset=META)
+        assert result['downloaded'] == len(DATA) - 5000
+        assert mock_http_instance.stream.call_args.kwargs['headers']['If-Range'] == ETAG
+        assert target.read_bytes() == DATA
+        assert not (tmp_path / 'file.bin.part.validator').exists()
+
+        (tmp_path / 'file.bin.part').write_bytes(b'stale')
+        mock_http_instance.stream = MagicMock(side_effect=_served([(200, None)]))
+        Asset(mock_http_instance, 'blt_asset').download(str(target), asset=META)
+        assert target.read_bytes() == DATA
+
+    def test_changed_file_is_downloaded_again_from_zero(self, mock_http_instance, tmp_path):
+        target = tmp_path / 'file.bin'
+        (tmp_path / 'file.bin.part').write_bytes(b'x' * len(DATA))
+        (tmp_path / 'file.bin.part.validator').write_text('"v1"')
+        mock_http_instance.stream = MagicMock(side_effect=_served([(206, None)]))
+        result = Asset(mock_http_instance, 'blt_asset').download(str(target), asset=META)
+        assert result['downloaded'] == len(DATA)
+        assert target.read_bytes() == DATA
+
+    def test_partial_file_without_validator_is_not_resumed(self, mock_http_instance, tmp_path):
+        target = tmp_path / 'file.bin'
+        (tmp_path / 'file.bin.part').write_bytes(b'x' * 5000)
+        mock_http_instance.stream = MagicMock(side_effect=_served([(200, None)]))
+        Asset(mock_http_instance, 'blt_asset').download(str(target), asset=META)
+        assert 'Range' not in mock_http_instance.stream.call_args.kwargs['headers']
+        assert target.read_bytes() == DATA
+
+    def test_size_is_verified(self, mock_http_instance):
+        mock_http_instance.stream = MagicMock(side_effect=_served([(200, None)]))
+        buffer = io.BytesIO()
+        with pytest.raises(ValueError):
+            Asset(mock_http_instance, 'blt_asset').download(buffer, asset=dict(META, file_size='10'))
+
+    def test_stream_uses_the_pooled_session_without_credentials(self):
+        stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+        with patch.object(stack.http_instance.session, 'get') as get:
+            stack.http_instance.stream(META['url'], headers={'Range': 'bytes=10-'})
+        headers = get.call_args.kwargs['headers']
+        assert get.call_args.kwargs['stream'] is True
+        assert headers['Range'] == 'bytes=10-'
+        assert 'access_token' not in headers and 'api_key' not in headers
+
+
+class TestAssetQueryDownloadAll:
+    @staticmethod
+    def _assets(count):
+        return [{'uid': f'blt{i}', '_version': 1, 'filename': f'file{i}.bin',
+                 'url': f'https://images.contentstack.io/v3/assets/file{i}.bin',
+                 'file_size': str(len(DATA))} for i in range(count)]
+
+    def _mock(self, mock_http_instance, assets):
+        def get(url):
+            query = parse_qs(urlparse(url).query)
+            skip, limit = int(query['skip'][0]), int(query['limit'][0])
+            return {'assets': assets[skip:skip + limit]}
+
+        def stream(url, headers=None):
+            if url.endswith('file3.bin'):
+                return _response(404)
+            return _response(200, DATA)
+
+        mock_http_instance.get = MagicMock(side_effect=get)
+        mock_http_instance.stream = MagicMock(side_effect=stream)
+
+    def test_download_all_mirrors_and_skips_unchanged(self, mock_http_instance, tmp_path):
+        assets = self._assets(5)
+        self._mock(mock_http_instance, assets)
+        report = AssetQuery(mock_http_instance).download_all(str(tmp_path), concurrency=2, page_size=2)
+        assert report['downloaded'] == 4
+        assert list(report['failed']) == ['blt3']
+        assert report['bytes'] == 4 * len(DATA)
+        assert (tmp_path / 'blt0' / 'file0.bin').read_bytes() == DATA
+        assert mock_http_instance.get.call_count == 3
+
+        assets[1]['_version'] = 2
+        report = AssetQuery(mock_http_instance).download_all(str(tmp_path), concurrency=2)
+        assert (report['downloaded'], report['skipped']) == (1, 3)
+        assert list(report['failed']) == ['blt3']
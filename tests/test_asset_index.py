@@ -0,0 +1,78 @@
+"""
+Unit tests for the local asset metadata index in contentstack.asset_index
+"""
+
+from unittest.mock import MagicMock
+
+from contentstack.asset_index import AssetIndex
+from contentstack.assetquery import AssetQuery
+from contentstack.basequery import QueryOperation
+
+ASSETS = [
+    {'uid': 'blt1', 'content_type': 'image/png', 'file_size': '6000000', 'tags': ['hero'],
+     'parent_uid': 'folder1', 'filename': 'banner.png', 'dimension': {'width': 2400}},
+    {'uid': 'blt2', 'content_type': 'image/png', 'file_size': '1200', 'tags': [],
+     'parent_uid': 'folder1', 'filename': 'icon.png', 'dimension': {'width': 32}},
+    {'uid': 'blt3', 'content_type': 'application/pdf', 'file_size': '9000000', 'tags': ['legal', 'hero'],
+     'parent_uid': None, 'filename': 'terms.pdf'},
+]
+
+
+def _uids(assets):
+    return sorted(asset['uid'] for asset in assets)
+
+
+class TestAssetIndex:
+    def test_indexed_and_scanned_conditions(self):
+        index = AssetIndex().ingest({'assets': ASSETS})
+        query = index.where('content_type', QueryOperation.EQUALS, 'image/png') \
+            .where('file_size', QueryOperation.IS_GREATER_THAN, 5_000_000)
+        assert _uids(query.find()) == ['blt1']
+        assert _uids(index.where('tags', QueryOperation.EQUALS, 'hero').find()) == ['blt1', 'blt3']
+        assert _uids(index.where('tags', QueryOperation.EXCLUDES, ['legal']).find()) == ['blt1', 'blt2']
+        assert _uids(index.where('filename', QueryOperation.MATCHES, r'\.png$').find()) == ['blt1', 'blt2']
+        assert _uids(index.where('dimension.width', QueryOperation.IS_LESS_THAN, 100).find()) == ['blt2']
+        assert index.where('parent_uid', QueryOperation.INCLUDES, ['folder1']).count() == 2
+        assert index.where('dimension', QueryOperation.EXISTS, False).count() == 1
+        assert index.where('file_size', QueryOperation.IS_LESS_THAN_OR_EQUAL, 1200).count() == 1
+
+    def test_index_sets_are_intersected_without_being_changed(self):
+        index = AssetIndex().ingest({'assets': ASSETS})
+        query = index.where('tags', QueryOperation.INCLUDES, ['hero']) \
+            .where('parent_uid', QueryOperation.EQUALS, 'folder1') \
+            .where('file_size', QueryOperation.IS_GREATER_THAN_OR_EQUAL, 1200)
+        assert _uids(query.find()) == ['blt1']
+        assert index._indexes['tags']['hero'] == {'blt1', 'blt3'}
+        assert index._indexes['parent_uid']['folder1'] == {'blt1', 'blt2'}
+        assert index.where('tags', QueryOperation.EQUALS, 'missing').count() == 0
+
+    def test_sync_items_update_the_indexes(self):
+        index = AssetIndex().ingest({'assets': ASSETS})
+        index.ingest({'items': [
+            {'type': 'asset_published', 'data': dict(ASSETS[1], content_type='image/webp', file_size='800')},
+            {'type': 'asset_deleted', 'data': {'uid': 'blt3'}},
+            {'type': 'entry_published', 'data': {'uid': 'entry1'}},
+        ]})
+        assert len(index) == 2
+        assert index.where('content_type', QueryOperation.EQUALS, 'image/png').count() == 1
+        assert _uids(index.where('file_size', QueryOperation.IS_LESS_THAN, 1000).find()) == ['blt2']
+        assert index.where('tags', QueryOperation.EQUALS, 'legal').count() == 0
+
+    def test_load_from_asset_query(self):
+        http_instance = MagicMock()
+        http_instance.endpoint = 'https://cdn.contentstack.io/v3'
+        http_instance.headers = {'environment': 'development'}
+        http_instance.get = MagicMock(side_effect=[{'assets': ASSETS[:2]}, {'assets': ASSETS[2:]}])
+        index = AssetIndex().load(AssetQuery(http_instance), page_size=2)
+        assert len(index) == 3
+        assert index.get('blt3')['filename'] == 'terms.pdf'
+
+    def test_sqlite_persistence(self, tmp_path):
+        path = str(tmp_path / 'assets.db')
+        index = AssetIndex(path).ingest({'assets': ASSETS})
+        index.remove('blt2')
+        index.close()
+        reopened = AssetIndex(path)
+        assert _uids(reopened.where('tags', QueryOperation.EQUALS, 'hero').find()) == ['blt1', 'blt3']
+        assert reopened.get('blt2') is None
+        reopened.close()
@@ -0,0 +1,66 @@
+"""
+Unit tests for AssetQuery URL building and iter_assets() pagination
+"""
+
+import json
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from contentstack.assetquery import AssetQuery
+from contentstack.basequery import QueryOperation
+
+ASSETS = [{'uid': f'blt{i}', 'file_size': str(i)} for i in range(250)]
+
+
+@pytest.fixture
+def mock_http_instance():
+    def get(url):
+        query = parse_qs(urlparse(url).query)
+        skip, limit = int(query['skip'][0]), int(query['limit'][0])
+        response = {'assets': ASSETS[skip:skip + limit]}
+        if 'include_count' in query:
+            response['count'] = len(ASSETS)
+        return response
+
+    mock = MagicMock()
+    mock.endpoint = 'https://cdn.contentstack.io/v3'
+    mock.headers = {'environment': 'development'}
+    mock.get = MagicMock(side_effect=get)
+    return mock
+
+
+def _queries(mock_http_instance):
+    return [parse_qs(urlparse(call.args[0]).query) for call in mock_http_instance.get.call_args_list]
+
+
+class TestAssetQueryIterAssets:
+    def test_environment_is_read_when_the_request_is_made(self, mock_http_instance):
+        query = AssetQuery(mock_http_instance)
+        assert query.base_url == 'https://cdn.contentstack.io/v3/assets'
+        query.environment('production').where('file_size', QueryOperation.IS_GREATER_THAN, 10)
+        mock_http_instance.get = MagicMock(return_value={'assets': []})
+        query.find()
+        params = _queries(mock_http_instance)[0]
+        assert params['environment'] == ['production']
+        assert json.loads(params['query'][0]) == {'file_size': {'$gt': 10}}
+        assert 'query' not in query.asset_query_params
+
+    def test_iter_assets_walks_every_page_lazily(self, mock_http_instance):
+        assets = AssetQuery(mock_http_instance).iter_assets(page_size=100, fields=['uid'])
+        assert next(assets)['uid'] == 'blt0'
+        assert mock_http_instance.get.call_count == 1
+        assert [asset['uid'] for asset in assets] == [asset['uid'] for asset in ASSETS[1:]]
+        params = _queries(mock_http_instance)
+        assert [query['skip'][0] for query in params] == ['0', '100', '200']
+        assert params[0]['only[BASE][]'] == ['uid']
+
+    def test_parallel_pages_are_yielded_in_order(self, mock_http_instance):
+        query = AssetQuery(mock_http_instance).locale('en-us')
+        uids = [asset['uid'] for asset in query.iter_assets(page_size=40, parallel=3)]
+        assert uids == [asset['uid'] for asset in ASSETS]
+        params = _queries(mock_http_instance)
+        assert 'include_count' in params[0]
+        assert len(params) == 7
+        assert query.asset_query_params == {'locale': 'en-us'}
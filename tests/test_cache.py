@@ -0,0 +1,123 @@
+"""
+Unit tests for the variant-aware response cache in contentstack.cache
+"""
+
+from unittest.mock import patch
+
+import contentstack
+from contentstack.cache import ResponseCache
+
+URL = 'https://cdn.contentstack.io/v3/content_types/faq/entries/blt1?environment=dev'
+
+
+class TestResponseCacheKey:
+    def test_only_content_headers_split_the_key(self):
+        key = ResponseCache.key(URL, {'api_key': 'key', 'User-Agent': 'a'})
+        assert key == ResponseCache.key(URL, {'api_key': 'key', 'User-Agent': 'b'})
+        assert key != ResponseCache.key(URL, {'api_key': 'other'})
+        assert key != ResponseCache.key(URL, {'api_key': 'key', 'branch': 'dev'})
+        preview_key = ResponseCache.key(URL, {'api_key': 'key', 'preview_token': 'secret'})
+        assert key != preview_key
+        assert 'secret' not in repr(preview_key)
+        token_key = ResponseCache.key(URL, {'api_key': 'key', 'access_token': 'delivery'})
+        assert token_key != ResponseCache.key(URL, {'api_key': 'key', 'access_token': 'other'})
+        assert 'delivery' not in repr(token_key)
+
+    def test_variant_combinations_are_normalized(self):
+        assert ResponseCache.key(URL, {'x-cs-variant-uid': 'b,a'}) == \
+            ResponseCache.key(URL, {'x-cs-variant-uid': 'a, b'})
+        assert ResponseCache.key(URL, {'x-cs-variant-uid': 'a'}) != ResponseCache.key(URL, {})
+
+
+class TestResponseCache:
+    def test_variant_ttls(self):
+        cache = ResponseCache(ttl=60, variant_ttl={'vip': 0, 'a,b': 5})
+        with patch('contentstack.cache.time.monotonic', return_value=100):
+            for variant in ('vip', 'b,a', None):
+                headers = {'x-cs-variant-uid': variant} if variant else {}
+                cache.set(ResponseCache.key(URL, headers), {'entry': {'uid': variant}})
+        assert len(cache) == 2
+        with patch('contentstack.cache.time.monotonic', return_value=110):
+            assert cache.get(ResponseCache.key(URL, {'x-cs-variant-uid': 'a,b'})) is None
+            assert cache.get(ResponseCache.key(URL, {})) == {'entry': {'uid': None}}
+
+    def test_variants_are_evicted_before_base_responses(self):
+        cache = ResponseCache(maxsize=3)
+        base = ResponseCache.key(URL, {})
+        cache.set(base, {'entry': 'base'})
+        hot = ResponseCache.key(URL, {'x-cs-variant-uid': 'hot'})
+        cache.set(hot, {'entry': 'hot'})
+        cold = ResponseCache.key(URL, {'x-cs-variant-uid': 'cold'})
+        cache.set(cold, {'entry': 'cold'})
+        cache.get(hot)
+        cache.set(ResponseCache.key(URL, {'x-cs-variant-uid': 'new'}), {'entry': 'new'})
+        assert cache.get(cold) is None
+        assert cache.get(base) == {'entry': 'base'}
+        assert cache.get(hot) == {'entry': 'hot'}
+
+    def test_a_new_variant_survives_a_cache_full_of_base_responses(self):
+        cache = ResponseCache(maxsize=2)
+        first, second = ResponseCache.key(URL, {}), ResponseCache.key(f'{URL}&locale=fr', {})
+        cache.set(first, {'entry': 'first'})
+        cache.set(second, {'entry': 'second'})
+        variant = ResponseCache.key(URL, {'x-cs-variant-uid': 'vip'})
+        cache.set(variant, {'entry': 'vip'})
+        assert cache.get(variant) == {'entry': 'vip'}
+        assert cache.get(first) is None
+        assert cache.get(second) == {'entry': 'second'}
+
+    def test_cached_responses_are_copies(self):
+        cache = ResponseCache()
+        key = ResponseCache.key(URL, {})
+        cache.set(key, {'entry': {'title': 'a'}})
+        cache.get(key)['entry']['title'] = 'changed'
+        assert cache.get(key) == {'entry': {'title': 'a'}}
+        cache.invalidate('/entries/blt1')
+        assert cache.get(key) is None
+
+
+class TestStackCache:
+    def test_stack_serves_repeated_requests_from_cache(self):
+        stack = contentstack.Stack('api_key', 'delivery_token', 'environment', cache=True)
+        with patch('contentstack.https_connection.get_request',
+                   side_effect=lambda session, url, headers, timeout, raw=False:
+                   {'entry': {'uid': 'blt1', 'variant': headers.get('x-cs-variant-uid')}}) as get:
+            for _ in range(2):
+                stack.content_type('faq').entry('blt1').fetch()
+                stack.content_type('faq').variants('variant_1').fetch_many(['blt1'])
+                response = stack.content_type('faq').entry('blt1').variants('variant_2').fetch()
+            error = {'error_code': 141, 'error_message': 'not found'}
+            get.side_effect = None
+            get.return_value = error
+            stack.content_type('faq').entry('missing').fetch()
+            stack.content_type('faq').entry('missing').fetch()
+        assert response['entry']['variant'] == 'variant_2'
+        assert get.call_count == 5
+        assert stack.cache.hits == 3
+
+    def test_live_preview_responses_are_never_cached(self):
+        stack = contentstack.Stack('api_key', 'delivery_token', 'environment', cache=True,
+                                   live_preview={'enable': True, 'preview_token': 'token'})
+        context = stack.preview_context({'live_preview': 'hash', 'content_type_uid': 'faq',
+                                         'entry_uid': 'blt1'})
+        drafts = iter(['first draft', 'second draft'])
+        with patch('contentstack.https_connection.get_request',
+                   side_effect=lambda session, url, headers, timeout, raw=False:
+                   {'entry': {'uid': 'blt1', 'title': next(drafts) if 'live_preview=' in url
+                              else 'published'}}) as get:
+            stack.content_type('faq').entry('blt1').fetch(preview=context)
+            response = stack.content_type('faq').entry('blt1').fetch(preview=context)
+        assert response[0]['title'] == 'second draft'
+        # the delivery response is served from the cache the second time
+        assert get.call_count == 3
+
+    def test_raw_error_bodies_are_not_cached(self):
+        stack = contentstack.Stack('api_key', 'delivery_token', 'environment', cache=True)
+        body = '{"error_message": "not found", "error_code": 141}'
+        with patch('contentstack.https_connection.get_request', return_value=body) as get:
+            stack.http_instance.get(URL, raw=True)
+            stack.http_instance.get(URL, raw=True)
+            get.return_value = '{"entry": {"uid": "blt1"}}'
+            stack.http_instance.get(URL, raw=True)
+            assert stack.http_instance.get(URL, raw=True) == '{"entry": {"uid": "blt1"}}'
+        assert get.call_count == 3
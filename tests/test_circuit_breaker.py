@@ -0,0 +1,129 @@
+"""
+Unit tests for the per-host circuit breaker in contentstack.circuit_breaker
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from contentstack.cache import ResponseCache
+from contentstack.circuit_breaker import CircuitBreaker, CircuitOpenError
+from contentstack.controller import RequestError
+from contentstack.https_connection import HTTPSConnection
+
+URL = 'https://cdn.contentstack.io/v3/content_types/blog/entries?environment=test'
+
+
+def _response(body, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.encoding = 'utf-8'
+    response.json.return_value = body
+    return response
+
+
+def _connection(breaker, cache=None):
+    connection = HTTPSConnection('https://cdn.contentstack.io/v3', {'environment': 'test'}, timeout=30,
+                                 retry_strategy=None, live_preview=None, cache=cache, circuit_breaker=breaker)
+    connection._session = MagicMock()
+    connection._session.get = MagicMock(side_effect=requests.exceptions.ConnectTimeout('timed out'))
+    return connection
+
+
+class TestCircuitBreaker:
+    def test_states(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        breaker.record_failure('a')
+        assert breaker.state('a') == 'closed'
+        breaker.record_failure('a')
+        assert breaker.state('a') == 'open' and not breaker.allow('a')
+        assert breaker.allow('b')
+        time.sleep(0.06)
+        assert breaker.allow('a')
+        assert not breaker.allow('a')  # one half-open request at a time
+        breaker.record_failure('a')
+        assert breaker.state('a') == 'open'
+        time.sleep(0.06)
+        assert breaker.allow('a')
+        breaker.record_success('a')
+        assert breaker.state('a') == 'closed'
+
+    def test_open_circuit_short_circuits_requests(self):
+        connection = _connection(CircuitBreaker(failure_threshold=3, reset_timeout=60))
+        for _ in range(3):
+            with pytest.raises(RequestError):
+                connection.get(URL)
+        assert connection._session.get.call_count == 3
+        with pytest.raises(CircuitOpenError):
+            connection.get(URL)
+        assert connection._session.get.call_count == 3
+
+    def test_stale_cache_and_replica_fallback(self):
+        cache = ResponseCache(ttl=0.01)
+        connection = _connection(CircuitBreaker(failure_threshold=1, reset_timeout=60), cache=cache)
+        connection._session.get = MagicMock(return_value=_response({'entries': [{'uid': 'blt1'}]}))
+        connection.get(URL)
+        time.sleep(0.02)
+        connection._session.get = MagicMock(side_effect=requests.exceptions.ConnectionError('down'))
+        assert connection.get(URL) == {'entries': [{'uid': 'blt1'}]}
+        assert connection.get(URL) == {'entries': [{'uid': 'blt1'}]}
+        assert connection._session.get.call_count == 1
+        replica = MagicMock(return_value={'entries': []})
+        connection.circuit_breaker.fallback = replica
+        assert connection.get(f'{URL}&locale=fr-fr') == {'entries': []}
+        assert replica.call_args.args[0] == f'{URL}&locale=fr-fr'
+
+    def test_half_open_success_closes_the_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.02)
+        connection = _connection(breaker)
+        with pytest.raises(RequestError):
+            connection.get(URL)
+        time.sleep(0.03)
+        connection._session.get = MagicMock(return_value=_response({'entries': []}))
+        assert connection.get(URL) == {'entries': []}
+        assert breaker.state('cdn.contentstack.io') == 'closed'
+
+    def test_non_json_response_releases_the_half_open_slot(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.02)
+        connection = _connection(breaker)
+        with pytest.raises(RequestError):
+            connection.get(URL)
+        time.sleep(0.03)
+        bad_gateway = _response(None)
+        bad_gateway.json.side_effect = ValueError('Expecting value: line 1 column 1 (char 0)')
+        connection._session.get = MagicMock(return_value=bad_gateway)
+        with pytest.raises(RequestError):
+            connection.get(URL)
+        assert breaker.state('cdn.contentstack.io') == 'open'
+        time.sleep(0.03)
+        connection._session.get = MagicMock(return_value=_response({'entries': []}))
+        assert connection.get(URL) == {'entries': []}
+        assert breaker.state('cdn.contentstack.io') == 'closed'
+
+    def test_unavailable_statuses_open_the_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        connection = _connection(breaker)
+        connection._session.get = MagicMock(return_value=_response({'error_message': 'down'}, 503))
+        for _ in range(2):
+            with pytest.raises(RequestError):
+                connection.get(URL)
+        assert breaker.state('cdn.contentstack.io') == 'open'
+        breaker.record_success('cdn.contentstack.io')
+        connection._session.get = MagicMock(return_value=_response({'error_code': 141}, 404))
+        assert connection.get(URL) == {'error_code': 141}
+        assert breaker.state('cdn.contentstack.io') == 'closed'
+
+    def test_non_json_error_page_serves_the_stale_cache(self):
+        cache = ResponseCache(ttl=0.01)
+        connection = _connection(CircuitBreaker(failure_threshold=5, reset_timeout=60), cache=cache)
+        connection._session.get = MagicMock(return_value=_response({'entries': [{'uid': 'blt1'}]}))
+        connection.get(URL)
+        time.sleep(0.02)
+        bad_gateway = _response(None, 502)
+        bad_gateway.json.side_effect = ValueError('Expecting value: line 1 column 1 (char 0)')
+        connection._session.get = MagicMock(return_value=bad_gateway)
+        assert connection.get(URL) == {'entries': [{'uid': 'blt1'}]}
+        bad_gateway.status_code = 200  # a decode failure alone is enough
+        assert connection.get(URL) == {'entries': [{'uid': 'blt1'}]}
@@ -0,0 +1,84 @@
+"""
+Unit tests for the live preview merge in contentstack.deep_merge_lp
+"""
+
+import copy
+import sys
+
+from contentstack.deep_merge_lp import DeepMergeMixin, deep_merge
+
+PUBLISHED = {
+    'uid': 'blt1', 'title': 'Published', 'url': '/page',
+    'seo': {'title': 'SEO', 'index': True},
+    'author': [{'uid': 'author_1', '_content_type_uid': 'author', 'name': 'Ann'},
+               {'uid': 'author_2', '_content_type_uid': 'author', 'name': 'Bob'}],
+    'sections': [{'hero': {'headline': 'Hello', 'image': 'a.png', '_metadata': {'uid': 'cs1'}}},
+                 {'hero': {'headline': 'Second', '_metadata': {'uid': 'cs2'}}}],
+    'tags': ['a', 'b'],
+}
+
+PREVIEW = {
+    'uid': 'blt1', 'title': 'Draft',
+    'seo': {'title': 'Draft SEO'},
+    'author': [{'uid': 'author_2', '_content_type_uid': 'author'}],
+    'sections': [{'hero': {'headline': 'Hello draft', '_metadata': {'uid': 'cs1'}}},
+                 {'banner': {'text': 'New', '_metadata': {'uid': 'cs3'}}}],
+    'tags': ['c'],
+}
+
+
+class TestDeepMerge:
+    def test_preview_values_win_and_arrays_merge_by_uid(self):
+        merged = deep_merge(PUBLISHED, PREVIEW)
+        assert merged['title'] == 'Draft'
+        assert merged['url'] == '/page'
+        assert merged['seo'] == {'title': 'Draft SEO', 'index': True}
+        assert merged['author'] == [{'uid': 'author_2', '_content_type_uid': 'author', 'name': 'Bob'}]
+        assert merged['sections'] == [
+            {'hero': {'headline': 'Hello draft', 'image': 'a.png', '_metadata': {'uid': 'cs1'}}},
+            {'banner': {'text': 'New', '_metadata': {'uid': 'cs3'}}}]
+        assert merged['tags'] == ['c']
+
+    def test_inputs_are_untouched_and_unchanged_paths_shared(self):
+        published, preview = copy.deepcopy(PUBLISHED), copy.deepcopy(PREVIEW)
+        merged = deep_merge(published, preview)
+        assert published == PUBLISHED and preview == PREVIEW
+        assert merged['url'] is published['url']
+        assert merged['sections'][1] is preview['sections'][1]
+        assert merged['seo'] is not published['seo']
+
+    def test_unchanged_subtrees_are_not_copied(self):
+        published = copy.deepcopy(PUBLISHED)
+        assert deep_merge(published, {'uid': 'blt1', 'seo': {'index': True}, 'tags': ['a', 'b']}) is published
+        authors = [{'uid': 'author_1'}, {'uid': 'author_2', 'name': 'Bob'}]
+        assert deep_merge(published, {'seo': {'title': 'SEO'}, 'author': authors}) is published
+        merged = deep_merge(published, {'sections': [{'hero': {'headline': 'Hello', '_metadata': {'uid': 'cs1'}}},
+                                                     {'hero': {'headline': 'New', '_metadata': {'uid': 'cs2'}}}]})
+        assert merged is not published and merged['seo'] is published['seo']
+        assert merged['sections'][0] is published['sections'][0]
+        assert merged['sections'][1]['hero']['headline'] == 'New'
+
+    def test_complete_preview_items_are_not_merged(self):
+        base = {'body': {'children': [{'uid': 'p1', 'type': 'p', 'text': 'old'}]}}
+        patch = {'body': {'children': [{'uid': 'p1', 'type': 'p', 'text': 'new'}]}}
+        merged = deep_merge(base, patch)
+        assert merged['body']['children'][0] is patch['body']['children'][0]
+
+    def test_deep_documents_do_not_recurse(self):
+        documents = []
+        for text in ('published', 'draft'):
+            document = node = {}
+            for _ in range(sys.getrecursionlimit() * 2):
+                node['children'] = [{'uid': 'node', 'type': 'p'}]
+                node = node['children'][0]
+            node['text'] = text
+            documents.append(document)
+        merged = node = deep_merge(*documents)
+        while 'children' in node:
+            node = node['children'][0]
+        assert node['text'] == 'draft'
+
+    def test_mixin_keeps_entries_without_preview(self):
+        merged = DeepMergeMixin([PUBLISHED, {'uid': 'blt2', 'title': 'Other'}], [PREVIEW]).to_dict()
+        assert [entry['title'] for entry in merged] == ['Draft', 'Other']
+        assert PUBLISHED['title'] == 'Published'
@@ -0,0 +1,112 @@
+"""
+Unit tests for latency-based host selection and failover, against local
+stand-in delivery servers
+"""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import contentstack
+from contentstack.host_selector import HostSelector
+from contentstack.https_connection import HTTPSConnection
+
+
+def _server(delay=0.0, status=200):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            time.sleep(delay)
+            self.server.requests.append((self.path, self.headers))
+            body = json.dumps({'entries': [], 'host': self.server.server_port}).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.requests = []
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    return server
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def servers():
+    started = [_server(delay=0.2), _server(), _server(status=401)]
+    yield started
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+def _host(server):
+    return f'http://127.0.0.1:{server.server_port}'
+
+
+class TestHostSelector:
+    def test_probe_routes_to_the_fastest_host(self, servers):
+        slow, fast = servers[:2]
+        selector = HostSelector([_host(slow), _host(fast)], probe_timeout=1)
+        assert selector.endpoint == f'{_host(slow)}/v3'
+        selector.probe()
+        assert selector.endpoints() == [f'{_host(fast)}/v3', f'{_host(slow)}/v3']
+
+    def test_unreachable_hosts_rank_last_until_they_answer(self, servers):
+        down = f'http://127.0.0.1:{_closed_port()}'
+        selector = HostSelector([down, _host(servers[0])], probe_timeout=1).probe()
+        assert selector.endpoint == f'{_host(servers[0])}/v3'
+        assert selector.endpoints()[-1] == f'{down}/v3'
+
+    def test_requests_fail_over_on_connection_errors(self, servers):
+        down = f'http://127.0.0.1:{_closed_port()}'
+        selector = HostSelector([down, _host(servers[1])])
+        connection = HTTPSConnection(f'{down}/v3', {'environment': 'test'}, timeout=1,
+                                     retry_strategy=None, live_preview=None, host_selector=selector)
+        assert connection.endpoint == f'{down}/v3'
+        response = connection.get(f'{connection.endpoint}/content_types/blog/entries?environment=test')
+        assert response['host'] == servers[1].server_port
+        assert connection.endpoint == f'{_host(servers[1])}/v3'
+
+    def test_background_probing(self, servers):
+        slow, fast = servers[:2]
+        selector = HostSelector([_host(slow), _host(fast)], probe_interval=0.05, probe_timeout=1).start()
+        try:
+            deadline = time.monotonic() + 5
+            while selector.endpoint != f'{_host(fast)}/v3' and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            selector.stop()
+        assert selector.endpoint == f'{_host(fast)}/v3'
+
+    def test_probes_need_a_2xx_answer_to_the_stack_request(self, servers):
+        _, fast, unauthorized = servers
+        selector = HostSelector([_host(unauthorized), _host(fast)], probe_timeout=1,
+                                headers={'api_key': 'key', 'access_token': 'token', 'environment': 'dev'})
+        assert selector.probe().endpoint == f'{_host(fast)}/v3'
+        path, headers = unauthorized.requests[0]
+        assert path == '/v3/content_types?limit=1'
+        assert (headers['api_key'], headers['access_token']) == ('key', 'token')
+        assert 'environment' not in headers
+
+    def test_closing_the_stack_stops_the_probes(self, servers):
+        stack = contentstack.Stack('api_key', 'delivery_token', 'environment',
+                                   alternate_hosts=[_host(servers[1])])
+        selector = stack.http_instance.host_selector
+        thread = selector._thread
+        assert thread.is_alive()
+        with stack:
+            pass
+        assert not thread.is_alive() and selector._thread is None
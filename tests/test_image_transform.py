@@ -0,0 +1,45 @@
+"""
+Unit tests for canonical URLs and srcset rendering in contentstack.image_transform
+"""
+
+from unittest.mock import MagicMock
+
+from contentstack.image_transform import ImageTransform
+
+IMAGE = 'https://images.contentstack.io/v3/assets/stack/asset/version/image.jpg'
+
+
+class TestImageTransform:
+    def test_get_url_does_not_mutate(self):
+        transform = ImageTransform(MagicMock(), IMAGE, width=100, format='webp')
+        assert transform.get_url() == transform.get_url() == f'{IMAGE}?width=100&format=webp'
+        assert transform.image_url == IMAGE
+
+    def test_parameters_are_in_canonical_order(self):
+        first = ImageTransform(MagicMock(), IMAGE, quality=80, zeta=1, alpha=2, height=50, width=100)
+        second = ImageTransform(MagicMock(), IMAGE, width=100, alpha=2, height=50, zeta=1, quality=80)
+        assert first.get_url() == second.get_url() == \
+            f'{IMAGE}?width=100&height=50&quality=80&alpha=2&zeta=1'
+
+    def test_existing_query_strings_are_extended(self):
+        transform = ImageTransform(MagicMock(), f'{IMAGE}?environment=dev', width=10)
+        assert transform.get_url() == f'{IMAGE}?environment=dev&width=10'
+        assert ImageTransform(MagicMock(), IMAGE).get_url() == IMAGE
+
+    def test_with_params_returns_a_new_transform(self):
+        transform = ImageTransform(MagicMock(), IMAGE, width=100)
+        wider = transform.with_params(width=200, auto='webp')
+        assert wider.get_url() == f'{IMAGE}?width=200&auto=webp'
+        assert transform.get_url() == f'{IMAGE}?width=100'
+
+    def test_srcset(self):
+        transform = ImageTransform(MagicMock(), IMAGE, width=999, quality=80)
+        assert transform.srcset([320, 640]) == \
+            f'{IMAGE}?width=320&quality=80 320w, {IMAGE}?width=640&quality=80 640w'
+        assert transform.srcset([320, 640], descriptor='x') == \
+            f'{IMAGE}?width=320&quality=80 1x, {IMAGE}?width=640&quality=80 2x'
+        sources = transform.srcset([320], formats=['avif', 'webp'])
+        assert sources == {'avif': f'{IMAGE}?width=320&format=avif&quality=80 320w',
+                           'webp': f'{IMAGE}?width=320&format=webp&quality=80 320w'}
+        assert sources['webp'].split(' ')[0] == \
+            transform.with_params(width=320, format='webp').get_url()
@@ -0,0 +1,51 @@
+"""
+Import-cost regression tests: "import contentstack" must stay cheap for
+short-lived processes such as serverless handlers.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# cumulative microseconds reported by -X importtime for the contentstack
+# package itself; eager imports of requests/urllib3 cost well over 100 ms
+IMPORT_BUDGET_US = int(os.environ.get('CONTENTSTACK_IMPORT_BUDGET_US', 50_000))
+HEAVY_MODULES = ('requests', 'urllib3', 'urllib.request')
+
+
+def _run(code):
+    return subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=PACKAGE_ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def _cumulative_us(stderr, module):
+    for line in stderr.splitlines():
+        parts = [part.strip() for part in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f'{module} missing from -X importtime output')
+
+
+class TestImportTime:
+    def test_import_does_not_load_http_stack(self):
+        result = _run(f'import sys, contentstack; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])')
+        assert result.stdout.strip() == '[]'
+
+    def test_import_cost_within_budget(self):
+        result = _run('import contentstack')
+        assert _cumulative_us(result.stderr, 'contentstack') < IMPORT_BUDGET_US
+
+    def test_stack_creation_defers_requests(self):
+        result = _run("import sys, contentstack; contentstack.Stack('api_key', 'token', 'env'); "
+                      "print('requests' in sys.modules)")
+        assert result.stdout.strip() == 'False'
+
+    def test_public_names_resolve_lazily(self):
+        import contentstack
+        assert contentstack.Stack.__module__ == 'contentstack.stack'
+        assert {'Entry', 'Asset', 'Stack', 'refresh_regions'} <= set(dir(contentstack))
+        with pytest.raises(AttributeError):
+            getattr(contentstack, 'missing_attribute')
@@ -0,0 +1,89 @@
+"""
+Unit tests for lazily decoded entries in contentstack.lazy_entry
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from contentstack import lazy_entry
+from contentstack.entry import Entry
+from contentstack.lazy_entry import LazyEntry, lazy_response
+from contentstack.query import Query
+
+ENTRIES = [
+    {'uid': 'blt1', 'title': 'First', 'url': '/first',
+     'body': {'type': 'doc', 'children': [{'type': 'p', 'children': [{'text': 'a "quoted" } ] text'}]}]},
+     'rich_text': '<p>{[</p>', 'count': 3, 'flag': True, 'nothing': None},
+    {'uid': 'blt2', 'title': 'Zweite é', 'url': '/second', 'tags': [], 'meta': {}},
+]
+
+
+@pytest.fixture
+def mock_http_instance():
+    mock = MagicMock()
+    mock.endpoint = "https://cdn.contentstack.io/v3"
+    mock.headers = {"environment": "test_env"}
+    mock.live_preview = None
+    mock.get = MagicMock(return_value=json.dumps({'entries': ENTRIES, 'count': 2}, indent=1))
+    return mock
+
+
+class TestLazyEntry:
+    def test_lazy_response_round_trips(self):
+        for indent in (None, 2):
+            response = lazy_response(json.dumps({'entries': ENTRIES, 'count': 2}, indent=indent), 'entries')
+            assert response['count'] == 2
+            assert [entry.to_dict() for entry in response['entries']] == ENTRIES
+            assert [dict(entry) for entry in response['entries']] == ENTRIES
+
+    def test_token_loop_fallback(self, monkeypatch):
+        monkeypatch.setattr(lazy_entry, '_CONTAINER', None)
+        response = lazy_response(json.dumps({'entries': ENTRIES, 'count': 2}), 'entries')
+        assert [entry.to_dict() for entry in response['entries']] == ENTRIES
+
+    def test_fields_decode_on_access_and_are_cached(self):
+        entry = lazy_response(json.dumps({'entries': ENTRIES}), 'entries')['entries'][0]
+        assert entry.title == 'First'
+        assert entry['url'] == '/first'
+        # heavy fields after url have not been scanned yet
+        assert 'body' not in entry._spans
+        assert entry.body is entry['body']
+        assert entry.body['children'][0]['children'][0]['text'] == 'a "quoted" } ] text'
+        assert 'missing' not in entry
+        with pytest.raises(AttributeError):
+            entry.missing
+
+    def test_single_entry_and_error_responses(self):
+        entry = lazy_response(json.dumps({'entry': ENTRIES[1]}), 'entry')['entry']
+        assert isinstance(entry, LazyEntry)
+        assert entry.title == 'Zweite é'
+        assert len(entry) == len(ENTRIES[1])
+        error = {'error_code': 141, 'error_message': 'not found'}
+        assert lazy_response(json.dumps(error), 'entry') == error
+
+    def test_deeply_nested_values(self):
+        value = 'leaf'
+        for _ in range(60):
+            value = {'child': [value]}
+        entry = lazy_response(json.dumps({'entry': {'uid': 'deep', 'tree': value, 'title': 'x'}}), 'entry')['entry']
+        assert entry.title == 'x'
+        assert entry.tree == value
+
+    def test_query_lazy_find(self, mock_http_instance):
+        result = Query(mock_http_instance, 'blog').lazy().find()
+        mock_http_instance.get.assert_called_once()
+        assert mock_http_instance.get.call_args[1] == {'raw': True}
+        assert [entry.url for entry in result['entries']] == ['/first', '/second']
+
+    def test_entry_lazy_fetch(self, mock_http_instance):
+        mock_http_instance.get.return_value = json.dumps({'entry': ENTRIES[0]})
+        result = Entry(mock_http_instance, 'blog', 'blt1').lazy().fetch()
+        assert result['entry'].title == 'First'
+
+    def test_live_preview_turns_lazy_off(self, mock_http_instance):
+        mock_http_instance.live_preview = {'enable': False}
+        mock_http_instance.get.return_value = {'entry': ENTRIES[0]}
+        entry = Entry(mock_http_instance, 'blog', 'blt1').lazy()
+        assert not entry._lazy_enabled(mock_http_instance)
@@ -0,0 +1,130 @@
+"""
+Unit tests for the concurrent live preview requests of Entry and Query and
+the per-request LivePreviewContext
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import contentstack
+from contentstack.entry import Entry
+from contentstack.preview_context import LivePreviewContext
+from contentstack.query import Query
+
+PREVIEW_URL = 'https://rest-preview.contentstack.com/v3/content_types/product/entries/blt1?live_preview=hash'
+
+
+@pytest.fixture
+def mock_http_instance():
+    barrier = threading.Barrier(2, timeout=5)
+    threads = {}
+
+    def get(url):
+        # both requests must be in flight together to pass the barrier
+        threads[url] = threading.get_ident()
+        barrier.wait()
+        if url == PREVIEW_URL:
+            return {'entry': {'uid': 'blt1', 'title': 'Draft', 'seo': {'title': 'Draft SEO'}}}
+        entry = {'uid': 'blt1', 'title': 'Published', 'seo': {'title': 'SEO', 'index': True}}
+        return {'entry': entry} if '/entries/blt1' in url else {'entries': [entry]}
+
+    mock = MagicMock()
+    mock.endpoint = 'https://cdn.contentstack.io/v3'
+    mock.headers = {'environment': 'test_env'}
+    mock.live_preview = {'enable': True, 'content_type_uid': 'product',
+                         'preview_token': 'preview_token', 'url': PREVIEW_URL}
+    mock.get = MagicMock(side_effect=get)
+    mock.threads = threads
+    return mock
+
+
+class TestConcurrentLivePreview:
+    def test_entry_fetch_runs_both_requests_concurrently(self, mock_http_instance):
+        response = Entry(mock_http_instance, 'product', 'blt1').fetch()
+        assert response == [{'uid': 'blt1', 'title': 'Draft',
+                             'seo': {'title': 'Draft SEO', 'index': True}}]
+        assert len(set(mock_http_instance.threads.values())) == 2
+        assert mock_http_instance.headers['preview_token'] == 'preview_token'
+
+    def test_query_find_runs_both_requests_concurrently(self, mock_http_instance):
+        response = Query(mock_http_instance, 'product').find()
+        assert response['entries'][0]['title'] == 'Draft'
+        assert mock_http_instance.get.call_count == 2
+
+    def test_query_merges_preview_into_the_whole_page(self, mock_http_instance):
+        page = {'entries': [{'uid': f'blt{i}', 'title': 'Published'} for i in range(3)], 'count': 3}
+        mock_http_instance.get = MagicMock(side_effect=lambda url: (
+            {'entry': {'uid': 'blt1', 'title': 'Draft'}} if url == PREVIEW_URL else page))
+        response = Query(mock_http_instance, 'product').find()
+        assert [entry['title'] for entry in response['entries']] == ['Published', 'Draft', 'Published']
+        assert response['count'] == 3
+        assert page['entries'][1]['title'] == 'Published'
+
+    def test_other_content_types_skip_the_preview_request(self, mock_http_instance):
+        mock_http_instance.live_preview['content_type_uid'] = 'blog'
+        mock_http_instance.get = MagicMock(return_value={'entry': {'uid': 'blt1'}})
+        entry = Entry(mock_http_instance, 'product', 'blt1')
+        assert entry._live_preview_url() is None
+        assert entry._get_with_preview(mock_http_instance, 'url') == ({'entry': {'uid': 'blt1'}}, None)
+        mock_http_instance.get.assert_called_once_with('url')
+
+
+class TestLivePreviewContext:
+    @staticmethod
+    def _get_request(session, url, headers, timeout, raw=False):
+        if 'live_preview=' in url:
+            entry_uid = url.split('/entries/')[1].split('?')[0]
+            return {'entry': {'uid': entry_uid, 'title': f'Draft {entry_uid}',
+                              'token': headers.get('preview_token')}}
+        entry_uid = url.split('/entries/')[1].split('?')[0]
+        return {'entry': {'uid': entry_uid, 'title': 'Published', 'url': f'/{entry_uid}'}}
+
+    def test_contexts_leave_stack_state_untouched(self):
+        stack = contentstack.Stack('api_key', 'delivery_token', 'environment',
+                                   live_preview={'enable': True, 'preview_token': 'token',
+                                                 'host': 'rest-preview.contentstack.com'})
+        live_preview = dict(stack.live_preview)
+        headers = dict(stack.headers)
+        contexts = [stack.preview_context({'live_preview': f'hash_{uid}', 'content_type_uid': 'product',
+                                           'entry_uid': uid, 'release_id': 'rel'})
+                    for uid in ('blt1', 'blt2')]
+        with patch('contentstack.https_connection.get_request', side_effect=self._get_request) as get:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(
+                    lambda context: stack.content_type('product').entry(context.entry_uid)
+                    .fetch(preview=context), contexts))
+        assert [result[0]['title'] for result in results] == ['Draft blt1', 'Draft blt2']
+        assert results[1][0]['url'] == '/blt2'
+        assert results[0][0]['token'] == 'token'
+        assert all(call.kwargs['headers']['release_id'] == 'rel' for call in get.call_args_list)
+        assert stack.live_preview == live_preview
+        assert 'release_id' not in stack.headers
+        assert {key: stack.headers[key] for key in headers} == headers
+
+    def test_context_url_and_headers(self):
+        context = LivePreviewContext.from_query(
+            {'host': 'api.contentstack.io', 'management_token': 'management'},
+            {'live_preview': 'hash', 'content_type_uid': 'blog', 'entry_uid': 'blt1'})
+        assert context.url == 'https://api.contentstack.io/v3/content_types/blog/entries/blt1?live_preview=hash'
+        assert context.headers() == {'authorization': 'management'}
+        assert context.applies_to('blog') and not context.applies_to('product')
+
+    def test_context_defaults_and_disabled_live_preview(self):
+        context = LivePreviewContext.from_query({}, {'content_type_uid': 'blog', 'entry_uid': 'blt1'})
+        assert context.url == 'https://cdn.contentstack.io/v3/content_types/blog/entries/blt1?live_preview=init'
+        query = {'live_preview': 'hash', 'content_type_uid': 'blog', 'entry_uid': 'blt1'}
+        for live_preview in (None, {'enable': False, 'preview_token': 'token'}):
+            stack = contentstack.Stack('api_key', 'delivery_token', 'environment', live_preview=live_preview)
+            assert stack.preview_context(query) is None
+
+    def test_query_find_with_context(self, mock_http_instance):
+        mock_http_instance.live_preview = None
+        context = LivePreviewContext('product', 'blt1', 'hash', host='rest-preview.contentstack.com')
+        mock_http_instance.get = MagicMock(side_effect=lambda url, headers=None: (
+            {'entry': {'uid': 'blt1', 'title': 'Draft'}} if 'live_preview=' in url
+            else {'entries': [{'uid': 'blt1', 'title': 'Published'}]}))
+        response = Query(mock_http_instance, 'product').find(preview=context)
+        assert response == {'entries': [{'uid': 'blt1', 'title': 'Draft'}]}
@@ -0,0 +1,114 @@
+"""
+Unit tests for schema-generated entry models in contentstack.model_generator
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from contentstack.contenttype import ContentType
+from contentstack.globalfields import GlobalField
+from contentstack.model_generator import BlockModel, EntryModel, generate_model
+
+SEO_SCHEMA = [
+    {'uid': 'meta_title', 'data_type': 'text'},
+    {'uid': 'meta_description', 'data_type': 'text'},
+]
+
+PRODUCT = {'content_type': {'uid': 'product', 'title': 'Product', 'schema': [
+    {'uid': 'title', 'data_type': 'text'},
+    {'uid': 'url', 'data_type': 'text'},
+    {'uid': 'price', 'data_type': 'number'},
+    {'uid': 'class', 'data_type': 'text'},
+    {'uid': 'dimensions', 'data_type': 'group', 'multiple': False, 'schema': [
+        {'uid': 'width', 'data_type': 'number'},
+        {'uid': 'height', 'data_type': 'number'},
+    ]},
+    {'uid': 'variants', 'data_type': 'group', 'multiple': True, 'schema': [
+        {'uid': 'sku', 'data_type': 'text'},
+    ]},
+    {'uid': 'seo', 'data_type': 'global_field', 'reference_to': 'seo', 'schema': SEO_SCHEMA},
+    {'uid': 'sections', 'data_type': 'blocks', 'multiple': True, 'blocks': [
+        {'uid': 'hero', 'title': 'Hero', 'schema': [{'uid': 'headline', 'data_type': 'text'}]},
+        {'uid': 'banner', 'title': 'Banner', 'reference_to': 'seo'},
+    ]},
+]}}
+
+ENTRY = {
+    'uid': 'blt1', 'locale': 'en-us', '_version': 2, 'title': 'Phone', 'url': '/phone',
+    'price': 10, 'class': 'A', 'dimensions': {'width': 1, 'height': 2},
+    'variants': [{'sku': 'a'}, {'sku': 'b'}],
+    'seo': {'meta_title': 'Phone', 'meta_description': 'A phone'},
+    'sections': [{'hero': {'headline': 'Hi'}}, {'banner': {'meta_title': 'B'}}, {'unknown': {'x': 1}}],
+    'custom_key': 'kept',
+}
+
+
+class TestModelGenerator:
+    def test_generated_model_converts_and_round_trips(self):
+        product_model = generate_model(PRODUCT)
+        product = product_model.from_dict(ENTRY)
+        assert type(product).__name__ == 'Product'
+        assert product.title == 'Phone'
+        assert product.class_ == 'A'
+        assert product.dimensions.height == 2
+        assert [variant.sku for variant in product.variants] == ['a', 'b']
+        assert product.seo.meta_title == 'Phone'
+        assert isinstance(product.sections[0], BlockModel)
+        assert product.sections[0].value.headline == 'Hi'
+        assert product.sections[2].value == {'x': 1}
+        assert product.to_dict() == ENTRY
+
+    def test_instances_have_no_dict(self):
+        product = generate_model(PRODUCT).from_dict(ENTRY)
+        assert not hasattr(product, '__dict__')
+        assert sys.getsizeof(product) < sys.getsizeof(dict(ENTRY))
+        with pytest.raises(AttributeError):
+            product.not_a_field = 1
+
+    def test_nested_models_are_listed(self):
+        product_model = generate_model(PRODUCT)
+        assert issubclass(product_model._models['dimensions'], EntryModel)
+        assert set(product_model._models['sections']) == {'hero'}
+
+    def test_global_field_schemas_can_be_supplied(self):
+        product_model = generate_model(PRODUCT, global_fields={'seo': SEO_SCHEMA})
+        product = product_model.from_dict(ENTRY)
+        assert product.sections[1].value.meta_title == 'B'
+
+    def test_missing_fields_are_none(self):
+        product = generate_model(PRODUCT).from_list([{'uid': 'blt2', 'title': 'Bare'}])[0]
+        assert product.price is None
+        assert product._extra is None
+        assert product.to_dict() == {'uid': 'blt2', 'title': 'Bare'}
+
+    def test_colliding_slot_names_are_suffixed(self):
+        model = generate_model({'content_type': {'uid': 'page', 'schema': [
+            {'uid': 'a-b', 'data_type': 'text'}, {'uid': 'a_b', 'data_type': 'text'},
+            {'uid': 'schema_uid', 'data_type': 'text'}, {'uid': 'to_dict', 'data_type': 'text'}]}})
+        entry = model.from_dict({'a-b': 1, 'a_b': 2, 'schema_uid': 'field', 'to_dict': 'value'})
+        assert (entry.a_b, entry.a_b_, entry.schema_uid_, entry.to_dict_) == (1, 2, 'field', 'value')
+        assert model.schema_uid == 'page'
+        assert entry.to_dict() == {'a-b': 1, 'a_b': 2, 'schema_uid': 'field', 'to_dict': 'value'}
+
+    def test_invalid_schema_raises(self):
+        with pytest.raises(ValueError):
+            generate_model({'error_code': 118})
+
+    def test_content_type_and_global_field_model(self):
+        mock = MagicMock()
+        mock.endpoint = 'https://cdn.contentstack.io/v3'
+        mock.headers = {'environment': 'test_env'}
+        mock.get = MagicMock(return_value=PRODUCT)
+        content_type = ContentType(mock, 'product')
+        product_model = content_type.model(name='Item')
+        assert product_model.__name__ == 'Item'
+        assert 'include_global_field_schema=true' in mock.get.call_args[0][0]
+        content_type.fetch()
+        assert 'include_global_field_schema' not in mock.get.call_args[0][0]
+
+        mock.get.return_value = {'global_field': {'uid': 'seo', 'schema': SEO_SCHEMA}}
+        seo = GlobalField(mock, 'seo').model().from_dict(ENTRY['seo'])
+        assert seo.meta_description == 'A phone'
+        assert not hasattr(seo, 'uid')
@@ -1,9 +1,12 @@
+import json
 import logging
 import unittest
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
 import config
 import contentstack
 from contentstack.basequery import QueryOperation
-from contentstack.query import QueryType
+from contentstack.query import Query, QueryType
 
 API_KEY = config.APIKEY
 DELIVERY_TOKEN = config.DELIVERYTOKEN
@@ -450,3 +453,143 @@ class TestQuery(unittest.TestCase):
         self.assertEqual("price", query.query_params["desc"])
         self.assertEqual("en-us", query.query_params["locale"])
         self.assertEqual("true", query.query_params["include_fallback"])
+
+
+def _keyset_http_instance(entries):
+    """Serves ``entries`` honouring asc, limit and the cursor conditions."""
+    mock = MagicMock()
+    mock.endpoint = 'https://cdn.contentstack.io/v3'
+    mock.headers = {'environment': 'test_env'}
+    mock.live_preview = None
+
+    def _matches(entry, condition):
+        if '$and' in condition:
+            return all(_matches(entry, part) for part in condition['$and'])
+        if '$or' in condition:
+            return any(_matches(entry, part) for part in condition['$or'])
+        for field, value in condition.items():
+            if isinstance(value, dict):
+                if '$gt' in value and not entry[field] > value['$gt']:
+                    return False
+            elif entry.get(field) != value:
+                return False
+        return True
+
+    def _get(url):
+        params = parse_qs(urlparse(url).query)
+        condition = json.loads(params['query'][0]) if 'query' in params else {}
+        keys = params['asc']
+        rows = sorted((e for e in entries if _matches(e, condition)),
+                      key=lambda e: tuple(e.get(key, '') for key in keys))
+        only = params.get('only[BASE][]')
+        if only:
+            rows = [{k: v for k, v in e.items() if k in only} for e in rows]
+        return {'entries': rows[:int(params['limit'][0])]}
+
+    mock.get = MagicMock(side_effect=_get)
+    return mock
+
+
+class TestQueryKeysetPagination(unittest.TestCase):
+
+    def setUp(self):
+        # several entries share an updated_at value across page boundaries
+        self.entries = [{'uid': f'blt{i:03}', 'updated_at': f'2024-01-{i // 3 + 1:02}', 'kind': i % 2}
+                        for i in range(25)]
+
+    def test_01_iter_pages_visits_every_entry_once(self):
+        query = Query(_keyset_http_instance(self.entries), 'product')
+        uids = [entry['uid'] for page in query.iter_pages(page_size=4) for entry in page]
+        self.assertEqual(sorted(e['uid'] for e in self.entries), sorted(uids))
+        self.assertEqual(len(uids), len(set(uids)))
+
+    def test_02_iter_pages_uses_key_and_uid_cursor(self):
+        http_instance = _keyset_http_instance(self.entries)
+        query = Query(http_instance, 'product')
+        pages = list(query.iter_pages(page_size=4))
+        second = parse_qs(urlparse(http_instance.get.call_args_list[1][0][0]).query)
+        last = pages[0][-1]
+        self.assertEqual({'$or': [{'updated_at': {'$gt': last['updated_at']}},
+                                  {'updated_at': last['updated_at'], 'uid': {'$gt': last['uid']}}]},
+                         json.loads(second['query'][0]))
+        self.assertEqual(['updated_at', 'uid'], second['asc'])
+        self.assertNotIn('skip', second)
+
+    def test_03_iter_pages_keeps_existing_conditions_and_restores_params(self):
+        query = Query(_keyset_http_instance(self.entries), 'product')
+        query.where('kind', QueryOperation.EQUALS, fields=1).skip(10).order_by_descending('title')
+        uids = [entry['uid'] for page in query.iter_pages(page_size=3) for entry in page]
+        self.assertEqual(sorted(e['uid'] for e in self.entries if e['kind'] == 1), sorted(uids))
+        self.assertEqual({'kind': 1}, query.parameters)
+        self.assertEqual({'skip': '10', 'desc': 'title'}, query.query_params)
+
+    def test_04_iter_pages_projects_key_and_uid(self):
+        http_instance = _keyset_http_instance(self.entries)
+        query = Query(http_instance, 'product').only('kind')
+        uids = [entry['uid'] for page in query.iter_pages(page_size=4) for entry in page]
+        self.assertEqual(len(self.entries), len(set(uids)))
+        self.assertEqual('kind', query.entry_queryable_param['only[BASE][]'])
+
+    def test_05_iter_pages_raises_without_key_values(self):
+        query = Query(_keyset_http_instance(self.entries), 'product')
+        with self.assertRaisesRegex(KeyError, 'published_at'):
+            list(query.iter_pages(key='published_at', page_size=4))
+
+    def test_06_iter_pages_raises_when_uid_order_is_ignored(self):
+        http_instance = _keyset_http_instance(self.entries)
+        # a server sorting on updated_at alone, ties in reverse uid order
+        http_instance.get.side_effect = lambda url: {'entries': sorted(
+            self.entries, key=lambda e: (e['updated_at'], [-ord(c) for c in e['uid']]))[:4]}
+        query = Query(http_instance, 'product')
+        with self.assertRaisesRegex(ValueError, 'updated_at'):
+            list(query.iter_pages(page_size=4))
+
+
+class TestQueryProjection(unittest.TestCase):
+
+    def setUp(self):
+        self.stack = contentstack.Stack(API_KEY, DELIVERY_TOKEN, ENVIRONMENT, host=HOST)
+        self.query = self.stack.content_type('blog').query()
+
+    def test_01_only_accepts_several_fields(self):
+        self.query.only('title', 'url').only(['url', 'summary'])
+        self.assertEqual(['title', 'url', 'summary'],
+                         self.query.entry_queryable_param['only[BASE][]'])
+
+    def test_02_only_single_field_stays_a_string(self):
+        self.query.only('title')
+        self.assertEqual('title', self.query.entry_queryable_param['only[BASE][]'])
+
+    def test_03_only_and_excepts_on_reference_fields(self):
+        self.query.only('title', reference_field_uid='author') \
+            .excepts('bio', 'avatar', reference_field_uid='author')
+        self.assertEqual('title', self.query.entry_queryable_param['only[author][]'])
+        self.assertEqual(['bio', 'avatar'], self.query.entry_queryable_param['except[author][]'])
+        with self.assertRaises(KeyError):
+            self.query.only('title', reference_field_uid=4)
+
+    def test_04_project_derives_fields_from_template(self):
+        self.query.include_reference('category') \
+            .project(['title', 'url', {'author': ['title', 'avatar']}])
+        params = self.query.entry_queryable_param
+        self.assertEqual(['uid', 'updated_at', 'title', 'url', 'author'], params['only[BASE][]'])
+        self.assertEqual(['uid', 'updated_at', 'title', 'avatar'], params['only[author][]'])
+        self.assertEqual(['category', 'author'], params['include[]'])
+
+    def test_05_project_derives_fields_from_model(self):
+        from contentstack.model_generator import generate_model
+        model = generate_model({'content_type': {'uid': 'blog', 'schema': [
+            {'uid': 'title', 'data_type': 'text'}, {'uid': 'url', 'data_type': 'text'}]}})
+        self.query.project(model)
+        self.assertEqual(['uid', 'updated_at', 'title', 'url'],
+                         self.query.entry_queryable_param['only[BASE][]'])
+
+    def test_06_projection_is_encoded_as_repeated_params(self):
+        http_instance = MagicMock()
+        http_instance.endpoint = 'https://cdn.contentstack.io/v3'
+        http_instance.headers = {'environment': 'test_env'}
+        http_instance.live_preview = None
+        http_instance.get = MagicMock(return_value={'entries': []})
+        Query(http_instance, 'blog').only('title', 'url').find()
+        params = parse_qs(urlparse(http_instance.get.call_args[0][0]).query)
+        self.assertEqual(['title', 'url'], params['only[BASE][]'])
@@ -0,0 +1,79 @@
+"""
+Unit tests for the reverse-reference index in contentstack.reference_graph
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import contentstack
+from contentstack.reference_graph import ReferenceGraph
+
+
+def _ref(uid, content_type_uid='author'):
+    return {'uid': uid, '_content_type_uid': content_type_uid}
+
+
+@pytest.fixture
+def graph():
+    graph = ReferenceGraph()
+    graph.ingest({'entries': [
+        {'uid': 'blog_1', 'author': [_ref('author_1')],
+         'banner': {'uid': 'asset_1', '_version': 1, 'url': 'https://images/a.png'}},
+        {'uid': 'blog_2', 'author': [_ref('author_1'), _ref('author_2')],
+         'body': {'type': 'doc', 'uid': 'rte_node', 'children': []}},
+    ]})
+    graph.ingest({'entry': {'uid': 'home', 'featured': [_ref('blog_2', 'blog')]}})
+    return graph
+
+
+class TestReferenceGraph:
+    def test_referrers_of_entries_and_assets(self, graph):
+        assert graph.referrers('author_1') == {'blog_1', 'blog_2'}
+        assert graph.referrers('author_2') == {'blog_2'}
+        assert graph.referrers('asset_1') == {'blog_1'}
+        assert graph.referrers('rte_node') == set()
+
+    def test_transitive_referrers(self, graph):
+        assert graph.referrers('author_2', transitive=True) == {'blog_2', 'home'}
+
+    def test_readding_an_entry_replaces_its_edges(self, graph):
+        graph.add_entry({'uid': 'blog_2', 'author': [_ref('author_2')]})
+        assert graph.referrers('author_1') == {'blog_1'}
+        assert graph.references('blog_2') == {'author_2'}
+
+    def test_inlined_references_are_indexed(self):
+        graph = ReferenceGraph().ingest({'entry': {
+            'uid': 'blog_1',
+            'author': [{'uid': 'author_1', '_version': 3, 'team': [_ref('team_1', 'team')]}],
+        }})
+        assert graph.referrers('author_1') == {'blog_1'}
+        assert graph.referrers('team_1') == {'author_1'}
+
+    def test_sync_items_are_applied_incrementally(self, graph):
+        graph.ingest({'items': [
+            {'type': 'entry_published', 'data': {'uid': 'blog_3', 'author': [_ref('author_2')]}},
+            {'type': 'entry_deleted', 'data': {'uid': 'blog_2'}},
+            {'type': 'asset_published', 'data': {'uid': 'asset_2'}},
+        ]})
+        assert graph.referrers('author_2') == {'blog_3'}
+        assert graph.referrers('author_1') == {'blog_1'}
+
+
+class TestStackReferrers:
+    def test_responses_are_indexed_when_tracking(self):
+        stack = contentstack.Stack('api_key', 'delivery_token', 'environment',
+                                   track_references=True)
+        response = {'entries': [{'uid': 'blog_1', 'author': [_ref('author_1')]}]}
+        with patch('contentstack.https_connection.get_request', return_value=response):
+            stack.content_type('blog').query().find()
+        assert stack.referrers('author_1') == {'blog_1'}
+
+    def test_responses_are_not_indexed_by_default(self):
+        stack = contentstack.Stack('api_key', 'delivery_token', 'environment')
+        response = {'entries': [{'uid': 'blog_1', 'author': [_ref('author_1')]}]}
+        with patch('contentstack.https_connection.get_request', return_value=response):
+            stack.content_type('blog').query().find()
+        assert stack.referrers('author_1') == set()
+        with pytest.raises(KeyError):
+            stack.referrers(None)
@@ -0,0 +1,99 @@
+"""
+Unit tests for client-side reference resolution in contentstack.reference_resolver
+"""
+
+import json
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from contentstack.entry import Entry
+from contentstack.query import Query
+from contentstack.reference_resolver import ReferenceResolver, is_reference
+
+AUTHORS = {
+    'author_1': {'uid': 'author_1', 'title': 'Ada', 'team': [{'uid': 'team_1', '_content_type_uid': 'team'}]},
+    'author_2': {'uid': 'author_2', 'title': 'Grace', 'team': [{'uid': 'team_1', '_content_type_uid': 'team'}]},
+}
+TEAMS = {'team_1': {'uid': 'team_1', 'title': 'Core'}}
+
+
+def _ref(uid, content_type_uid='author'):
+    return {'uid': uid, '_content_type_uid': content_type_uid}
+
+
+@pytest.fixture
+def mock_http_instance():
+    mock = MagicMock()
+    mock.endpoint = "https://cdn.contentstack.io/v3"
+    mock.headers = {"environment": "test_env"}
+    mock.live_preview = None
+    tables = {'author': AUTHORS, 'team': TEAMS}
+
+    def _get(url):
+        parsed = urlparse(url)
+        params = parse_qs(parsed.query)
+        content_type_uid = parsed.path.split('/')[-2]
+        if content_type_uid == 'blog':
+            return {'entries': [
+                {'uid': 'blog_1', 'author': [_ref('author_1')]},
+                {'uid': 'blog_2', 'author': [_ref('author_1'), _ref('author_2')]},
+                {'uid': 'blog_3', 'author': [_ref('author_2')], 'related': [_ref('blog_1', 'blog')]},
+            ]}
+        uids = json.loads(params['query'][0])['uid']['$in']
+        return {'entries': [json.loads(json.dumps(tables[content_type_uid][uid])) for uid in uids]}
+
+    mock.get = MagicMock(side_effect=_get)
+    return mock
+
+
+class TestReferenceResolver:
+    def test_is_reference_only_matches_stubs(self):
+        assert is_reference(_ref('author_1'))
+        assert not is_reference({'uid': 'author_1', 'title': 'Ada', '_content_type_uid': 'author'})
+        assert not is_reference({'uid': 'node_1', 'type': 'p'})
+
+    def test_find_fetches_each_reference_once_and_shares_it(self, mock_http_instance):
+        query = Query(mock_http_instance, 'blog').include_reference('author')
+        result = query.resolve_references('author').find()
+
+        entries = result['entries']
+        assert entries[0]['author'][0] is entries[1]['author'][0]
+        assert entries[1]['author'][1] is entries[2]['author'][0]
+        assert entries[0]['author'][0]['title'] == 'Ada'
+        # one call for the page, one batched $in call for the authors
+        assert mock_http_instance.get.call_count == 2
+        author_url = mock_http_instance.get.call_args_list[1][0][0]
+        assert sorted(json.loads(parse_qs(urlparse(author_url).query)['query'][0])['uid']['$in']) \
+            == ['author_1', 'author_2']
+        assert 'include[]' not in parse_qs(urlparse(mock_http_instance.get.call_args_list[0][0][0]).query)
+
+    def test_field_uids_limit_the_first_level(self, mock_http_instance):
+        result = Query(mock_http_instance, 'blog').resolve_references('author').find()
+        assert is_reference(result['entries'][2]['related'][0])
+
+    def test_depth_resolves_nested_references(self, mock_http_instance):
+        result = Query(mock_http_instance, 'blog').resolve_references('author', depth=2).find()
+        ada, grace = result['entries'][1]['author']
+        assert ada['team'][0] is grace['team'][0]
+        assert ada['team'][0]['title'] == 'Core'
+        assert mock_http_instance.get.call_count == 3
+
+    def test_entry_fetch_resolves_references(self, mock_http_instance):
+        mock_http_instance.get.side_effect = [
+            {'entry': {'uid': 'blog_1', 'author': [_ref('author_1')]}},
+            {'entries': [dict(AUTHORS['author_1'])]},
+        ]
+        result = Entry(mock_http_instance, 'blog', 'blog_1').resolve_references().fetch()
+        assert result['entry']['author'][0]['title'] == 'Ada'
+
+    def test_resolver_batches_in_queries(self, mock_http_instance):
+        entries = [{'uid': 'blog_1', 'author': [_ref('author_1'), _ref('author_2')]}]
+        ReferenceResolver(mock_http_instance, batch_size=1).resolve(entries)
+        assert mock_http_instance.get.call_count == 2
+        assert entries[0]['author'][1]['title'] == 'Grace'
+
+    def test_invalid_field_uid_raises(self, mock_http_instance):
+        with pytest.raises(KeyError):
+            Query(mock_http_instance, 'blog').resolve_references(4)
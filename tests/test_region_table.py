@@ -0,0 +1,67 @@
+"""
+Unit tests for the compiled region table used by contentstack.endpoint
+"""
+
+import importlib.util
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from contentstack.endpoint import Endpoint
+from contentstack.region_refresh import compile_regions
+from contentstack.stack import ContentstackRegion, Stack
+
+REGIONS = {'regions': [
+    {'id': 'na', 'alias': ['na', 'US', 'aws-na', 'aws_na'],
+     'endpoints': {'contentDelivery': 'https://cdn.contentstack.io'}},
+    {'id': 'eu', 'alias': ['eu', 'aws-eu', 'na'],
+     'endpoints': {'contentDelivery': 'https://eu-cdn.contentstack.com'}},
+]}
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    Endpoint.reset_cache()
+    yield
+    Endpoint.reset_cache()
+
+
+def test_compiled_module_indexes_ids_and_aliases(tmp_path):
+    src = tmp_path / 'regions.json'
+    src.write_text(json.dumps(REGIONS), encoding='utf-8')
+    dest = compile_regions(str(src), str(tmp_path / '_regions.py'), silent=True)
+    spec = importlib.util.spec_from_file_location('compiled_regions', dest)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert set(module.BY_ID) == {'na', 'eu'}
+    assert module.BY_ALIAS['us'] == 'na'
+    assert module.BY_ALIAS['na'] == 'na'
+
+    with patch.dict(sys.modules, {'contentstack._regions': module}), \
+            patch('builtins.open', side_effect=AssertionError('regions.json read')):
+        assert Endpoint.get_contentstack_endpoint('AWS_NA', 'contentDelivery') == 'https://cdn.contentstack.io'
+        assert Endpoint.get_contentstack_endpoint('aws-eu', 'contentDelivery', omit_https=True) == \
+            'eu-cdn.contentstack.com'
+        with pytest.raises(ValueError):
+            Endpoint.get_contentstack_endpoint('mars')
+
+
+def test_bundled_snapshot_resolves_regions_offline():
+    with patch.dict(sys.modules, {'contentstack._regions': None}), \
+            patch('urllib.request.urlopen', side_effect=AssertionError('network')), \
+            patch('requests.get', side_effect=AssertionError('network')):
+        stack = Stack('api_key', 'delivery_token', 'environment', region=ContentstackRegion.EU)
+    assert stack.host == 'eu-cdn.contentstack.com'
+
+
+def test_missing_region_data_fails_loudly():
+    with patch.dict(sys.modules, {'contentstack._regions': None}), \
+            patch('contentstack.endpoint.os.path.exists', return_value=False), \
+            patch('urllib.request.urlopen', side_effect=AssertionError('network')), \
+            patch('requests.get', side_effect=AssertionError('network')):
+        with pytest.raises(RuntimeError):
+            Endpoint.get_contentstack_endpoint('eu')
+        with pytest.raises(RuntimeError):
+            Stack('api_key', 'delivery_token', 'environment', region=ContentstackRegion.EU)
@@ -0,0 +1,103 @@
+"""
+Unit tests for the schema cache in contentstack.schema_registry
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from contentstack.controller import RequestError
+from contentstack.schema_registry import SchemaRegistry
+
+GLOBAL_FIELDS = [
+    {'uid': 'seo', '_version': 1, 'schema': [{'uid': 'title', 'data_type': 'text'},
+                                              {'uid': 'social', 'data_type': 'global_field',
+                                               'reference_to': 'social'}]},
+    {'uid': 'social', '_version': 1, 'schema': [{'uid': 'handle', 'data_type': 'text'}]},
+]
+CONTENT_TYPES = [
+    {'uid': 'page', '_version': 3, 'schema': [
+        {'uid': 'seo', 'data_type': 'global_field', 'reference_to': 'seo'},
+        {'uid': 'sections', 'data_type': 'blocks', 'blocks': [
+            {'uid': 'share', 'reference_to': 'social'},
+            {'uid': 'text', 'schema': [{'uid': 'body', 'data_type': 'text'}]},
+        ]},
+    ]},
+    {'uid': 'author', '_version': 1, 'schema': [{'uid': 'name', 'data_type': 'text'}]},
+]
+
+
+@pytest.fixture
+def mock_http_instance():
+    mock = MagicMock()
+    mock.endpoint = 'https://cdn.contentstack.io/v3'
+    mock.headers = {'environment': 'development'}
+    mock.responses = {'global_fields': GLOBAL_FIELDS, 'content_types': CONTENT_TYPES}
+
+    def get(url):
+        resource = url.split('/v3/')[1].split('?')[0]
+        return {resource: mock.responses[resource]}
+
+    mock.get = MagicMock(side_effect=get)
+    return mock
+
+
+class TestSchemaRegistry:
+    def test_global_fields_are_inlined_once(self, mock_http_instance):
+        registry = SchemaRegistry(mock_http_instance)
+        page = registry.content_type('page')
+        seo = page['schema'][0]['schema']
+        assert seo[1]['schema'] == [{'uid': 'handle', 'data_type': 'text'}]
+        assert page['schema'][1]['blocks'][0]['schema'] == [{'uid': 'handle', 'data_type': 'text'}]
+        assert 'schema' not in CONTENT_TYPES[0]['schema'][0]
+        registry.content_type('author')
+        registry.global_field('social')
+        assert mock_http_instance.get.call_count == 2
+        with pytest.raises(KeyError):
+            registry.content_type('missing')
+
+    def test_ttl_expiry_reloads(self, mock_http_instance):
+        registry = SchemaRegistry(mock_http_instance, ttl=0)
+        registry.content_type('page')
+        registry.content_type('page')
+        assert mock_http_instance.get.call_count == 4
+
+    def test_refresh_reports_changes_through_nested_global_fields(self, mock_http_instance):
+        registry = SchemaRegistry(mock_http_instance)
+        author = registry.content_type('author')
+        page = registry.content_type('page')
+        assert registry.refresh() == set()
+        mock_http_instance.responses['global_fields'] = [
+            GLOBAL_FIELDS[0],
+            {'uid': 'social', '_version': 2, 'schema': [{'uid': 'url', 'data_type': 'link'}]},
+        ]
+        assert registry.refresh() == {'social', 'seo'}
+        assert registry.content_type('author') is author
+        assert registry.content_type('page') is not page
+        assert registry.content_type('page')['schema'][0]['schema'][1]['schema'][0]['uid'] == 'url'
+
+    def test_sync_content_type_items_invalidate(self, mock_http_instance):
+        registry = SchemaRegistry(mock_http_instance)
+        registry.content_types()
+        assert not registry.observe_sync({'items': [{'type': 'entry_published', 'content_type_uid': 'page'}]})
+        assert registry.observe_sync({'items': [{'type': 'entry_published', 'content_type_uid': 'blog'}]})
+        registry.content_types()
+        assert registry.observe_sync({'items': [{'type': 'content_type_deleted', 'data': {'uid': 'page'}}]})
+        registry.content_types()
+        assert mock_http_instance.get.call_count == 6
+
+    def test_error_responses_keep_the_previous_snapshot(self, mock_http_instance):
+        registry = SchemaRegistry(mock_http_instance, ttl=0)
+        page = registry.content_type('page')
+        mock_http_instance.get.side_effect = lambda url: {'error_code': 412, 'error_message': 'invalid'}
+        with pytest.raises(RequestError):
+            registry.refresh()
+        assert registry.content_type('page') is page
+        with pytest.raises(RequestError):
+            SchemaRegistry(mock_http_instance).content_types()
+
+    def test_environment_is_url_encoded(self, mock_http_instance):
+        mock_http_instance.headers = {'environment': 'dev & qa'}
+        SchemaRegistry(mock_http_instance).content_types()
+        assert mock_http_instance.get.call_args.args[0] == \
+            'https://cdn.contentstack.io/v3/content_types?environment=dev+%26+qa&skip=0&limit=100'
@@ -416,4 +416,31 @@ class TestStack(unittest.TestCase):
         stack = contentstack.Stack(
             API_KEY, DELIVERY_TOKEN, ENVIRONMENT, host=HOST, region=ContentstackRegion.AZURE_NA)
         self.assertEqual(ContentstackRegion.AZURE_NA, stack.region)
-        self.assertEqual('azure-na', stack.region.value)
\ No newline at end of file
+        self.assertEqual('azure-na', stack.region.value)
+
+    def test_49_default_retry_strategy(self):
+        """Test the default retry_strategy is populated and used by the session"""
+        stack = contentstack.Stack(API_KEY, DELIVERY_TOKEN, ENVIRONMENT, host=HOST)
+        self.assertEqual(5, stack.retry_strategy.total)
+        self.assertEqual([408, 429], stack.retry_strategy.status_forcelist)
+        adapter = stack.http_instance.session.get_adapter('https://')
+        self.assertIs(stack.retry_strategy, adapter.max_retries)
+
+    def test_50_retry_strategy_set_after_a_request(self):
+        """Test a retry_strategy set after the session exists is mounted"""
+        stack = contentstack.Stack(API_KEY, DELIVERY_TOKEN, ENVIRONMENT, host=HOST)
+        session = stack.http_instance.session  # created by the first request
+        stack.retry_strategy = Retry(total=0)
+        adapter = session.get_adapter('https://')
+        self.assertIs(stack.retry_strategy, adapter.max_retries)
+        self.assertEqual(0, adapter.max_retries.total)
+
+    def test_51_custom_session(self):
+        """Test a custom session can be set and gets the retry strategy"""
+        import requests
+        stack = contentstack.Stack(API_KEY, DELIVERY_TOKEN, ENVIRONMENT, host=HOST)
+        session = requests.Session()
+        session.proxies = {'https': 'http://proxy.example.com:3128'}
+        stack.http_instance.session = session
+        self.assertIs(session, stack.http_instance.session)
+        self.assertIs(stack.retry_strategy, session.get_adapter('https://').max_retries)
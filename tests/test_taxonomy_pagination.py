@@ -0,0 +1,74 @@
+"""
+Unit tests for Taxonomy.iter_entries() and Taxonomy.find_all()
+"""
+
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from contentstack.taxonomy import Taxonomy
+
+ENTRIES = [{'uid': f'blt{i}'} for i in range(230)]
+
+
+@pytest.fixture
+def mock_http_instance():
+    def get(url):
+        query = parse_qs(urlparse(url).query)
+        skip, limit = int(query['skip'][0]), int(query['limit'][0])
+        response = {'entries': ENTRIES[skip:skip + limit]}
+        if 'include_count' in query:
+            response['count'] = len(ENTRIES)
+        return response
+
+    mock = MagicMock()
+    mock.endpoint = 'https://cdn.contentstack.io/v3'
+    mock.headers = {'environment': 'development'}
+    mock.get = MagicMock(side_effect=get)
+    return mock
+
+
+def _queries(mock_http_instance):
+    return [parse_qs(urlparse(call.args[0]).query) for call in mock_http_instance.get.call_args_list]
+
+
+class TestTaxonomyPagination:
+    def test_iter_entries_is_lazy(self, mock_http_instance):
+        entries = Taxonomy(mock_http_instance).in_('taxonomies.color', ['blue']).iter_entries()
+        assert next(entries)['uid'] == 'blt0'
+        assert mock_http_instance.get.call_count == 1
+        assert len(list(entries)) == len(ENTRIES) - 1
+        queries = _queries(mock_http_instance)
+        assert [query['skip'][0] for query in queries] == ['0', '100', '200']
+        assert queries[0]['query'] == ['{"taxonomies.color": {"$in": ["blue"]}}']
+
+    def test_query_is_encoded_once(self, mock_http_instance):
+        taxonomy = Taxonomy(mock_http_instance).exists('taxonomies.color')
+        with patch('contentstack.taxonomy.json.dumps', wraps=__import__('json').dumps) as dumps:
+            list(taxonomy.iter_entries(page_size=50, params={'locale': 'fr-fr'}))
+        assert dumps.call_count == 1
+        assert all(query['locale'] == ['fr-fr'] for query in _queries(mock_http_instance))
+
+    def test_find_all_fetches_pages_in_parallel(self, mock_http_instance):
+        result = Taxonomy(mock_http_instance).in_('taxonomies.color', ['blue']).find_all(concurrency=4,
+                                                                                        page_size=40)
+        assert [entry['uid'] for entry in result['entries']] == [entry['uid'] for entry in ENTRIES]
+        assert result['count'] == len(ENTRIES)
+        queries = _queries(mock_http_instance)
+        assert 'include_count' in queries[0]
+        assert len(queries) == 6
+
+    def test_find_all_reports_the_server_count(self, mock_http_instance):
+        get = mock_http_instance.get.side_effect
+
+        def get_with_total(url):
+            response = get(url)
+            if 'count' in response:
+                response['count'] = 1000  # e.g. entries unpublished while paging
+            return response
+
+        mock_http_instance.get.side_effect = get_with_total
+        result = Taxonomy(mock_http_instance).exists('taxonomies.color').find_all(concurrency=1)
+        assert result['count'] == 1000
+        assert len(result['entries']) == len(ENTRIES)
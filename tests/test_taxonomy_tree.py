@@ -0,0 +1,80 @@
+"""
+Unit tests for local hierarchy resolution in contentstack.taxonomy_tree
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from contentstack.controller import RequestError
+from contentstack.taxonomy import Taxonomy
+from contentstack.taxonomy_tree import TaxonomyTree
+
+TERMS = [
+    {'uid': 'color', 'parent_uid': None},
+    {'uid': 'blue', 'parent_uid': 'color'},
+    {'uid': 'navy', 'parent_uid': 'blue'},
+    {'uid': 'midnight', 'parent_uid': 'navy'},
+    {'uid': 'red', 'parent_uid': 'color'},
+]
+
+
+@pytest.fixture
+def mock_http_instance():
+    mock = MagicMock()
+    mock.endpoint = 'https://cdn.contentstack.io/v3'
+    mock.headers = {'environment': 'development'}
+    mock.get = MagicMock(side_effect=[{'terms': TERMS[:3]}, {'terms': TERMS[3:]}])
+    return mock
+
+
+class TestTaxonomyTree:
+    def test_load_pages_through_terms(self, mock_http_instance):
+        tree = TaxonomyTree(mock_http_instance, 'colors').load(page_size=3)
+        assert len(tree) == 5
+        urls = [call.args[0] for call in mock_http_instance.get.call_args_list]
+        assert urls[1] == 'https://cdn.contentstack.io/v3/taxonomies/colors/terms' \
+                          '?environment=development&skip=3&limit=3'
+
+    def test_load_without_environment(self, mock_http_instance):
+        mock_http_instance.headers = {}
+        TaxonomyTree(mock_http_instance, 'colors').load(page_size=3)
+        assert mock_http_instance.get.call_args_list[0].args[0] == \
+            'https://cdn.contentstack.io/v3/taxonomies/colors/terms?skip=0&limit=3'
+
+    def test_ancestors_and_descendants(self):
+        tree = TaxonomyTree(MagicMock(), 'colors', TERMS)
+        assert tree.ancestors('midnight') == ['navy', 'blue', 'color']
+        assert tree.ancestors('midnight', levels=1) == ['navy']
+        assert tree.descendants('color') == ['blue', 'red', 'navy', 'midnight']
+        assert tree.descendants('color', levels=1) == ['blue', 'red']
+        assert tree.is_below('midnight', 'blue')
+        assert not tree.is_below('red', 'blue')
+        assert tree.expand('$eq_below', 'blue') == ['blue', 'navy', 'midnight']
+        assert tree.expand('$above', 'navy') == ['blue', 'color']
+
+    def test_updates_reindex_the_hierarchy(self):
+        tree = TaxonomyTree(MagicMock(), 'colors', TERMS)
+        assert tree.expand('$below', 'red') == []
+        tree.update([{'uid': 'navy', 'parent_uid': 'red'}])
+        assert tree.expand('$below', 'red') == ['navy', 'midnight']
+        tree.remove('navy')
+        assert 'midnight' not in tree
+        assert tree.descendants('color') == ['blue', 'red']
+
+    def test_taxonomy_expands_loaded_trees(self, mock_http_instance):
+        trees = {'colors': TaxonomyTree(mock_http_instance, 'colors', TERMS)}
+        taxonomy = Taxonomy(mock_http_instance, trees)
+        taxonomy.below('taxonomies.colors', 'blue').equal_and_above('taxonomies.sizes', 'xl', levels=2)
+        assert taxonomy._filters == {
+            'taxonomies.colors': {'$in': ['navy', 'midnight']},
+            'taxonomies.sizes': {'$eq_above': 'xl', 'levels': 2},
+        }
+
+    def test_error_response_leaves_the_tree_unchanged(self, mock_http_instance):
+        tree = TaxonomyTree(mock_http_instance, 'colors').load(page_size=3)
+        mock_http_instance.get = MagicMock(return_value={'error_code': 141, 'error_message': 'not found'})
+        with pytest.raises(RequestError):
+            tree.load(page_size=3)
+        assert len(tree) == 5
+        assert tree.ancestors('midnight') == ['navy', 'blue', 'color']
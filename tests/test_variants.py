@@ -2,10 +2,14 @@
 Unit tests for Variants branch support in contentstack.variants
 """
 
+import json
+
 import pytest
 from unittest.mock import MagicMock
-from urllib.parse import urlencode
+from urllib.parse import parse_qs, urlencode, urlparse
 
+from contentstack.contenttype import ContentType
+from contentstack.controller import RequestError
 from contentstack.variants import Variants
 
 
@@ -197,3 +201,44 @@ class TestVariantsBranch:
         variants = content_type.variants("variant_uid")
         with pytest.raises(ValueError):
             variants.fetch()
+
+
+class TestVariantsFetchMany:
+    @staticmethod
+    def _get(url, headers=None):
+        query = json.loads(parse_qs(urlparse(url).query)['query'][0])
+        variant = headers['x-cs-variant-uid']
+        if variant == 'broken':
+            raise RequestError({'error': 'Connection failed', 'error_code': '400'})
+        return {'entries': [{'uid': uid, 'variant': variant}
+                            for uid in query['uid']['$in'] if uid != 'missing']}
+
+    def test_fetch_many_maps_entries_to_variants(self, mock_http_instance):
+        mock_http_instance.get.side_effect = self._get
+        variants = ContentType(mock_http_instance, "faq").variants("variant_1", branch="dev")
+        result = variants.fetch_many(["e1", "e2", "e3", "missing"],
+                                     variant_uids=["variant_1", ["variant_1", "variant_2"]],
+                                     batch_size=2)
+        assert result["e1"]["variant_1"] == {"uid": "e1", "variant": "variant_1"}
+        assert result["e3"]["variant_1,variant_2"]["variant"] == "variant_1,variant_2"
+        assert result["missing"]["variant_1"]["error_code"] == 141
+        assert mock_http_instance.get.call_count == 4
+        assert all(call.kwargs["headers"]["branch"] == "dev"
+                   for call in mock_http_instance.get.call_args_list)
+        assert "x-cs-variant-uid" not in mock_http_instance.headers
+
+    def test_fetch_many_reports_failed_batches_per_item(self, mock_http_instance):
+        mock_http_instance.get.side_effect = self._get
+        variants = ContentType(mock_http_instance, "faq").variants("variant_1")
+        result = variants.fetch_many(["e1", "e2"], variant_uids=["variant_1", "broken"])
+        assert result["e2"]["variant_1"]["uid"] == "e2"
+        assert result["e2"]["broken"] == {"error_code": "400", "error_message": "Connection failed"}
+        with pytest.raises(ValueError):
+            variants.fetch_many([])
+
+    def test_fetch_many_validates_variant_uids(self, mock_http_instance):
+        variants = ContentType(mock_http_instance, "faq").variants(None)
+        for variant_uids in (None, [], [None], [["variant_1", None]], [""]):
+            with pytest.raises(ValueError, match="Missing variant UID"):
+                variants.fetch_many(["e1"], variant_uids=variant_uids)
+        mock_http_instance.get.assert_not_called()